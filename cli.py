@@ -1,7 +1,10 @@
 import sys
 
+from src.benchmarks.persistence import BenchPersistenceCommand as _
+from src.engine.replay import ReplayCommand as _
 from src.utils.cli import commands
 from src.utils.proc_gen.commands.generate_hashes import Command as _
+from src.utils.profiling import ProfileDumpCommand as _
 from src.utils.sprites.commands.archive_assets import Command as _
 from src.utils.sprites.commands.archive_assets import GetAssetsCommand as _
 
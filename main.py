@@ -1,4 +1,5 @@
 import sys
+from pathlib import Path
 
 import arcade
 
@@ -7,10 +8,13 @@ from src import config
 from src.gui.title import TitleView
 from src.gui.window_data import WindowData
 from src.utils.proc_gen import constraints
+from src.utils.profiling import start_sampling_if_enabled
 
 
 def start_adventure_league():
     """Startup"""
+    start_sampling_if_enabled()
+
     window = arcade.Window(
         WindowData.width,
         WindowData.height,
@@ -29,6 +33,25 @@ def start_adventure_league():
     arcade.run()
 
 
+def start_replay(recording_path: Path, speed: float):
+    """Watch a recorded combat, sped up or slowed down by the given factor"""
+    from src.engine.init_engine import eng
+    from src.engine.replay import CombatReplayer, Recording
+    from src.gui.combat.view import CombatView
+
+    window = arcade.Window(
+        WindowData.width,
+        WindowData.height,
+        "Adventure League! (replay)",
+        resizable=True,
+        fullscreen=False,
+    )
+
+    CombatReplayer(Recording.load(recording_path)).attach(eng, speed=speed)
+    window.show_view(CombatView(parent_factory=lambda: TitleView(window=window)))
+    arcade.run()
+
+
 if len(sys.argv) > 2 and sys.argv[1] == "-m":
     match sys.argv[2]:
         case "S":
@@ -40,5 +63,10 @@ if len(sys.argv) > 2 and sys.argv[1] == "-m":
             config.DEBUG = True
             start_adventure_league()
 
+        case "R":
+            start_replay(
+                Path(sys.argv[3]), float(sys.argv[4]) if len(sys.argv) > 4 else 1
+            )
+
 else:
     start_adventure_league()
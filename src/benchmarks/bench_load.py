@@ -5,14 +5,22 @@ from src import config
 from src.engine.persistence.game_state_repository import GuildRepository
 from src.utils.profiling import profile_call
 
-config.SAVE_FILE_DIRECTORY = Path("src") / "tests" / "benchmarks" / "fixtures"
+FIXTURES_DIRECTORY = Path("src") / "benchmarks" / "fixtures"
 
 
 class BenchmarkLoadTest(TestCase):
+    def setUp(self):
+        self._save_file_directory = config.SAVE_FILE_DIRECTORY
+        config.SAVE_FILE_DIRECTORY = FIXTURES_DIRECTORY
+
+    def tearDown(self):
+        config.SAVE_FILE_DIRECTORY = self._save_file_directory
+
     def test_multiple_loads(self):
         self.load_many_saves()
         assert True
 
+    @staticmethod
     @profile_call
     def load_many_saves(count=10):
         for _ in range(count):
@@ -0,0 +1,220 @@
+"""
+Save and load benchmarks for generated guilds of increasing size.
+
+Each run measures, per format and guild size, the best of a few timed saves and loads,
+the size of the save file, and the peak memory allocated by python across one save and
+load. Results are written as JSON and can be compared against a stored baseline so that
+changes to persistence can be judged on numbers. Only file sizes and memory are compared,
+since timings vary too much from one machine to the next to hold a run to.
+"""
+
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+from os import path
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from src.engine.guild import Guild
+from src.engine.persistence.dumpers import GameStateDumpers
+from src.engine.persistence.game_state_repository import Format
+from src.engine.persistence.loaders import GameStateLoaders
+from src.utils.cli import CommandMeta
+
+GUILD_SIZES = (10, 100, 1000)
+RESULTS_PATH = Path("profiles") / "benchmarks" / "persistence.json"
+BASELINE_PATH = Path("src") / "benchmarks" / "fixtures" / "persistence_baseline.json"
+
+# How far each compared metric may exceed its baseline, as a fraction of the baseline,
+# before it counts as a regression
+TOLERANCES = {
+    "file_bytes": 0.05,
+    "peak_memory_bytes": 0.25,
+}
+
+
+class Measurement(NamedTuple):
+    save_seconds: float
+    load_seconds: float
+    file_bytes: int
+    peak_memory_bytes: int
+
+
+def make_guild(members: int, seed: int = 0) -> Guild:
+    """
+    A guild with the given number of members spread across the fighter fixtures, with
+    a copy of every member's gear in the armory so that storage is exercised too.
+    """
+    # Only needed to generate guilds, so kept out of the CLI until a benchmark runs
+    from src.tests.fixtures import EntityFactory, FighterFixtures
+
+    fixtures = (
+        FighterFixtures.strong,
+        FighterFixtures.gandalf,
+        FighterFixtures.legolas,
+    )
+
+    # Seed for repeatable guilds, without disturbing the random state of the caller
+    state = random.getstate()
+    random.seed(seed)
+    guild = Guild(name="BENCHMARK GUILD", xp=4000, funds=100, roster=[])
+    try:
+        for i in range(members):
+            guild.roster.extend(EntityFactory.from_fixture(fixtures[i % len(fixtures)]))
+    finally:
+        random.setstate(state)
+
+    for entity in guild.roster[:2]:
+        guild.team.assign_to_team(entity)
+
+    for entity in (*guild.roster, *guild.team.members):
+        guild.armory.store_all(entity.fighter.gear.as_list())
+
+    return guild
+
+
+def _save(guild: Guild, fmt: Format, file_path: str):
+    fmt.dump(GameStateDumpers.guild_to_dict(guild), file_path)
+
+
+def _load(fmt: Format, file_path: str) -> Guild:
+    return GameStateLoaders.guild_from_dict(fmt.load(file_path))
+
+
+def measure(guild: Guild, fmt: Format, repeats: int = 3) -> Measurement:
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = path.join(directory, f"benchmark.{fmt.value}")
+
+        save_times, load_times = [], []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            _save(guild, fmt, file_path)
+            save_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            _load(fmt, file_path)
+            load_times.append(time.perf_counter() - start)
+
+        file_bytes = path.getsize(file_path)
+
+        # tracemalloc slows everything down, so memory is measured in a separate pass
+        tracemalloc.start()
+        try:
+            _save(guild, fmt, file_path)
+            _load(fmt, file_path)
+            _, peak_memory_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return Measurement(
+        save_seconds=min(save_times),
+        load_seconds=min(load_times),
+        file_bytes=file_bytes,
+        peak_memory_bytes=peak_memory_bytes,
+    )
+
+
+def run(
+    sizes: Iterable[int] = GUILD_SIZES,
+    fmts: Iterable[Format] = tuple(Format),
+    repeats: int = 3,
+) -> dict[str, dict]:
+    """
+    Returns:
+        dict[str, dict]: measurements keyed by "{format}/{guild size}".
+    """
+    fmts = tuple(fmts)
+    results = {}
+    for size in sizes:
+        guild = make_guild(size)
+        for fmt in fmts:
+            results[f"{fmt.value}/{size}"] = measure(guild, fmt, repeats)._asdict()
+
+    return results
+
+
+def baseline_of(results: dict[str, dict]) -> dict[str, dict]:
+    """
+    Just the metrics that are compared against a baseline.
+    """
+    return {
+        key: {metric: measurement[metric] for metric in TOLERANCES}
+        for key, measurement in results.items()
+    }
+
+
+def write_results(results: dict[str, dict], file_path: Path = RESULTS_PATH):
+    if not path.exists(file_path.parent):
+        file_path.parent.mkdir(parents=True)
+
+    with open(file_path, "w") as results_file:
+        json.dump(results, results_file, indent=2, sort_keys=True)
+
+
+def read_results(file_path: Path = BASELINE_PATH) -> dict[str, dict]:
+    with open(file_path, "r") as results_file:
+        return json.load(results_file)
+
+
+def regressions(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    tolerances: dict[str, float] = TOLERANCES,
+) -> list[str]:
+    """
+    Compares each metric present in both the results and the baseline.
+
+    Returns:
+        list[str]: a description of every metric that exceeded its tolerance.
+    """
+    failures = []
+    for key, measurement in results.items():
+        for metric, tolerance in tolerances.items():
+            expected = baseline.get(key, {}).get(metric)
+            if expected is None:
+                continue
+
+            limit = expected * (1 + tolerance)
+            if measurement[metric] > limit:
+                failures.append(
+                    f"{key} {metric}: {measurement[metric]} exceeds baseline {expected} "
+                    f"by more than {tolerance:.0%}"
+                )
+
+    return failures
+
+
+class BenchPersistenceCommand(metaclass=CommandMeta):
+    name = "bench_persistence"
+
+    @staticmethod
+    def run(*args):
+        """
+        Usage: python cli.py bench_persistence [--update-baseline] [sizes...]
+
+        Benchmarks every format for each guild size, writes the results and exits with an
+        error if anything regressed past the baseline. With --update-baseline the results
+        replace the stored baseline instead.
+        """
+        args = [*args[1:]]
+        update_baseline = "--update-baseline" in args
+        sizes = [int(arg) for arg in args if arg.isdigit()] or GUILD_SIZES
+
+        results = run(sizes)
+        write_results(results)
+        print(f"Benchmark results written to {RESULTS_PATH}")
+
+        if update_baseline:
+            write_results(baseline_of(results), BASELINE_PATH)
+            print(f"Baseline updated at {BASELINE_PATH}")
+            return
+
+        failures = regressions(results, read_results(BASELINE_PATH))
+        if failures:
+            raise SystemExit(
+                "Persistence benchmarks regressed:\n" + "\n".join(failures)
+            )
+
+        print("No regressions against the baseline.")
@@ -1,19 +1,22 @@
-import pstats
-from datetime import datetime
-from pathlib import Path
 from unittest import TestCase
 
 from viztracer import VizTracer
 
 from src import config
+from src.benchmarks.bench_load import FIXTURES_DIRECTORY
 from src.engine.persistence.game_state_repository import GuildRepository
 
-config.SAVE_FILE_DIRECTORY = Path("src") / "tests" / "benchmarks" / "fixtures"
-
 
 class BenchmarkLoadTest(TestCase):
+    def setUp(self):
+        self._save_file_directory = config.SAVE_FILE_DIRECTORY
+        config.SAVE_FILE_DIRECTORY = FIXTURES_DIRECTORY
+
+    def tearDown(self):
+        config.SAVE_FILE_DIRECTORY = self._save_file_directory
+
     def test_load(self):
         with VizTracer(output_file="profiles/test_load_profile.json"):
-            GuildRepository.load(slot=0, testing=True)
+            guild = GuildRepository.load(slot=0)
 
-        assert True
+        assert guild.roster, "The benchmark fixture was loaded with an empty roster"
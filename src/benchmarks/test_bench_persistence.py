@@ -0,0 +1,70 @@
+from unittest import TestCase
+
+from src.benchmarks.persistence import (TOLERANCES, Measurement, baseline_of,
+                                        regressions, run)
+from src.engine.persistence.game_state_repository import Format
+
+
+class BenchmarkPersistenceTest(TestCase):
+    def test_every_format_and_size_is_measured(self):
+        # Arrange
+        sizes = (1, 3)
+
+        # Action
+        results = run(sizes, repeats=1)
+
+        # Assert
+        for size in sizes:
+            for fmt in Format:
+                key = f"{fmt.value}/{size}"
+                assert key in results, f"Missing {key=} in results: {results.keys()}"
+                assert all(
+                    results[key][metric] > 0 for metric in Measurement._fields
+                ), f"Expected every metric to be measured for {key=}, got {results[key]}"
+
+    def test_only_metrics_past_their_tolerance_are_regressions(self):
+        # Arrange
+        baseline = {
+            "pikl/10": {
+                "save_seconds": 1.0,
+                "load_seconds": 1.0,
+                "file_bytes": 1000,
+                "peak_memory_bytes": 1000,
+            }
+        }
+        results = {
+            "pikl/10": {
+                "save_seconds": 100.0,
+                "load_seconds": 100.0,
+                "file_bytes": 1000 * (1 + TOLERANCES["file_bytes"] / 2),
+                "peak_memory_bytes": 1000 * (1 + TOLERANCES["peak_memory_bytes"] * 2),
+            },
+            "pikl/100": {
+                "save_seconds": 100.0,
+                "load_seconds": 100.0,
+                "file_bytes": 100000,
+                "peak_memory_bytes": 100000,
+            },
+        }
+
+        # Action
+        failures = regressions(results, baseline)
+
+        # Assert
+        assert len(failures) == 1, f"Expected exactly one regression, got {failures}"
+        assert failures[0].startswith(
+            "pikl/10 peak_memory_bytes"
+        ), f"Expected peak_memory_bytes to regress, got {failures[0]}"
+
+    def test_timings_are_left_out_of_the_baseline(self):
+        # Arrange
+        results = run((1,), fmts=(Format.PICKLE,), repeats=1)
+
+        # Action
+        baseline = baseline_of(results)
+
+        # Assert
+        assert baseline["pikl/1"].keys() == TOLERANCES.keys(), (
+            f"Expected only the compared metrics in the baseline, "
+            f"got {baseline['pikl/1'].keys()}"
+        )
@@ -4,5 +4,18 @@ from pathlib import Path
 _env = lambda type_, key, default: type_(os.getenv(key, default))
 
 DEBUG = _env(bool, "DEBUG", False)
+HEADLESS = _env(bool, "HEADLESS", False)
+PROFILING = _env(bool, "PROFILING", False)
+PROFILE_SAMPLING = _env(bool, "PROFILE_SAMPLING", False)
+PROFILE_SAMPLE_INTERVAL_MS = _env(float, "PROFILE_SAMPLE_INTERVAL_MS", 5)
+MESSAGE_LOG_SIZE = _env(int, "MESSAGE_LOG_SIZE", 100)
+SCHEDULER_BUDGET_MS = _env(float, "SCHEDULER_BUDGET_MS", 4)
+RECORD_COMBAT = _env(bool, "RECORD_COMBAT", False)
+ENEMY_AI = _env(str, "ENEMY_AI", "basic")
+AI_TIME_BUDGET_MS = _env(float, "AI_TIME_BUDGET_MS", 5)
+BOSS_AI = _env(str, "BOSS_AI", "mcts")
+MCTS_ITERATIONS = _env(int, "MCTS_ITERATIONS", 200)
+MCTS_PROCESSES = _env(int, "MCTS_PROCESSES", 0)
 SAVE_FILE_DIRECTORY = Path("./saves")
+REPLAY_DIRECTORY = Path("./replays")
 TEST_FILE_DIRECTORY = Path("./src/tests/engine/persistence")
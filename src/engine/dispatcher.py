@@ -5,19 +5,35 @@ if TYPE_CHECKING:
     from src.engine.engine import Engine
 
 from src import config
+from src.engine.events import Envelope, TypedEvent
 
 Handler = Callable[[dict], None]
 HandlerRef = Callable[[], Handler]
 
 
 class Dispatcher:
+    """
+    Routes each published event to the handlers subscribed to any of its topics.
+
+    Topics are either legacy dict keys, or TypedEvent classes. An Envelope is routed by
+    the class of each of its events, and its legacy dict view is only built when one of
+    its legacy keys actually has subscribers.
+
+    Subscriptions are compiled into a tuple of handler refs per topic whenever they change,
+    so publishing never rebuilds any state and topics without subscribers cost a single
+    dict lookup. Handlers held by weakref are pruned by a finalizer on their owner as soon
+    as it is garbage collected, rather than being checked for on every publish.
+    """
+
     def __init__(self, engine: "Engine") -> None:
         self.subscriptions: dict[str, dict[str, HandlerRef]] = {}
+        self._handlers: dict[str, tuple[HandlerRef, ...]] = {}
+        self._finalizers: list[weakref.finalize] = []
         self.eng = engine
 
     def subscribe(
         self,
-        topic: str,
+        topic: "str | type[TypedEvent]",
         handler_id: str,
         handler: "Handler",
         is_method=True,
@@ -30,52 +46,98 @@ class Dispatcher:
             raise TypeError(f"A non-callable {type(handler)=} was passed to subscribe")
 
         # check the subscription is a new one
-        subs = {}
-        if topic in self.subscriptions and handler_id in (
-            subs := self.subscriptions[topic]
-        ):
-            ref = self.subscriptions[topic][handler_id]
+        subs = self.subscriptions.get(topic, {})
+        if handler_id in subs:
             # ignore sub if the topic is already subscribed by that handler
-            if ref() is not None:
+            if subs[handler_id]() is not None:
                 return
 
         # IMPORTANT: we use a weakref to make sure we don't retain subscriptions
         # from components that would otherwise be garbage collected.
         if is_method and not keep_ref:
             handler_ref = weakref.WeakMethod(handler)
+            finalizer = weakref.finalize(
+                handler.__self__, self._prune, topic, handler_id, handler_ref
+            )
+            # Nothing to prune when the interpreter is shutting down
+            finalizer.atexit = False
+            self._finalizers.append(finalizer)
         else:
             handler_ref = lambda: handler
+
         self.subscriptions[topic] = {**subs, handler_id: handler_ref}
+        self._compile(topic)
 
-    def publish(self, event: dict[str, Any]) -> None:
+    def publish(self, event: dict[str, Any] | Envelope) -> None:
         if config.DEBUG:
             print(f"{self=} dispatching {event}")
-        self._handle_subscriptions(event)
+
+        if isinstance(event, Envelope):
+            self._handle_envelope(event)
+        else:
+            self._handle_subscriptions(event)
 
     def _handle_subscriptions(self, event: dict[str, Any]) -> None:
-        # print(self.subscriptions)
+        handlers_by_topic = self._handlers
         for topic in event.keys():
-            subscribers = self.subscriptions.get(topic, {})
-
-            living_subs = {}
-            for subscriber_id, subscriber_ref in subscribers.items():
-                # Dereference the weakref, none if garbage collected
-                subscriber = subscriber_ref()
-
-                # since the subscriber is only a weakref, it might be stale, we handle that below
-                if subscriber is not None:
-                    # This is the case where the instance that owns the handler has strong refs
-                    # still kicking about, so we can keep the ref/id pair in the remaining subs for the
-                    # topic.
-                    living_subs[subscriber_id] = subscriber_ref
-                    subscriber(event)
-            # Actually replace the subscribers with the ones that remain after collection of garbage
-            self.subscriptions[topic] = living_subs
+            handlers = handlers_by_topic.get(topic)
+            if handlers:
+                self._call_all(handlers, event)
+
+    def _handle_envelope(self, envelope: Envelope) -> None:
+        handlers_by_topic = self._handlers
+        for typed_event in envelope.events:
+            handlers = handlers_by_topic.get(type(typed_event))
+            if handlers:
+                self._call_all(handlers, typed_event)
+
+        legacy_event = None
+        for topic in envelope.topics():
+            handlers = handlers_by_topic.get(topic)
+            if handlers:
+                legacy_event = legacy_event or envelope.as_dict()
+                self._call_all(handlers, legacy_event)
+
+    @staticmethod
+    def _call_all(handlers: tuple[HandlerRef, ...], event: Any):
+        # The compiled tuple is a snapshot, so handlers are free to subscribe or
+        # flush while the event is being dispatched.
+        for handler_ref in handlers:
+            handler = handler_ref()
+            # A ref can die during dispatch before its finalizer has run
+            if handler is not None:
+                handler(event)
+
+    def _compile(self, topic: str):
+        subs = self.subscriptions.get(topic)
+        if subs:
+            self._handlers[topic] = tuple(subs.values())
+        else:
+            self.subscriptions.pop(topic, None)
+            self._handlers.pop(topic, None)
+
+    def _prune(self, topic: str, handler_id: str, handler_ref: HandlerRef):
+        subs = self.subscriptions.get(topic, {})
+        # The id may have been resubscribed with a new handler since this ref was made
+        if subs.get(handler_id) is not handler_ref:
+            return
+
+        self.subscriptions[topic] = {
+            sub_id: ref for sub_id, ref in subs.items() if sub_id != handler_id
+        }
+        self._compile(topic)
+        self._finalizers = [
+            finalizer for finalizer in self._finalizers if finalizer.alive
+        ]
 
     def flush_subs(self):
         if config.DEBUG:
             print(f"{self.__class__} flushed")
+        for finalizer in self._finalizers:
+            finalizer.detach()
+        self._finalizers = []
         self.subscriptions: dict[str, dict[str, HandlerRef]] = {}
+        self._handlers = {}
 
 
 class VolatileDispatcher(Dispatcher):
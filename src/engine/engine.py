@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import deque
+from contextlib import nullcontext
 from typing import Any, Callable, Generator, NamedTuple
 
 from pyglet.math import Vec2
@@ -7,13 +9,17 @@ from pyglet.math import Vec2
 from src import config
 from src.engine.describer import Describer
 from src.engine.dispatcher import StaticDispatcher, VolatileDispatcher
+from src.engine.events import Envelope
 from src.engine.events_enum import EventFields, EventTopic
 from src.engine.game_state import AwardSpoilsHandler, GameState
 from src.engine.mission_board import MissionBoard
 from src.engine.persistence.game_state_repository import (Format,
                                                           GuildRepository)
+from src.engine.replay import CombatRecorder, CombatTape, recording_path
+from src.engine.scheduler import Scheduler
 from src.entities.combat.fighter_factory import RecruitmentPool
 from src.systems.combat import CombatRound
+from src.utils.profiling import section
 from src.world.level.dungeon import Dungeon
 
 
@@ -22,7 +28,7 @@ class MessagesWithAlphas(NamedTuple):
     alphas: list[int]
 
 
-Event = dict[str, Any]
+Event = dict[str, Any] | Envelope
 Turn = Generator[None, None, Event]  # <-
 Round = Generator[None, None, Turn]  # <- These are internal to the combat system
 Encounter = Generator[None, None, Round]
@@ -38,14 +44,18 @@ class Engine:
     guild_repository = GuildRepository
 
     def __init__(self) -> None:
-        self.event_queue: list[Event] = []
-        self.messages: list[str] = []
+        self.event_queue: deque[Event] = deque()
+        self.messages: deque[str] = deque(maxlen=config.MESSAGE_LOG_SIZE)
         self.combat: Generator[None, None, Event]
         self.awaiting_input: bool = False
         self.message_alphas: list[int] = []
         self.alpha_max: int = 255
         self.chosen_target: int | None = None
         self.update_clock = self.default_clock_value
+        self.time_scale: float = 1.0
+        self.tape: CombatTape | None = None
+        self.narrated: bool = True
+        self.scheduler = Scheduler()
         self.selected_mission: int | None = None
         self.mission_in_progress: bool = False
         self.current_room = None
@@ -121,14 +131,16 @@ class Engine:
         guild.recruit(selection_id, entity_pool.pool)
 
     def process_event_queue(self) -> None:
-        while True:
-            try:
-                event = self.event_queue.pop(0)
+        with section("engine.process_event_queue"):
+            queue = self.event_queue
+            while queue:
+                self.process_one(queue.popleft())
 
-            except IndexError:
-                break
-
-            self.process_one(event)
+    def recent_messages(self, n: int) -> list[str]:
+        """
+        The last n messages, oldest first.
+        """
+        return list(self.messages)[-n:] if n > 0 else []
 
     def _set_target(self, target: int) -> bool:
         try:
@@ -141,6 +153,8 @@ class Engine:
     def process_one(self, event: Event) -> None:
         if EventTopic.CLEANUP in event:
             self.flush_all()
+            if self.tape is not None:
+                self.tape.on_cleanup(self)
             return
 
         if EventTopic.DELAY in event:
@@ -154,9 +168,19 @@ class Engine:
         if config.DEBUG:
             print(f"{event=}")
 
+        if self.tape is not None:
+            self.tape.before_publish(event)
+
         self.projection_dispatcher.publish(event)
         self.combat_dispatcher.publish(event)
 
+        if self.tape is not None:
+            self.tape.after_publish(event)
+
+    @property
+    def replaying(self) -> bool:
+        return self.tape is not None and self.tape.replaying
+
     def _handle_delay_event(self, event):
         self.increase_update_clock_by_delay(event.get(EventTopic.DELAY, 0))
 
@@ -197,11 +221,21 @@ class Engine:
 
     def init_combat(self) -> None:
         self.mission_in_progress = True
-        self.messages = []
+        self.messages.clear()
         self.message_alphas = []
         self.alpha_max = 255
+        if self.tape is None and config.RECORD_COMBAT:
+            CombatRecorder(self, recording_path()).attach(self)
+        # Damage is only narrated blow by blow if something will show the messages
+        self.narrated = self.wants_messages()
         self.combat = self._generate_combat_events()
 
+    def wants_messages(self) -> bool:
+        return any(
+            EventTopic.MESSAGE in dispatcher.subscriptions
+            for dispatcher in (self.combat_dispatcher, self.projection_dispatcher)
+        )
+
     def initial_health_values(self, team, enemies) -> list[Event]:
         result = []
 
@@ -224,8 +258,12 @@ class Engine:
         This is the source ==Event==> consumer connection
         """
         try:
-            event = next(self.combat)
-            self.process_one(event)
+            with section("engine.next_combat_event"):
+                # Decisions still in progress must be made before combat can go on
+                self.scheduler.run_until_idle()
+                with nullcontext() if self.tape is None else self.tape.step():
+                    event = next(self.combat)
+                    self.process_one(event)
             return True
         except StopIteration:
             return False
@@ -240,7 +278,12 @@ class Engine:
         }
 
         combat_round = None
+        previous = None
         for encounter in quest:
+            if previous is not None:
+                previous.exclude_party(self.game_state.team.members)
+            previous = encounter
+            encounter.narrated = self.narrated
             encounter.include_party(self.game_state.team.members)
             yield {EventTopic.NEW_ENCOUNTER: encounter}
 
@@ -0,0 +1,171 @@
+"""
+Typed combat events.
+
+Each topic is a frozen, slotted dataclass, and an Envelope bundles the events that happen
+together in one step so they can be published as a unit. Subscribers can subscribe to an
+event class and receive just that event, or keep subscribing to the legacy topic keys and
+receive the dict view the envelope builds for them.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar, Iterator, TypeVar
+
+from src.engine.events_enum import EventTopic
+
+if TYPE_CHECKING:
+    from src.entities.combat.fighter import Fighter
+    from src.entities.entity import Entity
+
+_E = TypeVar("_E", bound="TypedEvent")
+
+
+class TypedEvent:
+    """
+    Base for typed events. Subclasses list the legacy dict keys they populate in topics,
+    and map themselves onto those keys in legacy.
+    """
+
+    __slots__ = ()
+    topics: ClassVar[tuple[str | EventTopic, ...]] = ()
+
+    def legacy(self) -> dict[str | EventTopic, Any]:
+        raise NotImplementedError()
+
+
+@dataclass(frozen=True, slots=True)
+class Message(TypedEvent):
+    topics: ClassVar = (EventTopic.MESSAGE,)
+    text: str
+
+    def legacy(self) -> dict[str | EventTopic, Any]:
+        return {EventTopic.MESSAGE: self.text}
+
+
+@dataclass(frozen=True, slots=True)
+class TurnStart(TypedEvent):
+    topics: ClassVar = ("turn_start",)
+    fighter: Fighter
+
+    def legacy(self) -> dict[str | EventTopic, Any]:
+        return {"turn_start": self.fighter}
+
+
+@dataclass(frozen=True, slots=True)
+class TurnEnd(TypedEvent):
+    topics: ClassVar = ("turn_end",)
+    fighter: Fighter
+
+    def legacy(self) -> dict[str | EventTopic, Any]:
+        return {"turn_end": self.fighter}
+
+
+@dataclass(frozen=True, slots=True)
+class AwaitInput(TypedEvent):
+    topics: ClassVar = ("await_input", "choices")
+    fighter: Fighter
+    choices: dict[str, list[dict]]
+
+    def legacy(self) -> dict[str | EventTopic, Any]:
+        return {"await_input": self.fighter, "choices": self.choices}
+
+
+@dataclass(frozen=True, slots=True)
+class EntityData(TypedEvent):
+    topics: ClassVar = (EventTopic.ENTITY_DATA.value,)
+    health: int | None
+    name: str
+    retreat: bool
+    species: str
+
+    def legacy(self) -> dict[str | EventTopic, Any]:
+        return {
+            EventTopic.ENTITY_DATA.value: {
+                "health": self.health,
+                "name": self.name,
+                "retreat": self.retreat,
+                "species": self.species,
+            }
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Dying(TypedEvent):
+    topics: ClassVar = (EventTopic.DYING,)
+    entity: Entity
+
+    def legacy(self) -> dict[str | EventTopic, Any]:
+        return {EventTopic.DYING: self.entity}
+
+
+@dataclass(frozen=True, slots=True)
+class RollItemDrop(TypedEvent):
+    topics: ClassVar = (EventTopic.ROLL_ITEM_DROP,)
+    source: Entity
+
+    def legacy(self) -> dict[str | EventTopic, Any]:
+        return {EventTopic.ROLL_ITEM_DROP: self.source}
+
+
+@dataclass(frozen=True, slots=True)
+class Retreat(TypedEvent):
+    topics: ClassVar = ("retreat",)
+    fighter: Fighter
+
+    def legacy(self) -> dict[str | EventTopic, Any]:
+        return {"retreat": self.fighter}
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Envelope(Mapping):
+    """
+    An immutable bundle of typed events published together.
+
+    The envelope is also a read-only Mapping over the legacy dict view of its events, so
+    code that still does event.get("await_input") or EventTopic.MESSAGE in event keeps
+    working. The view is only built the first time it is needed.
+    """
+
+    events: tuple[TypedEvent, ...]
+    _legacy: dict | None = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def of(cls, *events: TypedEvent) -> Envelope:
+        return cls(events)
+
+    def topics(self) -> Iterator[str | EventTopic]:
+        for event in self.events:
+            yield from event.topics
+
+    def get_event(self, event_type: type[_E]) -> _E | None:
+        for event in self.events:
+            if type(event) is event_type:
+                return event
+
+        return None
+
+    def as_dict(self) -> dict[str | EventTopic, Any]:
+        """
+        The legacy dict representation, built once and shared by every legacy subscriber
+        the envelope is dispatched to, just as a plain dict event would be.
+        """
+        if self._legacy is None:
+            legacy = {}
+            for event in self.events:
+                legacy.update(event.legacy())
+            object.__setattr__(self, "_legacy", legacy)
+
+        return self._legacy
+
+    def __contains__(self, topic: object) -> bool:
+        return any(topic in event.topics for event in self.events)
+
+    def __getitem__(self, topic: str | EventTopic) -> Any:
+        return self.as_dict()[topic]
+
+    def __iter__(self) -> Iterator[str | EventTopic]:
+        return iter(self.as_dict())
+
+    def __len__(self) -> int:
+        return len(self.as_dict())
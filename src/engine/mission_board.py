@@ -1,5 +1,7 @@
+import random
+
 from src.world.level.dungeon import Dungeon
-from src.world.level.dungeon_factory import create_dungeon_with_boss_room
+from src.world.level.dungeon_factory import create_seeded_dungeon
 
 
 class MissionBoard:
@@ -12,8 +14,11 @@ class MissionBoard:
     ) -> None:
         for _ in range(self.size):
             self.missions.append(
-                create_dungeon_with_boss_room(
-                    max_enemies_per_room, min_enemies_per_room, room_amount
+                create_seeded_dungeon(
+                    random.getrandbits(32),
+                    max_enemies_per_room,
+                    min_enemies_per_room,
+                    room_amount,
                 )
             )
 
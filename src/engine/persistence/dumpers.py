@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from src.engine.armory import Armory
+from src.engine.persistence.records import RecordTable
 from src.entities.combat.leveller import Leveller
 
 if TYPE_CHECKING:
@@ -21,56 +22,70 @@ if TYPE_CHECKING:
 class GameStateDumpers:
     @classmethod
     def guild_to_dict(cls, guild: Guild) -> dict:
+        """
+        Item configs and stat affixes are written once to a shared record table under the
+        "records" key, and referenced by content id wherever they are used.
+        """
         guild_dict = {}
+        records = RecordTable()
 
         guild_dict["name"] = guild.name
         guild_dict["xp"] = guild.xp
         guild_dict["funds"] = guild.funds
         guild_dict["roster_limit"] = guild.roster_limit
-        guild_dict["roster"] = [cls.entity_to_dict(entity) for entity in guild.roster]
+        guild_dict["roster"] = [
+            cls.entity_to_dict(entity, records) for entity in guild.roster
+        ]
         guild_dict["roster_scalar"] = guild.roster_scalar
-        guild_dict["team"] = cls.team_to_dict(guild.team)
-        guild_dict["armory"] = cls.armory_to_dict(guild.armory)
+        guild_dict["team"] = cls.team_to_dict(guild.team, records)
+        guild_dict["armory"] = cls.armory_to_dict(guild.armory, records)
+        guild_dict["records"] = records.to_dict()
 
         return guild_dict
 
     @classmethod
-    def armory_to_dict(cls, armory: Armory) -> dict:
+    def armory_to_dict(cls, armory: Armory, records: RecordTable | None = None) -> dict:
         return {
-            "storage": [cls.equippable_item_to_dict(item) for item in armory.storage]
+            "storage": [
+                cls.equippable_item_to_dict(item, records) for item in armory.storage
+            ]
         }
 
     @classmethod
-    def entity_to_dict(cls, entity: Entity) -> dict:
+    def entity_to_dict(
+        cls, entity: Entity, records: RecordTable | None = None
+    ) -> dict:
         return {
             "entity_id": entity.entity_id,
             "name": entity.name._asdict(),
             "cost": entity.cost,
-            "fighter": cls.fighter_to_dict(entity.fighter),
+            "fighter": cls.fighter_to_dict(entity.fighter, records),
             "inventory": entity.inventory.to_dict(),
             "species": entity.species,
         }
 
     @classmethod
-    def team_to_dict(cls, team: Team) -> dict:
+    def team_to_dict(cls, team: Team, records: RecordTable | None = None) -> dict:
         team_as_dict = {}
 
         team_as_dict["name"] = team.name
         team_as_dict["members"] = [
-            cls.entity_to_dict(member) for member in team.members
+            cls.entity_to_dict(member, records) for member in team.members
         ]
 
         return team_as_dict
 
     @classmethod
-    def fighter_to_dict(cls, fighter: Fighter) -> dict:
+    def fighter_to_dict(
+        cls, fighter: Fighter, records: RecordTable | None = None
+    ) -> dict:
         return {
             "role": fighter.role.name,
             "health": cls.health_pool_to_dict(fighter.health),
             "stats": fighter.stats._asdict(),
             "leveller": cls.leveller_to_dict(fighter.leveller),
             "action_points": cls.action_points_to_dict(fighter.action_points),
-            "gear": cls.gear_to_dict(fighter.gear),
+            "gear": cls.gear_to_dict(fighter.gear, records),
             "caster": cls.caster_to_dict(fighter.caster) if fighter.caster else None,
         }
 
@@ -102,26 +117,36 @@ class GameStateDumpers:
         }
 
     @classmethod
-    def gear_to_dict(cls, gear: Gear) -> dict:
+    def gear_to_dict(cls, gear: Gear, records: RecordTable | None = None) -> dict:
         return {
-            "_weapon": cls.equippable_item_to_dict(gear.weapon)
+            "_weapon": cls.equippable_item_to_dict(gear.weapon, records)
             if gear.weapon
             else None,
-            "_helmet": cls.equippable_item_to_dict(gear.helmet)
+            "_helmet": cls.equippable_item_to_dict(gear.helmet, records)
             if gear.helmet
             else None,
-            "_body": cls.equippable_item_to_dict(gear.body) if gear.body else None,
+            "_body": cls.equippable_item_to_dict(gear.body, records)
+            if gear.body
+            else None,
             "base_equipped_stats": gear.base_equipped_stats._asdict(),
         }
 
     @classmethod
-    def equippable_item_to_dict(cls, equippable: EquippableItem) -> dict:
+    def equippable_item_to_dict(
+        cls, equippable: EquippableItem, records: RecordTable | None = None
+    ) -> dict:
+        """
+        Without a record table the config is written inline, which keeps single items
+        self-contained for streamed exports.
+        """
+        config = cls.equippable_item_config_to_dict(
+            equippable._config,
+            equippable._fighter_affixes,
+            equippable._equippable_item_affixes,
+            records,
+        )
         return {
-            "config": cls.equippable_item_config_to_dict(
-                equippable._config,
-                equippable._fighter_affixes,
-                equippable._equippable_item_affixes,
-            ),
+            "config": records.intern("configs", config) if records else config,
             "stats": equippable._stats._asdict(),
         }
 
@@ -131,7 +156,14 @@ class GameStateDumpers:
         equippable_config: EquippableItemConfig,
         resolved_fighter_affixes,
         resolved_equippable_affixes,
+        records: RecordTable | None = None,
     ) -> dict:
+        affix_to_ref = lambda affix: (
+            records.intern("affixes", cls.stat_affix_to_dict(affix))
+            if records
+            else cls.stat_affix_to_dict(affix)
+        )
+
         return {
             "name": equippable_config.name,
             "slot": equippable_config.slot,
@@ -140,12 +172,12 @@ class GameStateDumpers:
             "attacks": equippable_config.attacks,
             "spells": equippable_config.spells,
             "fighter_affixes": [
-                cls.stat_affix_to_dict(affix) for affix in resolved_fighter_affixes
+                affix_to_ref(affix) for affix in resolved_fighter_affixes
             ]
             if resolved_fighter_affixes
             else [],
             "equippable_item_affixes": [
-                cls.stat_affix_to_dict(affix) for affix in resolved_equippable_affixes
+                affix_to_ref(affix) for affix in resolved_equippable_affixes
             ]
             if resolved_equippable_affixes
             else [],
@@ -2,17 +2,28 @@ import pickle
 from datetime import datetime
 from enum import Enum
 from os import path
-from typing import NamedTuple
+from pathlib import Path
+from typing import Any, Generator, Iterable, NamedTuple
 
-from yaml import Loader, dump, load
+from yaml import dump, dump_all, load, load_all
 
-from src.config import SAVE_FILE_DIRECTORY, TEST_FILE_DIRECTORY
+# Prefer the libyaml bindings when PyYAML was built against them, they are an order of
+# magnitude faster than the pure python implementations for both reading and writing.
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
+from src import config
+from src.engine.armory import Armory
 from src.engine.guild import Guild
 from src.engine.persistence.dumpers import GameStateDumpers
 from src.engine.persistence.loaders import GameStateLoaders
 
-if not path.exists(SAVE_FILE_DIRECTORY):
-    SAVE_FILE_DIRECTORY.mkdir(parents=True)
+if not path.exists(config.SAVE_FILE_DIRECTORY):
+    config.SAVE_FILE_DIRECTORY.mkdir(parents=True)
 
 
 class Mode(NamedTuple):
@@ -26,16 +37,30 @@ class Format(Enum):
 
     def dumper(self):
         return {
-            Format.YAML: dump,
+            Format.YAML: lambda data, file: dump(data, file, Dumper=YamlDumper),
             Format.PICKLE: pickle.dump,
         }[self]
 
     def loader(self):
         return {
-            Format.YAML: lambda file: load(file, Loader),
+            Format.YAML: lambda file: load(file, YamlLoader),
             Format.PICKLE: lambda file: pickle.load(file),
         }[self]
 
+    def stream_dumper(self):
+        return {
+            Format.YAML: lambda documents, file: dump_all(
+                documents, file, Dumper=YamlDumper
+            ),
+            Format.PICKLE: _pickle_dump_all,
+        }[self]
+
+    def stream_loader(self):
+        return {
+            Format.YAML: lambda file: load_all(file, YamlLoader),
+            Format.PICKLE: _pickle_load_all,
+        }[self]
+
     def mode(self) -> Mode:
         return {
             Format.YAML: Mode(read="r", write="w+"),
@@ -54,10 +79,40 @@ class Format(Enum):
 
         return state
 
+    def dump_all(self, documents: Iterable[Any], file_path):
+        """
+        Writes each document to the file as it is produced by the iterable, so large
+        exports never need to be held in memory as a single document.
+        """
+        with open(file_path, self.mode().write) as save_file:
+            dumper = self.stream_dumper()
+            dumper(documents, save_file)
+
+    def load_all(self, file_path) -> Generator[Any, None, None]:
+        """
+        Lazily yields the documents in the file in the order they were written.
+        The file is held open until the generator is exhausted or closed.
+        """
+        with open(file_path, self.mode().read) as save_file:
+            loader = self.stream_loader()
+            yield from loader(save_file)
+
+
+def _pickle_dump_all(documents: Iterable[Any], file):
+    for document in documents:
+        pickle.dump(document, file)
+
+
+def _pickle_load_all(file) -> Generator[Any, None, None]:
+    while True:
+        try:
+            yield pickle.load(file)
+        except EOFError:
+            return
+
 
 class GuildRepository:
     MAX_SLOTS = 3
-    metadata_path = SAVE_FILE_DIRECTORY / "saves.yaml"
 
     @staticmethod
     def _get_default_metadata(max_slots: int):
@@ -65,6 +120,10 @@ class GuildRepository:
 
     _latest_metadata = _get_default_metadata(MAX_SLOTS)
 
+    @classmethod
+    def metadata_path(cls) -> Path:
+        return config.SAVE_FILE_DIRECTORY / "saves.yaml"
+
     @classmethod
     def save_file_path(
         cls, slot: int, fmt: Format = Format.PICKLE, testing=False
@@ -72,10 +131,32 @@ class GuildRepository:
         if not isinstance(fmt, Format):
             raise TypeError(f"Unrecognised format {fmt}")
 
+        # Read from the config module at call time so that the directories can be
+        # pointed elsewhere, at benchmark fixtures for example.
+        if testing:
+            return str(
+                config.TEST_FILE_DIRECTORY / f"save_file_from_test_{slot}.{fmt.value}"
+            )
+
+        return str(config.SAVE_FILE_DIRECTORY / f"save_{slot}.{fmt.value}")
+
+    @classmethod
+    def export_file_path(
+        cls, name: str, fmt: Format = Format.YAML, testing=False
+    ) -> str:
+        if not isinstance(fmt, Format):
+            raise TypeError(f"Unrecognised format {fmt}")
+
         if testing:
-            return str(TEST_FILE_DIRECTORY / f"save_file_from_test_{slot}.{fmt.value}")
+            return str(
+                config.TEST_FILE_DIRECTORY / f"export_from_test_{name}.{fmt.value}"
+            )
 
-        return str(SAVE_FILE_DIRECTORY / f"save_{slot}.{fmt.value}")
+        export_dir = config.SAVE_FILE_DIRECTORY / "exports"
+        if not path.exists(export_dir):
+            export_dir.mkdir(parents=True)
+
+        return str(export_dir / f"{name}.{fmt.value}")
 
     @classmethod
     def load(cls, slot, fmt=Format.PICKLE, testing=False):
@@ -118,6 +199,55 @@ class GuildRepository:
 
         cls._update_metadata(guild_to_serialise, slot)
 
+    @classmethod
+    def export_armory(
+        cls, guild: Guild, fmt: Format = Format.YAML, testing=False
+    ) -> str:
+        """
+        Streams the armory to an export file, one document per stored item.
+        """
+        file_path = cls.export_file_path(f"armory_{guild.name}", fmt, testing)
+        fmt.dump_all(
+            (
+                GameStateDumpers.equippable_item_to_dict(item)
+                for item in guild.armory.storage
+            ),
+            file_path,
+        )
+
+        return file_path
+
+    @classmethod
+    def import_armory(cls, file_path: str, fmt: Format = Format.YAML) -> Armory:
+        armory = Armory()
+        armory.store_all(
+            [
+                GameStateLoaders.equippable_item_from_dict(item, owner=None)
+                for item in fmt.load_all(file_path)
+            ]
+        )
+
+        return armory
+
+    @classmethod
+    def export_roster(
+        cls, guild: Guild, fmt: Format = Format.YAML, testing=False
+    ) -> str:
+        """
+        Streams every member of the guild, benched or on the team, to an export file
+        with one document per entity.
+        """
+        file_path = cls.export_file_path(f"roster_{guild.name}", fmt, testing)
+        fmt.dump_all(
+            (
+                GameStateDumpers.entity_to_dict(entity)
+                for entity in (*guild.roster, *guild.team.members)
+            ),
+            file_path,
+        )
+
+        return file_path
+
     @classmethod
     def get_slot_info(cls) -> list[dict]:
         return cls._load_metadata()
@@ -129,19 +259,19 @@ class GuildRepository:
         now_str = f"{now.month}/{now.day} {now.hour}:{now.minute}"
         metadata[slot] = {"name": f"Guild {slot}", "slot": slot, "timestamp": now_str}
         cls._latest_metadata = metadata
-        Format.YAML.dump(metadata, cls.metadata_path)
+        Format.YAML.dump(metadata, cls.metadata_path())
 
     @classmethod
     def _load_metadata(cls) -> list[dict]:
         metadata = cls._latest_metadata
-        if path.exists(cls.metadata_path):
-            metadata = Format.YAML.load(cls.metadata_path)
+        if path.exists(cls.metadata_path()):
+            metadata = Format.YAML.load(cls.metadata_path())
             if not metadata:
                 metadata = cls._get_default_metadata(cls.MAX_SLOTS)
             cls._latest_metadata = metadata
         else:
             Format.YAML.dump(
-                cls._get_default_metadata(cls.MAX_SLOTS), cls.metadata_path
+                cls._get_default_metadata(cls.MAX_SLOTS), cls.metadata_path()
             )
 
         return metadata
@@ -1,6 +1,9 @@
+from typing import Any, Callable, Generic, TypeVar
+
 from src.engine.armory import Armory
 from src.engine.guild import Guild
-from src.entities.action.actions import ActionPoints
+from src.engine.persistence.records import RecordTable
+from src.entities.action.actions import ActionMenu, ActionPoints
 from src.entities.combat.archetypes import FighterArchetype
 from src.entities.combat.fighter import EncounterContext, Fighter
 from src.entities.combat.leveller import Leveller
@@ -15,8 +18,84 @@ from src.entities.item.inventory import Inventory
 from src.entities.item.items import HealingPotion
 from src.entities.magic.caster import Caster, MpPool
 from src.entities.sprite_assignment import Species, attach_sprites
-from src.entities.sprites import SimpleSpriteAttribute
-from src.gui.simple_sprite_config import choose_item_texture
+from src.gui.simple_sprite_config import choose_item_sprite
+
+_T = TypeVar("_T")
+
+
+class HydrationTemplate(Generic[_T]):
+    """
+    A precomputed recipe for rebuilding instances of a class without calling its __init__.
+
+    Shared attributes are immutable defaults that every hydrated instance can reference,
+    fresh attributes are zero-arg factories for per-instance state that gets mutated in
+    place (hook lists for example). Hydration installs the whole attribute dict with a
+    single assignment, much like a __setstate__ would.
+    """
+
+    def __init__(
+        self,
+        cls: type[_T],
+        shared: dict[str, Any] | None = None,
+        fresh: dict[str, Callable[[], Any]] | None = None,
+    ):
+        self.cls = cls
+        self.shared = shared or {}
+        self.fresh = fresh or {}
+
+    def blank(self) -> _T:
+        """
+        An uninitialised instance, for when child components need a reference to their
+        owner before the owner can be hydrated.
+        """
+        return object.__new__(self.cls)
+
+    def hydrate(self, instance: _T | None = None, **state) -> _T:
+        if instance is None:
+            instance = self.blank()
+
+        attrs = self.shared.copy()
+        for name, factory in self.fresh.items():
+            attrs[name] = factory()
+        attrs.update(state)
+        instance.__dict__ = attrs
+
+        return instance
+
+
+_entity_template = HydrationTemplate(
+    Entity,
+    shared={
+        "is_dead": False,
+        "locatable": None,
+        "item": None,
+        "ai": None,
+        "species": Species.HUMAN,
+        "_entity_sprite": None,
+        "_sprite_builder": None,
+    },
+    fresh={"on_death_hooks": list},
+)
+
+_fighter_template = HydrationTemplate(
+    Fighter,
+    shared={
+        "is_enemy": False,
+        "is_boss": False,
+        "retreating": False,
+        "_in_combat": False,
+        "_readied_action": None,
+    },
+    fresh={"on_retreat_hooks": list},
+)
+
+_equippable_item_template = HydrationTemplate(
+    EquippableItem,
+    fresh={
+        "_available_attacks_cache": list,
+        "_available_spells_cache": list,
+    },
+)
 
 
 class GameStateLoaders:
@@ -25,17 +104,18 @@ class GameStateLoaders:
         scalar = serialised_guild.pop("roster_scalar")
         team = serialised_guild.pop("team")
         armory = serialised_guild.pop("armory")
+        records = RecordTable(serialised_guild.pop("records", None))
         g = Guild(**serialised_guild)
-        g.armory = cls.armory_from_dict(armory)
+        g.armory = cls.armory_from_dict(armory, records)
 
         g.team.name = team["name"]
 
         entities = []
         for e in serialised_guild["roster"]:
-            entities.append(cls.entity_from_dict(e))
+            entities.append(cls.entity_from_dict(e, records))
         g.roster = entities
         for member in team["members"]:
-            m = cls.entity_from_dict(member)
+            m = cls.entity_from_dict(member, records)
             g.team.assign_to_team(m, from_file=True)
 
         g.roster_scalar = scalar
@@ -43,37 +123,36 @@ class GameStateLoaders:
         return g
 
     @classmethod
-    def armory_from_dict(cls, serialised_armory: dict) -> Armory:
+    def armory_from_dict(
+        cls, serialised_armory: dict, records: RecordTable | None = None
+    ) -> Armory:
         instance = Armory()
         instance.storage = [
-            cls.equippable_item_from_dict(item, None)
+            cls.equippable_item_from_dict(item, None, records)
             for item in serialised_armory["storage"]
         ]
 
         return instance
 
     @classmethod
-    def entity_from_dict(cls, serialised_entity: dict | None) -> Entity | None:
+    def entity_from_dict(
+        cls, serialised_entity: dict | None, records: RecordTable | None = None
+    ) -> Entity | None:
         if serialised_entity is None:
             return None
-        instance = Entity()
-        instance.__dict__ = {
-            **serialised_entity,
-            "name": Name(**serialised_entity["name"]),
-            "fighter": cls.fighter_from_dict(
-                serialised_entity.get("fighter"), owner=instance
+        instance = _entity_template.blank()
+        _entity_template.hydrate(
+            instance,
+            entity_id=serialised_entity["entity_id"],
+            name=Name(**serialised_entity["name"]),
+            cost=serialised_entity["cost"],
+            fighter=cls.fighter_from_dict(
+                serialised_entity.get("fighter"), owner=instance, records=records
             ),
-            "inventory": cls.inventory_from_dict(
+            inventory=cls.inventory_from_dict(
                 serialised_entity.get("inventory"), owner=instance
             ),
-            "is_dead": False,
-            "locatable": None,
-            "item": None,
-            "ai": None,
-            "on_death_hooks": [],
-            "species": Species.HUMAN,
-            "entity_sprite": None,
-        }
+        )
 
         instance = attach_sprites(instance)
 
@@ -81,61 +160,46 @@ class GameStateLoaders:
 
     @classmethod
     def fighter_from_dict(
-        cls, serialised_fighter: dict | None, owner: Entity
+        cls,
+        serialised_fighter: dict | None,
+        owner: Entity,
+        records: RecordTable | None = None,
     ) -> Fighter | None:
         if serialised_fighter is None:
             return None
-        instance = object.__new__(Fighter)
-        instance.__dict__ = {
-            **serialised_fighter,
-            "owner": owner,
-            "health": cls.health_pool_from_dict(serialised_fighter.get("health")),
-            "leveller": cls.leveller_from_dict(
+        instance = _fighter_template.blank()
+        stats = FighterStats(**serialised_fighter.get("stats"))
+        _fighter_template.hydrate(
+            instance,
+            owner=owner,
+            health=cls.health_pool_from_dict(serialised_fighter.get("health")),
+            leveller=cls.leveller_from_dict(
                 serialised_fighter.get("leveller"), owner=instance
             ),
-            "stats": FighterStats(**serialised_fighter.get("stats")),
-            "gear": cls.gear_from_dict(serialised_fighter.get("gear"), owner=instance),
-            "action_points": cls.action_points_from_dict(
+            stats=stats,
+            modifiable_stats=ModifiableStats(FighterStats, base_stats=stats),
+            gear=cls.gear_from_dict(
+                serialised_fighter.get("gear"), owner=instance, records=records
+            ),
+            action_points=cls.action_points_from_dict(
                 serialised_fighter.get("action_points")
             ),
-            "_caster": cls.caster_from_dict(
+            # We serialise without preceeding underscores, so the caster is hydrated
+            # under the _caster attribute here.
+            _caster=cls.caster_from_dict(
                 serialised_caster=serialised_fighter.get("caster"), owner=instance
             )
             if serialised_fighter["caster"] is not None
             else None,
-            "on_retreat_hooks": [],
-            "is_enemy": False,
-            "is_boss": False,
-            "retreating": False,
-            "_in_combat": False,
-            "_readied_action": None,
-            "_encounter_context": EncounterContext(fighter=instance),
-            "role": serialised_fighter["role"],
-        }
-
-        # We serialise without preceeding underscores,
-        # so pop this key from the instance.__dict__ after instantiating the caster
-        # under the _caster attribute.
-        instance.__dict__.pop("caster")
-
-        instance.role = serialised_fighter.get("role")
-        match instance.role:
-            case "MELEE":
-                instance.set_role(FighterArchetype.MELEE)
-            case "RANGED":
-                instance.set_role(FighterArchetype.RANGED)
-            case "CASTER":
-                instance.set_role(FighterArchetype.CASTER)
-
-        instance.set_role(instance.role)
-        instance.modifiable_stats = ModifiableStats(
-            FighterStats, base_stats=instance.stats
+            _encounter_context=EncounterContext(fighter=instance),
+            action_menu=ActionMenu(instance),
         )
 
+        role = serialised_fighter.get("role")
+        instance.set_role(FighterArchetype.__members__.get(role, role))
+
         # Warmup the caches. We do it here because this is when the Fighter has ModifiableStats
-        instance.gear.equip_item(instance.gear.weapon)
-        instance.gear.equip_item(instance.gear.helmet)
-        instance.gear.equip_item(instance.gear.body)
+        instance.gear.restore_equipped()
 
         return instance
 
@@ -191,7 +255,12 @@ class GameStateLoaders:
         return inv
 
     @classmethod
-    def gear_from_dict(cls, serialised_gear: dict, owner: Fighter) -> Gear | None:
+    def gear_from_dict(
+        cls,
+        serialised_gear: dict,
+        owner: Fighter,
+        records: RecordTable | None = None,
+    ) -> Gear | None:
         """
         Hydrates an equipment instance with the data dict and attaches the owner.
         Assign slots first so that they exist, then hydrate each equippable from the data dict.
@@ -201,6 +270,7 @@ class GameStateLoaders:
         Args:
             data (dict): dict representation of equipment and contained equippables.
             owner (Fighter): owner of this equipment instance.
+            records (RecordTable | None): shared item configs and affixes referenced by the equippables.
 
         Returns:
             Self | None: Equipment containing hydrated equippables.
@@ -222,75 +292,112 @@ class GameStateLoaders:
             match slot:
                 case "_weapon":
                     instance._weapon = cls.equippable_item_from_dict(
-                        serialised_gear[slot], owner=owner
+                        serialised_gear[slot], owner=owner, records=records
                     )
 
                 case "_helmet":
                     instance._helmet = cls.equippable_item_from_dict(
-                        serialised_gear[slot], owner=owner
+                        serialised_gear[slot], owner=owner, records=records
                     )
 
                 case "_body":
                     instance._body = cls.equippable_item_from_dict(
-                        serialised_gear[slot], owner=owner
+                        serialised_gear[slot], owner=owner, records=records
                     )
 
         return instance
 
     @classmethod
     def equippable_item_from_dict(
-        cls, serialised_equippable_item: dict | None, owner: Fighter
+        cls,
+        serialised_equippable_item: dict | None,
+        owner: Fighter,
+        records: RecordTable | None = None,
     ) -> EquippableItem | None:
         if not serialised_equippable_item:
             return None
 
-        fighter_mods = []
-        for affix in serialised_equippable_item["config"]["fighter_affixes"]:
-            if affix.get("modifier").get("stat_class") == "FighterStats":
-                fighter_mods.append(cls.fighter_stat_affix_from_dict(affix))
-
-        equippable_mods = []
-        for affix in serialised_equippable_item["config"]["equippable_item_affixes"]:
-            if affix.get("modifier").get("stat_class") == "EquippableStats":
-                equippable_mods.append(cls.equippable_item_stat_affix_from_dict(affix))
-
-        instance = object.__new__(EquippableItem)
-        instance.__dict__ = {
-            "_owner": owner,
-            **{f"_{k}": v for k, v in serialised_equippable_item["config"].items()},
-            "_fighter_affixes": fighter_mods,
-            "_equippable_item_affixes": equippable_mods,
-            "_available_attack_cache": [],
-            "_available_spell_cache": [],
-            "_stats": EquippableItemStats(**serialised_equippable_item["stats"]),
-            "_config": EquippableItemConfig(
-                **{
-                    **serialised_equippable_item["config"],
-                    "fighter_affixes": fighter_mods,
-                    "equippable_item_affixes": equippable_mods,
-                }
+        records = records or RecordTable()
+        config = records.resolve(
+            "configs",
+            serialised_equippable_item["config"],
+            lambda serialised_config: cls.equippable_item_config_from_dict(
+                serialised_config, records
             ),
-        }
-
-        instance._sprite = SimpleSpriteAttribute(
-            path_or_texture=choose_item_texture(instance), scale=6
         )
-        instance._sprite.owner = instance
-
-        instance._modifiable_stats = ModifiableStats(
-            EquippableItemStats, instance._stats
+        stats = EquippableItemStats(**serialised_equippable_item["stats"])
+        # The config is shared by every item built from the same record, its lists are
+        # only ever read from or replaced on the item, never mutated in place.
+        instance = _equippable_item_template.hydrate(
+            _owner=owner,
+            _name=config.name,
+            _slot=config.slot,
+            _attack_verb=config.attack_verb,
+            _range=config.range,
+            _attacks=config.attacks,
+            _spells=config.spells,
+            _fighter_affixes=config.fighter_affixes,
+            _equippable_item_affixes=config.equippable_item_affixes,
+            _stats=stats,
+            _modifiable_stats=ModifiableStats(EquippableItemStats, stats),
+            _config=config,
         )
 
+        instance.set_sprite_config(choose_item_sprite(instance))
+
         return instance
 
+    @classmethod
+    def equippable_item_config_from_dict(
+        cls, serialised_config: dict, records: RecordTable
+    ) -> EquippableItemConfig:
+        return EquippableItemConfig(
+            **{
+                **serialised_config,
+                "fighter_affixes": cls.stat_affixes_from_refs(
+                    serialised_config["fighter_affixes"], FighterStats, records
+                ),
+                "equippable_item_affixes": cls.stat_affixes_from_refs(
+                    serialised_config["equippable_item_affixes"],
+                    EquippableItemStats,
+                    records,
+                ),
+            }
+        )
+
+    @classmethod
+    def stat_affixes_from_refs(
+        cls,
+        refs: list[str | dict],
+        stat_class: type[FighterStats | EquippableItemStats],
+        records: RecordTable,
+    ) -> list[StatAffix]:
+        affixes = []
+        for ref in refs:
+            affix = records.resolve("affixes", ref, cls.stat_affix_from_dict)
+            if affix is not None and affix.modifier._stat_class is stat_class:
+                affixes.append(affix)
+
+        return affixes
+
+    @classmethod
+    def stat_affix_from_dict(cls, serialised_stat_affix: dict) -> StatAffix | None:
+        match serialised_stat_affix["modifier"]["stat_class"]:
+            case FighterStats.name:
+                return cls.fighter_stat_affix_from_dict(serialised_stat_affix)
+            case EquippableItemStats.name:
+                return cls.equippable_item_stat_affix_from_dict(serialised_stat_affix)
+            case _:
+                return None
+
     @classmethod
     def fighter_stat_affix_from_dict(cls, serialised_stat_affix: dict) -> StatAffix:
-        serialised_stat_affix["modifier"].pop("stat_class")
         modifier = Modifier(
             FighterStats,
             **{
                 k: FighterStats(**v)
                 for k, v in serialised_stat_affix["modifier"].items()
+                if k != "stat_class"
             },
         )
         return StatAffix(serialised_stat_affix["name"], modifier)
@@ -299,12 +406,12 @@ class GameStateLoaders:
     def equippable_item_stat_affix_from_dict(
         cls, serialised_stat_affix: dict
     ) -> StatAffix:
-        serialised_stat_affix["modifier"].pop("stat_class")
         modifier = Modifier(
             EquippableItemStats,
             **{
                 k: EquippableItemStats(**v)
                 for k, v in serialised_stat_affix["modifier"].items()
+                if k != "stat_class"
             },
         )
         return StatAffix(serialised_stat_affix["name"], modifier)
@@ -0,0 +1,59 @@
+import hashlib
+import json
+from typing import Any, Callable, TypeVar
+
+_T = TypeVar("_T")
+
+
+class RecordTable:
+    """
+    A content-addressed table of serialised records that are shared by many objects in a
+    save, such as item configs and stat affixes.
+
+    When dumping, identical records are interned once and referenced by the hash of their
+    contents. When loading, each referenced record is built once and the resulting object
+    is shared by everything that refers to it, so the records must describe immutable data.
+    """
+
+    def __init__(self, tables: dict[str, dict[str, dict]] | None = None):
+        self._tables = tables or {}
+        self._resolved: dict[tuple[str, str], Any] = {}
+
+    @staticmethod
+    def content_id(record: dict) -> str:
+        canonical = json.dumps(record, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(canonical.encode(), digest_size=8).hexdigest()
+
+    def intern(self, kind: str, record: dict) -> str:
+        record_id = self.content_id(record)
+        self._tables.setdefault(kind, {}).setdefault(record_id, record)
+
+        return record_id
+
+    def resolve(self, kind: str, ref: str | dict, build: Callable[[dict], _T]) -> _T:
+        """
+        Builds the object for a reference into the table, or for an inline record as
+        written by saves and exports that predate the table.
+
+        Args:
+            kind (str): the table the reference points into.
+            ref (str | dict): a record id, or the record itself.
+            build (Callable[[dict], _T]): constructs the object from the serialised record.
+
+        Returns:
+            _T: the object built from the record, shared between all refs to the same id.
+        """
+        if not isinstance(ref, str):
+            return build(ref)
+
+        key = (kind, ref)
+        if key not in self._resolved:
+            self._resolved[key] = build(self._tables[kind][ref])
+
+        return self._resolved[key]
+
+    def count(self, kind: str) -> int:
+        return len(self._tables.get(kind, {}))
+
+    def to_dict(self) -> dict[str, dict[str, dict]]:
+        return self._tables
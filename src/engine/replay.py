@@ -0,0 +1,347 @@
+"""
+Recording and deterministic replay of combat.
+
+A recording holds everything needed to play a fight out again: the guild as it was when
+combat began, the spec the dungeon was generated from, a seed, and every choice confirmed
+by the player or an AI. While a tape is attached to the engine, combat steps draw from a
+random state of their own, seeded once from the recording's seed. The fight is then
+reproducible no matter what else draws random numbers between steps, such as the GUI,
+and nothing outside of combat sees its stream replaced.
+
+Recordings are written as a short header followed by zlib compressed JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import struct
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Generator, NamedTuple
+
+from src import config
+from src.engine.events import AwaitInput, Envelope
+from src.engine.game_state import GameState
+from src.engine.persistence.dumpers import GameStateDumpers
+from src.engine.persistence.loaders import GameStateLoaders
+from src.entities.combat.fighter_factory import RecruitmentPool
+from src.utils.cli import CommandMeta
+from src.utils.deep_copy import copy
+from src.world.level.dungeon_factory import DungeonSpec
+from src.world.node import Node
+
+if TYPE_CHECKING:
+    from src.engine.engine import Engine, Event
+    from src.world.level.room import Room
+
+MAGIC = b"ALRP"
+VERSION = 1
+_HEADER = struct.Struct("<4sB")
+
+
+class ReplayDivergedError(ValueError):
+    pass
+
+
+class RecordedChoice(NamedTuple):
+    prompt: int  # the number of the input request, counting from 1
+    action: str
+    option: int  # index into the options for the action
+    args: tuple
+
+
+class Recording:
+    def __init__(
+        self,
+        seed: int,
+        guild: dict,
+        dungeon: DungeonSpec,
+        choices: list[RecordedChoice] | None = None,
+    ):
+        self.seed = seed
+        self.guild = guild
+        self.dungeon = dungeon
+        self.choices = choices or []
+
+    def to_bytes(self) -> bytes:
+        body = {
+            "seed": self.seed,
+            "guild": self.guild,
+            "dungeon": [*self.dungeon],
+            "choices": [[*choice] for choice in self.choices],
+        }
+        compressed = zlib.compress(json.dumps(body, separators=(",", ":")).encode())
+
+        return _HEADER.pack(MAGIC, VERSION) + compressed
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Recording:
+        magic, version = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} recording: {magic=}, {version=}")
+
+        body = json.loads(zlib.decompress(data[_HEADER.size :]))
+        return cls(
+            seed=body["seed"],
+            guild=body["guild"],
+            dungeon=DungeonSpec(*body["dungeon"]),
+            choices=[
+                RecordedChoice(prompt, action, option, tuple(map(tuple, args)))
+                for prompt, action, option, args in body["choices"]
+            ],
+        )
+
+    def save(self, file_path: Path):
+        if not file_path.parent.exists():
+            file_path.parent.mkdir(parents=True)
+
+        with open(file_path, "wb") as recording_file:
+            recording_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, file_path: Path) -> Recording:
+        with open(file_path, "rb") as recording_file:
+            return cls.from_bytes(recording_file.read())
+
+
+def recording_path() -> Path:
+    return config.REPLAY_DIRECTORY / f"combat_{time.strftime('%Y%m%d_%H%M%S')}.replay"
+
+
+def _encode_arg(arg: Any, room: Room) -> tuple:
+    # Fighters are referred to by their place in the room so the replay can find its own
+    if isinstance(arg, Node):
+        return ("node", *arg)
+
+    if hasattr(arg, "owner") and arg.owner in room.occupants:
+        return ("occupant", room.occupants.index(arg.owner))
+
+    raise TypeError(f"Cannot record a choice with the argument {arg}")
+
+
+def _decode_arg(encoded: tuple, room: Room) -> Any:
+    match encoded:
+        case ("node", *xyz):
+            return Node(*xyz)
+        case ("occupant", index):
+            return room.occupants[index].fighter
+
+    raise TypeError(f"Unrecognised recorded argument {encoded}")
+
+
+def _prompt_in(event: Event) -> AwaitInput | None:
+    if isinstance(event, Envelope):
+        return event.get_event(AwaitInput)
+
+    return None
+
+
+class CombatTape:
+    """
+    The hooks the engine calls while a recorder or replayer is attached.
+    """
+
+    replaying = False
+
+    def __init__(self, recording: Recording):
+        self.recording = recording
+        self.steps = 0
+        self.prompts = 0
+        self._random_state = random.Random(recording.seed).getstate()
+
+    @contextmanager
+    def step(self) -> Generator[None, None, None]:
+        """
+        Swaps in the combat's own random state for the duration of a step, putting
+        back whatever was there before once it's over.
+        """
+        self.on_step()
+        outside = random.getstate()
+        random.setstate(self._random_state)
+        try:
+            yield
+        finally:
+            self._random_state = random.getstate()
+            random.setstate(outside)
+
+    def on_step(self):
+        self.steps += 1
+
+    def before_publish(self, event: Event):
+        pass
+
+    def after_publish(self, event: Event):
+        pass
+
+    def on_cleanup(self, engine: Engine):
+        engine.tape = None
+
+
+class CombatRecorder(CombatTape):
+    def __init__(self, engine: Engine, file_path: Path | None = None):
+        dungeon = engine.game_state.dungeon
+        if dungeon.spec is None:
+            raise ValueError("Only dungeons generated from a spec can be recorded")
+
+        super().__init__(
+            Recording(
+                seed=random.getrandbits(32),
+                guild=GameStateDumpers.guild_to_dict(engine.game_state.guild),
+                dungeon=dungeon.spec,
+            )
+        )
+        self.file_path = file_path
+        self._wrapped: list[dict] = []
+
+    def attach(self, engine: Engine) -> CombatRecorder:
+        engine.tape = self
+        return self
+
+    def before_publish(self, event: Event):
+        if (prompt := _prompt_in(event)) is None:
+            return
+
+        self.prompts += 1
+        self._unwrap()
+        room = prompt.fighter.encounter_context.get()
+        for action, options in prompt.choices.items():
+            for index, option in enumerate(options):
+                on_confirm = option.get("on_confirm")
+                if callable(on_confirm):
+                    option["on_confirm"] = self._recorded(
+                        getattr(on_confirm, "__wrapped__", on_confirm),
+                        RecordedChoice(self.prompts, action, index, ()),
+                        room,
+                    )
+                    self._wrapped.append(option)
+
+    def _unwrap(self):
+        # Fighters keep their options between requests, so put back what was there
+        # once the choice has been made
+        for option in self._wrapped:
+            option["on_confirm"] = option["on_confirm"].__wrapped__
+
+        self._wrapped.clear()
+
+    def _recorded(
+        self, on_confirm: Callable, choice: RecordedChoice, room: Room
+    ) -> Callable:
+        def _record_and_confirm(*args):
+            self.recording.choices.append(
+                choice._replace(args=tuple(_encode_arg(arg, room) for arg in args))
+            )
+            return on_confirm(*args)
+
+        _record_and_confirm.__wrapped__ = on_confirm
+        return _record_and_confirm
+
+    def on_cleanup(self, engine: Engine):
+        super().on_cleanup(engine)
+        self._unwrap()
+        if self.file_path is not None:
+            self.recording.save(self.file_path)
+
+
+class CombatReplayer(CombatTape):
+    replaying = True
+
+    def __init__(self, recording: Recording):
+        super().__init__(recording)
+        self._next_choice = 0
+        self._prompt: AwaitInput | None = None
+
+    def attach(self, engine: Engine, speed: float = 1.0) -> CombatReplayer:
+        """
+        Sets the engine up with the recorded guild and dungeon, ready for init_combat.
+        The speed scales how quickly the combat scene steps through events.
+        """
+        recording = self.recording
+        engine.game_state = GameState(engine)
+        engine.game_state.guild = GameStateLoaders.guild_from_dict(
+            copy(recording.guild)
+        )
+        engine.game_state.set_entity_pool(RecruitmentPool(0))
+        engine.game_state.set_dungeon(recording.dungeon.build())
+        engine.time_scale = speed
+        engine.tape = self
+
+        return self
+
+    def after_publish(self, event: Event):
+        if (prompt := _prompt_in(event)) is not None:
+            self.prompts += 1
+            self._prompt = prompt
+
+    def on_step(self):
+        # Recorded choices are confirmed last, overriding whatever the AI decided
+        if self._prompt is not None:
+            self._confirm_recorded_choices(self._prompt)
+            self._prompt = None
+
+        super().on_step()
+
+    def _confirm_recorded_choices(self, prompt: AwaitInput):
+        room = prompt.fighter.encounter_context.get()
+        choices = self.recording.choices
+        confirmed = False
+        while (
+            self._next_choice < len(choices)
+            and choices[self._next_choice].prompt == self.prompts
+        ):
+            choice = choices[self._next_choice]
+            self._next_choice += 1
+            on_confirm = prompt.choices[choice.action][choice.option]["on_confirm"]
+            on_confirm(*(_decode_arg(arg, room) for arg in choice.args))
+            confirmed = True
+
+        if not confirmed and not prompt.fighter.owner.ai:
+            raise ReplayDivergedError(
+                f"No recorded choice for input request {self.prompts} "
+                f"from {prompt.fighter.owner.name}"
+            )
+
+    def on_cleanup(self, engine: Engine):
+        super().on_cleanup(engine)
+        engine.time_scale = 1.0
+
+    def run(self, engine: Engine) -> int:
+        """
+        Plays the whole recording out headlessly.
+
+        Returns:
+            int: the number of combat steps taken.
+        """
+        engine.init_combat()
+        while engine.next_combat_event():
+            pass
+
+        return self.steps
+
+
+class ReplayCommand(metaclass=CommandMeta):
+    name = "replay"
+
+    @staticmethod
+    def run(*args):
+        """
+        Usage: python cli.py replay <recording>
+
+        Replays a recorded combat headlessly and reports how long it took.
+        """
+        from src.engine.engine import Engine
+
+        config.HEADLESS = True
+        engine = Engine()
+        replayer = CombatReplayer(Recording.load(Path(args[1]))).attach(engine)
+
+        start = time.perf_counter()
+        steps = replayer.run(engine)
+        elapsed = time.perf_counter() - start
+
+        print("\n".join(engine.recent_messages(5)))
+        print(
+            f"Replayed {steps} steps in {elapsed:.3f}s ({steps / elapsed:.0f} steps/s)"
+        )
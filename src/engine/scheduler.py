@@ -0,0 +1,85 @@
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Generator
+
+Task = Generator[Future | None, None, Any]
+
+
+class Scheduler:
+    """
+    Runs generator tasks cooperatively. Each next() of a task is one slice of its work,
+    and tasks take turns a slice at a time until the time budget for the call is spent.
+    Whatever is left over carries on from where it stopped on the next call, so a heavy
+    task is spread over several frames instead of stalling one.
+
+    A task can also yield a Future for work done elsewhere, e.g. on a worker thread. The
+    task is parked, and skipped over, until the future is done.
+    """
+
+    def __init__(self):
+        self._tasks: deque[Task] = deque()
+        self._waiting_on: dict[Task, Future] = {}
+
+    def spawn(self, task: Task) -> Task:
+        self._tasks.append(task)
+        return task
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._tasks)
+
+    def run(self, budget_ms: float | None = None) -> int:
+        """
+        Runs slices of the pending tasks in turn. At least one slice is run, if there are
+        any tasks, so that work always makes progress however small the budget.
+
+        Args:
+            budget_ms (float | None): stop once this much time has elapsed.
+
+        Returns:
+            int: the number of slices run.
+        """
+        tasks = self._tasks
+        deadline = None
+        if budget_ms is not None:
+            deadline = time.perf_counter() + budget_ms / 1000
+
+        slices = 0
+        parked = 0
+        while tasks and parked < len(tasks):
+            task = tasks.popleft()
+            if (future := self._waiting_on.get(task)) is not None:
+                if not future.done():
+                    tasks.append(task)
+                    parked += 1
+                    continue
+                del self._waiting_on[task]
+
+            parked = 0
+            try:
+                waiting_on = next(task)
+            except StopIteration:
+                pass
+            else:
+                if waiting_on is not None:
+                    self._waiting_on[task] = waiting_on
+                tasks.append(task)
+
+            slices += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        return slices
+
+    def run_until_idle(self) -> int:
+        """
+        Runs every task to completion, blocking on the futures they wait for.
+        """
+        slices = 0
+        while self._tasks:
+            slices += self.run()
+            if self._waiting_on:
+                wait([*self._waiting_on.values()], return_when=FIRST_COMPLETED)
+
+        return slices
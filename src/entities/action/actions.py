@@ -54,6 +54,57 @@ class ActionMeta(type):
     def all_available_to(cls, fighter: Fighter) -> list[dict]:
         raise NotImplementedError()
 
+    def menu_stamp(cls, fighter: Fighter) -> tuple:
+        """
+        Everything the fighter's options for this action are built from. The options are
+        only rebuilt when the stamp changes.
+        """
+        return (cls.cost(fighter),)
+
+
+class ActionMenu:
+    """
+    The choices offered to a fighter when it's asked to act, cached between requests.
+    Each action's options are kept with the stamp they were built from, and only the
+    actions whose stamp has changed are rebuilt.
+
+    The option dicts are shared between requests, so must be treated as read-only. Each
+    request gets its own lists of them.
+    """
+
+    def __init__(self, fighter: Fighter):
+        self.fighter = fighter
+        self._action_options: tuple[ActionMeta, ...] = ()
+        self._ordered: list[ActionMeta] = []
+        self._options: dict[str, tuple[tuple, list[dict]]] = {}
+
+    def ordered(self) -> list[ActionMeta]:
+        action_options = tuple(self.fighter.action_options)
+        if action_options != self._action_options:
+            self._action_options = action_options
+            self._ordered = sorted(action_options, key=lambda action: action.menu_pos)
+
+        return self._ordered
+
+    def choices(self) -> dict[str, list[dict]]:
+        fighter = self.fighter
+        choices = {}
+        for action in self.ordered():
+            if not fighter.does(action):
+                continue
+
+            stamp = action.menu_stamp(fighter)
+            cached = self._options.get(action.name)
+            if cached is None or cached[0] != stamp:
+                cached = self._options[action.name] = (
+                    stamp,
+                    action.all_available_to(fighter),
+                )
+
+            choices[action.name] = [*cached[1]]
+
+        return choices
+
 
 class BaseAction:
     name = "BASE"
@@ -160,6 +211,10 @@ class ConsumeItemAction(BaseAction, metaclass=ActionMeta):
             for consumable in fighter.owner.inventory.consumables()
         ]
 
+    @classmethod
+    def menu_stamp(cls, fighter: Fighter) -> tuple:
+        return (cls.cost(fighter), fighter.owner.inventory.consumables())
+
     def __init__(self, fighter: Fighter, consumable: Consumable) -> None:
         self.fighter = fighter
         self.consumable = consumable
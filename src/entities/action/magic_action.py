@@ -62,6 +62,10 @@ class MagicAction(BaseAction, metaclass=ActionMeta):
             for spell in fighter.gear.weapon.available_spells
         ]
 
+    @classmethod
+    def menu_stamp(cls, fighter: Fighter) -> tuple:
+        return (cls.cost(fighter), tuple(fighter.gear.weapon.available_spells))
+
     def __init__(self, fighter: Fighter, target: Fighter, spell: Spell) -> None:
         self.fighter = fighter
         self.target = target
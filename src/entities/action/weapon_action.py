@@ -47,10 +47,15 @@ class WeaponAttackAction(BaseAction, metaclass=ActionMeta):
 
     @classmethod
     def all_available_to(cls, fighter: Fighter) -> list[dict]:
-        return [
-            cls.details(fighter, attack)
-            for attack in fighter.gear.weapon.available_attacks
-        ]
+        return [cls.details(fighter, attack) for attack in cls._attacks_of(fighter)]
+
+    @classmethod
+    def menu_stamp(cls, fighter: Fighter) -> tuple:
+        return (cls.cost(fighter), tuple(cls._attacks_of(fighter)))
+
+    @staticmethod
+    def _attacks_of(fighter: Fighter) -> list[WeaponAttackMeta]:
+        return fighter.gear.weapon.available_attacks if fighter.gear.weapon else []
 
     def __init__(
         self, fighter: Fighter, target: Fighter, attack: WeaponAttackMeta
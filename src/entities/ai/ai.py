@@ -5,25 +5,58 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.engine.engine import Engine
 
+import random
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Generator
 
-from src.entities.ai import basic_combat_ai
-from src.utils.deep_copy import copy
+from src import config
+from src.engine.events import AwaitInput
+from src.engine.scheduler import Scheduler
+from src.entities.ai import basic_combat_ai, mcts_combat_ai, utility_combat_ai
+from src.entities.ai.basic_combat_ai import Decision
+from src.entities.ai.combat_state import CombatState
+from src.entities.ai.mcts_combat_ai import Lookahead
+from src.entities.ai.snapshot import RoomSnapshot
+from src.entities.ai.utility_combat_ai import Weights
+from src.utils.deep_copy import frozen
+
+_worker: ThreadPoolExecutor | None = None
+
+
+def worker() -> ThreadPoolExecutor:
+    """
+    The thread that AI decisions are made on, started the first time it's needed.
+    A single thread keeps decisions in the order they were asked for.
+    """
+    global _worker
+    if _worker is None:
+        _worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="combat-ai")
+
+    return _worker
 
 
 class CombatAISubscriber:
-    @classmethod
-    def handle(cls, event: dict) -> None:
-        if awaiting := event.get("await_input"):
-            if ai := awaiting.owner.ai:
-                ai.choose(event)
+    """
+    Decisions are spawned as tasks on the engine's scheduler, so that a slow decision
+    can be spread over several frames. Each AI gets a frozen view of the event, since
+    the HUD and the recorder share its choices.
+    """
+
+    def __init__(self, scheduler: Scheduler):
+        self.scheduler = scheduler
+
+    def handle(self, event: AwaitInput) -> None:
+        if ai := event.fighter.owner.ai:
+            self.scheduler.spawn(ai.deliberate(frozen(event.legacy())))
 
 
 def subscribe(eng: Engine):
-    eng.static_subscribe(
-        topic="await_input",
+    # The subscriber is only referenced by the dispatcher, so it must keep a strong ref
+    eng.projection_dispatcher.static_subscribe(
+        topic=AwaitInput,
         handler_id=f"{CombatAISubscriber.__name__}.handle",
-        handler=CombatAISubscriber.handle,
+        handler=CombatAISubscriber(eng.scheduler).handle,
     )
 
 
@@ -32,6 +65,15 @@ class AiInterface(metaclass=ABCMeta):
     def choose(self, event: dict):
         ...
 
+    def deliberate(self, event: dict) -> Generator[Future | None, None, None]:
+        """
+        Makes the choice as a task that yields between steps of the decision, or yields a
+        future while the decision is made elsewhere. By default the whole choice is made
+        in one step.
+        """
+        self.choose(event)
+        yield
+
 
 class NoCombatAI(AiInterface):
     preferred_choice = "end turn"
@@ -57,6 +99,96 @@ class NoCombatAI(AiInterface):
 
 
 class BasicCombatAi(AiInterface):
+    @staticmethod
+    def snapshot(event: dict) -> RoomSnapshot:
+        # Drawn on the main thread so that the random state is used in the same order
+        # however long the worker takes
+        return RoomSnapshot.of(
+            event["await_input"], event["choices"], seed=random.getrandbits(32)
+        )
+
+    def decide(self, snapshot: RoomSnapshot) -> Decision:
+        return basic_combat_ai.decide(snapshot)
+
     def choose(self, event: dict):
-        callback = basic_combat_ai.decide(copy(event))
-        callback()
+        decision = self.decide(self.snapshot(event))
+        decision.confirm(event["choices"], event["await_input"].encounter_context.get())
+
+    def deliberate(self, event: dict) -> Generator[Future | None, None, None]:
+        """
+        The decision is made on the worker thread from a snapshot of the room, and is
+        only confirmed once it's back on the main thread.
+        """
+        future = worker().submit(self.decide, self.snapshot(event))
+        yield future
+        decision = future.result()
+        decision.confirm(event["choices"], event["await_input"].encounter_context.get())
+
+
+class UtilityCombatAi(BasicCombatAi):
+    """
+    Scores everything it could do this turn and does the best of it, see
+    utility_combat_ai. It decides from the same snapshots as the basic AI, on the same
+    worker thread.
+
+    Every candidate is checked by default, so that replays play out the same. Opting in
+    to a time budget, AI_TIME_BUDGET_MS unless one is given, trades that away for a cap
+    on how long it can take.
+    """
+
+    def __init__(
+        self,
+        weights: Weights = Weights(),
+        time_budget: float | None = None,
+        use_time_budget: bool = False,
+    ):
+        if use_time_budget and time_budget is None:
+            time_budget = config.AI_TIME_BUDGET_MS / 1000
+
+        self.weights = weights
+        self.time_budget = time_budget
+
+    def decide(self, snapshot: RoomSnapshot) -> Decision:
+        return utility_combat_ai.decide(snapshot, self.weights, self.time_budget)
+
+
+class MctsCombatAi(BasicCombatAi):
+    """
+    Plays the fight forward many times over before each action and does whatever
+    worked out best, see mcts_combat_ai. It's too slow for every enemy in the room, so
+    it's kept for bosses.
+
+    The search is bounded by its number of iterations so that replays play out the same.
+    Giving it a time budget as well trades that away for a cap on how long it can take.
+    """
+
+    def __init__(
+        self,
+        iterations: int = config.MCTS_ITERATIONS,
+        time_budget: float | None = None,
+        processes: int = config.MCTS_PROCESSES,
+    ):
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.processes = processes
+
+    @staticmethod
+    def snapshot(event: dict) -> Lookahead:
+        fighter = event["await_input"]
+        return Lookahead(
+            state=CombatState.of(fighter, event["choices"]),
+            tactical=fighter.encounter_context.get().tactical_map,
+            seed=random.getrandbits(32),
+        )
+
+    def decide(self, lookahead: Lookahead) -> Decision:
+        return mcts_combat_ai.decide(
+            lookahead, self.iterations, self.time_budget, self.processes
+        )
+
+
+AI_MODES: dict[str, type[AiInterface]] = {
+    "basic": BasicCombatAi,
+    "utility": UtilityCombatAi,
+    "mcts": MctsCombatAi,
+}
@@ -2,24 +2,42 @@ from __future__ import annotations
 
 import abc
 import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from src.entities.action.actions import ActionMeta, EndTurnAction, MoveAction
+from src.entities.action.actions import EndTurnAction, MoveAction
 from src.entities.action.weapon_action import WeaponAttackAction
-from src.entities.ai.finite_state_machine import Callback, Machine, State
-from src.entities.combat.weapon_attacks import WeaponAttackMeta
+from src.entities.ai.finite_state_machine import Machine, State
+from src.entities.ai.snapshot import CombatantView, RoomSnapshot
+from src.world.node import Node
 
 if TYPE_CHECKING:
-    from src.entities.combat.fighter import Fighter
+    from src.world.level.room import Room
 
 
-class CombatAiState(State, metaclass=abc.ABCMeta):
-    def choices_of(self, action: ActionMeta) -> list[dict]:
-        co = self.working_set.get("choices", {}).get(action.name, [])
-        return co
+class Decision(NamedTuple):
+    """
+    What the AI decided to do, in terms of the snapshot it decided on. Nothing is done
+    until it is confirmed against the live choices, back on the main thread.
+    """
+
+    action: str
+    option: int = 0
+    destination: Node | None = None
+    target: int | None = None  # index of the target in the room's occupants
 
-    def agent(self) -> Fighter:
-        return self.working_set["await_input"]
+    def confirm(self, choices: dict[str, list[dict]], room: Room) -> Any:
+        args = []
+        if self.target is not None:
+            args.append(room.occupants[self.target].fighter)
+        if self.destination is not None:
+            args.append(self.destination)
+
+        return choices[self.action][self.option]["on_confirm"](*args)
+
+
+class CombatAiState(State, metaclass=abc.ABCMeta):
+    def snapshot(self) -> RoomSnapshot:
+        return self.working_set["snapshot"]
 
 
 class ChoosingTarget(CombatAiState):
@@ -29,25 +47,15 @@ class ChoosingTarget(CombatAiState):
     """
 
     def next_state(self) -> State | None:
-        fighter: Fighter = self.agent()
-
-        if fighter is None:
-            raise ValueError(f"{self.working_set=}")
-
-        nearest, path = fighter.locatable.nearest_entity(
-            room=fighter.encounter_context.get(),
-            entity_filter=lambda e: e.fighter.is_enemy_of(fighter),
-        )
+        nearest, path = self.snapshot().nearest_enemy()
 
-        self.working_set["default"] = self.choices_of(EndTurnAction)[0].get(
-            "on_confirm", lambda: None
-        )
+        self.working_set["default"] = Decision(EndTurnAction.name)
 
         if nearest is None:
             self.working_set["output"] = self.working_set["default"]
             return ActionChosen(self.working_set)
         else:
-            self.working_set["target"] = nearest.fighter
+            self.working_set["target"] = nearest
             self.working_set["path_to_nearest"] = path
             return ApproachingTarget(self.working_set)
 
@@ -59,27 +67,22 @@ class ApproachingTarget(CombatAiState):
     """
 
     def next_state(self) -> State | None:
-        moves = self.choices_of(MoveAction).pop()
-        fighter = self.agent()
-        enemies_in_range = fighter.locatable.entities_in_range(
-            room=fighter.encounter_context.get(),
-            max_range=fighter.gear.weapon._range,
-            entity_filter=lambda e: e.fighter.is_enemy_of(fighter),
-        )
+        snapshot = self.snapshot()
+        enemies_in_range = snapshot.enemies_in_range()
+
+        if enemies_in_range:
+            self.working_set["in_range"] = enemies_in_range
+            return ChoosingAttack(self.working_set)
 
         path = self.working_set["path_to_nearest"]
-        trimmed_path = path[: int(moves["subject"].modifiable_stats.current.speed) + 1]
+        trimmed_path = path[: snapshot.agent.speed + 1]
 
         destination = trimmed_path[-1]
-        if destination not in moves["subject"].encounter_context.get().space:
+        if destination not in snapshot.space:
             destination = trimmed_path[-2]
 
-        if enemies_in_range:
-            self.working_set["in_range"] = enemies_in_range
-            return ChoosingAttack(self.working_set)
-        else:
-            self.working_set["output"] = lambda: moves["on_confirm"](destination)
-            return ActionChosen(self.working_set)
+        self.working_set["output"] = Decision(MoveAction.name, destination=destination)
+        return ActionChosen(self.working_set)
 
 
 class ChoosingAttack(CombatAiState):
@@ -88,22 +91,19 @@ class ChoosingAttack(CombatAiState):
     """
 
     def next_state(self) -> State | None:
-        fighter: Fighter = self.agent()
-
+        snapshot = self.snapshot()
         targets_in_range = self.working_set["in_range"]
 
-        def lowest_health(target_choice: dict) -> int:
-            return target_choice.fighter.health.current
-
-        def choose_attack() -> WeaponAttackMeta:
-            atk_id = random.randint(0, len(fighter.gear.weapon.available_attacks) - 1)
-            return fighter.gear.weapon.available_attacks[atk_id]
+        def lowest_health(target: CombatantView) -> int:
+            return target.health
 
+        # The snapshot carries its own seed so the choice doesn't depend on which
+        # thread decides it, or when
+        attack_id = random.Random(snapshot.seed).randint(0, snapshot.attack_options - 1)
         ranked_targets = sorted(targets_in_range, key=lowest_health)
-        attack_details = WeaponAttackAction.details(fighter, choose_attack())
 
-        self.working_set["output"] = lambda: attack_details["on_confirm"](
-            ranked_targets[0].fighter
+        self.working_set["output"] = Decision(
+            WeaponAttackAction.name, option=attack_id, target=ranked_targets[0].index
         )
         return ActionChosen(self.working_set)
 
@@ -112,9 +112,9 @@ class ActionChosen(CombatAiState):
     def next_state(self) -> State | None:
         return None
 
-    def output(self) -> Callback | None:
+    def output(self) -> Decision | None:
         return self.working_set.get("output", self.working_set["default"])
 
 
-def decide(event) -> Callback | None:
-    return Machine(ChoosingTarget, event).run()
+def decide(snapshot: RoomSnapshot) -> Decision:
+    return Machine(ChoosingTarget, {"snapshot": snapshot}).run()
@@ -0,0 +1,315 @@
+"""
+A compact picture of a fight that can be played forward without touching the live room.
+
+Fighters, their locatables and the room are object graphs with hooks, sprites and events
+hanging off them, so they can't be cheaply copied to try things out. A CombatState holds
+just what decides a fight: where everyone is, their health, action points, damage and
+defences, and whose side they're on. It is immutable, so applying an action gives a new
+state and trying something out never needs a copy.
+
+Damage is sampled from the exact outcomes in expected_damage, which follow the same rules
+as Damage.resolve_damage. Movement is on the room's static layout, stepping around
+walls and other fighters.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from src.entities.action.weapon_action import WeaponAttackAction
+from src.entities.combat.expected_damage import DamageOutcomes, DamageProfile
+from src.world.node import Node
+from src.world.pathing.pathing_space import PathingSpace
+
+if TYPE_CHECKING:
+    from src.entities.combat.fighter import Fighter
+    from src.entities.entity import Entity
+
+
+class Unit(NamedTuple):
+    index: int  # position in the room's occupants
+    is_enemy: bool
+    location: Node  # flattened
+    hp: int
+    max_hp: int
+    ap: int
+    ap_per_turn: int
+    speed: int
+    weapon_range: int
+    defence: float
+    evasion: float
+    attack: DamageProfile | None
+
+    @property
+    def alive(self) -> bool:
+        return self.hp > 0
+
+    def gap(self, other: Unit) -> int:
+        return max(
+            abs(self.location.x - other.location.x),
+            abs(self.location.y - other.location.y),
+        )
+
+
+class Action(NamedTuple):
+    kind: str  # one of MOVE, ATTACK or END
+    destination: Node | None = None
+    target: int | None = None  # position of the target in the state's units
+
+    MOVE = "move"
+    ATTACK = "attack"
+    END = "end"
+
+
+class Rules:
+    """
+    Everything about a fight that doesn't change as it plays out. It's shared by every
+    state of the same fight, and caches each attacker's damage against each target.
+    """
+
+    def __init__(self, space: PathingSpace):
+        self.space = space
+        self._outcomes: dict[tuple[int, int], tuple[np.ndarray, np.ndarray]] = {}
+        self._neighbours: dict[Node, tuple[Node, ...]] = {}
+
+    def neighbours(self, node: Node) -> tuple[Node, ...]:
+        """
+        The nodes a step away that aren't walls, whoever might be standing in them.
+        """
+        if node not in self._neighbours:
+            self._neighbours[node] = tuple(
+                adjacent
+                for adjacent in (Node(*n[:2]) for n in node.adjacent)
+                if adjacent != node and self.space.is_pathable(adjacent)
+            )
+
+        return self._neighbours[node]
+
+    def damage(
+        self, attacker: int, target: Unit, profile: DamageProfile, rng: random.Random
+    ) -> int:
+        key = (attacker, target.index)
+        if key not in self._outcomes:
+            outcomes = DamageOutcomes.against(
+                profile, [target.defence], [target.evasion]
+            )
+            self._outcomes[key] = (outcomes.damage[0], np.cumsum(outcomes.probs[0]))
+
+        damage, cumulative = self._outcomes[key]
+        roll = rng.random() * cumulative[-1]
+        return int(damage[min(np.searchsorted(cumulative, roll), len(damage) - 1)])
+
+
+class CombatState(NamedTuple):
+    rules: Rules
+    units: tuple[Unit, ...]
+    order: tuple[int, ...]  # the units, by position, in the order they take turns
+    turn: int = 0  # position in the order of the unit whose turn it is
+
+    @classmethod
+    def of(cls, fighter: Fighter, choices: dict[str, list[dict]]) -> CombatState:
+        """
+        The fight as it stands, with the fighter about to act. The rest take their turns
+        in the order they're in the room, since the round order isn't known here.
+        """
+        room = fighter.encounter_context.get()
+        occupants = [
+            (index, occupant)
+            for index, occupant in enumerate(room.occupants)
+            if occupant.locatable and not occupant.is_dead
+        ]
+
+        units = tuple(
+            _unit_of(index, occupant, occupant is fighter.owner, choices)
+            for index, occupant in occupants
+        )
+        agent = next(i for i, (_, o) in enumerate(occupants) if o is fighter.owner)
+
+        return cls(
+            rules=Rules(room.tactical_map.space),
+            units=units,
+            order=(agent, *(i for i in range(len(units)) if i != agent)),
+        )
+
+    @property
+    def current(self) -> Unit:
+        return self.units[self.order[self.turn]]
+
+    def winner(self) -> bool | None:
+        """
+        Whether the enemies or the mercenaries have won, or None if neither has yet.
+        """
+        standing = {unit.is_enemy for unit in self.units if unit.alive}
+        if len(standing) == 1:
+            return standing.pop()
+
+        return None
+
+    def team_hp(self, is_enemy: bool) -> tuple[int, int]:
+        team = [unit for unit in self.units if unit.is_enemy is is_enemy]
+        return sum(max(u.hp, 0) for u in team), sum(u.max_hp for u in team)
+
+    def enemies_of(self, unit: Unit) -> list[int]:
+        return [
+            i
+            for i, other in enumerate(self.units)
+            if other.alive and other.is_enemy is not unit.is_enemy
+        ]
+
+    def occupied(self) -> set[Node]:
+        return {unit.location for unit in self.units if unit.alive}
+
+    def legal_actions(self) -> list[Action]:
+        unit = self.current
+        actions = [Action(Action.END)]
+        if unit.ap <= 0 or self.winner() is not None:
+            return actions
+
+        enemies = self.enemies_of(unit)
+        if unit.attack is not None:
+            actions.extend(
+                Action(Action.ATTACK, target=i)
+                for i in enemies
+                if unit.gap(self.units[i]) <= unit.weapon_range
+            )
+
+        # Closing in on each of the nearest few enemies covers the moves worth making
+        nearest = sorted(enemies, key=lambda i: unit.gap(self.units[i]))[:3]
+        destinations = {self.step_towards(unit, self.units[i]) for i in nearest}
+        actions.extend(
+            Action(Action.MOVE, destination=destination)
+            for destination in sorted(destinations - {unit.location})
+        )
+
+        return actions
+
+    def step_towards(self, unit: Unit, target: Unit) -> Node:
+        """
+        Where the unit gets to walking straight at the target for a turn's move, going
+        around anything in the way a step at a time.
+        """
+        occupied = self.occupied()
+        location = unit.location
+        tx, ty = target.location.x, target.location.y
+        for _ in range(unit.speed):
+            if max(abs(location.x - tx), abs(location.y - ty)) <= unit.weapon_range:
+                break
+
+            options = [
+                node for node in self.rules.neighbours(location) if node not in occupied
+            ]
+            if not options:
+                break
+
+            location = min(options, key=lambda n: (n.x - tx) ** 2 + (n.y - ty) ** 2)
+
+        return location
+
+    def apply(self, action: Action, rng: random.Random) -> CombatState:
+        unit = self.current
+        units = list(self.units)
+        position = self.order[self.turn]
+
+        match action.kind:
+            case Action.MOVE:
+                units[position] = unit._replace(
+                    location=action.destination, ap=unit.ap - 1
+                )
+            case Action.ATTACK:
+                target = units[action.target]
+                damage = self.rules.damage(unit.index, target, unit.attack, rng)
+                units[action.target] = target._replace(hp=target.hp - damage)
+                # An attack uses up the rest of the turn's action points
+                units[position] = unit._replace(ap=0)
+            case _:
+                units[position] = unit._replace(ap=0)
+
+        state = self._replace(units=tuple(units))
+        if state.current.ap <= 0:
+            state = state.next_turn()
+
+        return state
+
+    def next_turn(self) -> CombatState:
+        state = self
+        for _ in range(len(self.order)):
+            turn = (state.turn + 1) % len(state.order)
+            state = state._replace(turn=turn)
+            unit = state.current
+            if unit.alive:
+                units = list(state.units)
+                units[state.order[turn]] = unit._replace(ap=unit.ap_per_turn)
+                return state._replace(units=tuple(units))
+
+        return state
+
+    def rollout_action(self) -> Action:
+        """
+        A quick, sensible move for playing the fight out: hit the weakest enemy in
+        reach, otherwise close in on the nearest.
+        """
+        unit = self.current
+        if unit.ap <= 0:
+            return Action(Action.END)
+
+        enemies = self.enemies_of(unit)
+        if not enemies:
+            return Action(Action.END)
+
+        if unit.attack is not None:
+            in_reach = [
+                i for i in enemies if unit.gap(self.units[i]) <= unit.weapon_range
+            ]
+            if in_reach:
+                return Action(
+                    Action.ATTACK, target=min(in_reach, key=lambda i: self.units[i].hp)
+                )
+
+        nearest = min(enemies, key=lambda i: unit.gap(self.units[i]))
+        destination = self.step_towards(unit, self.units[nearest])
+        if destination == unit.location:
+            return Action(Action.END)
+
+        return Action(Action.MOVE, destination=destination)
+
+
+def _unit_of(
+    index: int, occupant: Entity, is_agent: bool, choices: dict[str, list[dict]]
+) -> Unit:
+    fighter = occupant.fighter
+    weapon = fighter.gear.weapon
+    ap = fighter.action_points
+    return Unit(
+        index=index,
+        is_enemy=fighter.is_enemy,
+        location=Node(*occupant.locatable.location[:2]),
+        hp=fighter.health.current,
+        max_hp=fighter.health.max_hp,
+        ap=ap.current if is_agent else ap.per_turn,
+        ap_per_turn=ap.per_turn,
+        speed=int(fighter.modifiable_stats.current.speed),
+        weapon_range=weapon._range if weapon else 0,
+        defence=fighter.modifiable_stats.current.defence,
+        evasion=fighter.gear.modifiable_equipped_stats.current.evasion,
+        attack=_attack_of(fighter, choices if is_agent else None),
+    )
+
+
+def _attack_of(fighter: Fighter, choices: dict[str, list[dict]] | None):
+    if choices is not None:
+        attacks = [
+            option["subject"] for option in choices.get(WeaponAttackAction.name, [])
+        ]
+    else:
+        attacks = fighter.gear.weapon.available_attacks if fighter.gear.weapon else []
+
+    for attack in attacks[:1]:
+        try:
+            return DamageProfile.of(attack)
+        except TypeError:
+            return None
+
+    return None
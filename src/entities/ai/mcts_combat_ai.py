@@ -0,0 +1,213 @@
+"""
+Monte Carlo tree search over a CombatState, for fighters worth thinking harder about.
+
+Each iteration plays the fight forward from the current state: down the tree by UCT,
+adding one new action, then on for a few more actions with a quick rollout policy, and
+scores how it went. The tree is open loop, holding actions rather than states, since
+damage is random and the same actions can lead to different places. The action most
+often taken from the root is the one chosen.
+
+A search is deterministic for a given seed and number of iterations. A time budget caps
+how long a search can take, at the cost of that determinism. Given more than one
+process, the iterations are split between independent searches in a process pool and
+their counts added up, which stays deterministic for the same number of processes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from src.entities.action.actions import EndTurnAction, MoveAction
+from src.entities.action.weapon_action import WeaponAttackAction
+from src.entities.ai.basic_combat_ai import Decision
+from src.entities.ai.combat_state import Action, CombatState
+from src.world.level.tactical_map import TacticalMap
+
+_pool: ProcessPoolExecutor | None = None
+_pool_processes = 0
+
+
+def pool(processes: int) -> ProcessPoolExecutor:
+    """
+    The processes that searches are split between, started the first time they're
+    needed and kept for later searches. Asking for a different number of processes
+    replaces the pool.
+    """
+    global _pool, _pool_processes
+    if _pool is not None and _pool_processes != processes:
+        shutdown_pool()
+
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=processes)
+        _pool_processes = processes
+
+    return _pool
+
+
+@atexit.register
+def shutdown_pool():
+    global _pool, _pool_processes
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool, _pool_processes = None, 0
+
+
+class Lookahead(NamedTuple):
+    state: CombatState
+    tactical: TacticalMap  # only used to check the chosen attack can really be made
+    seed: int
+
+
+class SearchNode:
+    __slots__ = ("action", "enemy_moved", "children", "untried", "visits", "value")
+
+    def __init__(self, action: Action | None, enemy_moved: bool):
+        self.action = action
+        self.enemy_moved = enemy_moved  # whose side took the action
+        self.children: list[SearchNode] = []
+        self.untried: list[Action] | None = None
+        self.visits = 0
+        self.value = 0.0  # total reward, for the side that took the action
+
+    def ucb(self, parent_visits: int, exploration: float) -> float:
+        exploit = self.value / self.visits
+        return exploit + exploration * math.sqrt(math.log(parent_visits) / self.visits)
+
+
+def score(state: CombatState) -> float:
+    """
+    How well the fight is going for the enemies, from 0 to 1.
+    """
+    winner = state.winner()
+    if winner is not None:
+        return float(winner)
+
+    enemy_hp, enemy_max = state.team_hp(is_enemy=True)
+    merc_hp, merc_max = state.team_hp(is_enemy=False)
+    enemy_loss = 1 - enemy_hp / max(enemy_max, 1)
+    merc_loss = 1 - merc_hp / max(merc_max, 1)
+    return 0.5 + 0.5 * (merc_loss - enemy_loss)
+
+
+def search(
+    state: CombatState,
+    iterations: int,
+    seed: int,
+    budget: float | None = None,
+    horizon: int = 20,
+    exploration: float = 1.4,
+) -> dict[Action, int]:
+    """
+    Returns:
+        dict: how many times each action was tried from the state.
+    """
+    rng = random.Random(seed)
+    deadline = None if budget is None else time.perf_counter() + budget
+    root = SearchNode(None, state.current.is_enemy)
+
+    for iteration in range(iterations):
+        if iteration and deadline is not None and time.perf_counter() > deadline:
+            break
+
+        _iterate(root, state, rng, horizon, exploration)
+
+    return {child.action: child.visits for child in root.children}
+
+
+def _iterate(
+    root: SearchNode,
+    state: CombatState,
+    rng: random.Random,
+    horizon: int,
+    exploration: float,
+) -> None:
+    node, path = root, [root]
+    while state.winner() is None:
+        if node.untried is None:
+            node.untried = state.legal_actions()
+
+        if node.untried:
+            child = SearchNode(node.untried.pop(), state.current.is_enemy)
+            node.children.append(child)
+            state = state.apply(child.action, rng)
+            path.append(child)
+            break
+
+        # The same actions can lead to different states, so not every child is
+        # possible every time
+        legal = set(state.legal_actions())
+        options = [child for child in node.children if child.action in legal]
+        if not options:
+            break
+
+        node = max(options, key=lambda c: c.ucb(node.visits, exploration))
+        state = state.apply(node.action, rng)
+        path.append(node)
+
+    for _ in range(horizon):
+        if state.winner() is not None:
+            break
+        state = state.apply(state.rollout_action(), rng)
+
+    reward = score(state)
+    for visited in path:
+        visited.visits += 1
+        visited.value += reward if visited.enemy_moved else 1 - reward
+
+
+def parallel_search(
+    state: CombatState,
+    iterations: int,
+    seed: int,
+    processes: int,
+    budget: float | None = None,
+) -> dict[Action, int]:
+    share, remainder = divmod(iterations, processes)
+    futures = [
+        pool(processes).submit(search, state, share + (i < remainder), seed + i, budget)
+        for i in range(processes)
+    ]
+
+    visits: dict[Action, int] = {}
+    for future in futures:
+        for action, count in future.result().items():
+            visits[action] = visits.get(action, 0) + count
+
+    return visits
+
+
+def decide(
+    lookahead: Lookahead,
+    iterations: int,
+    budget: float | None = None,
+    processes: int = 0,
+) -> Decision:
+    state = lookahead.state
+    if processes > 1:
+        visits = parallel_search(state, iterations, lookahead.seed, processes, budget)
+    else:
+        visits = search(state, iterations, lookahead.seed, budget)
+
+    agent = state.current
+    for action in sorted(visits, key=visits.get, reverse=True):
+        match action.kind:
+            case Action.MOVE:
+                return Decision(
+                    MoveAction.name,
+                    destination=state.rules.space.strategy.to_level_position(
+                        action.destination
+                    ),
+                )
+            case Action.ATTACK:
+                target = state.units[action.target]
+                path = lookahead.tactical.path(agent.location, target.location)
+                # Only the first attack option is searched
+                if path is not None and len(path) <= agent.weapon_range + 1:
+                    return Decision(WeaponAttackAction.name, target=target.index)
+
+    return Decision(EndTurnAction.name)
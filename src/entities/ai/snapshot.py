@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from src.entities.action.weapon_action import WeaponAttackAction
+from src.entities.combat.expected_damage import DamageProfile
+from src.world.level.tactical_map import TacticalMap
+from src.world.node import Node
+from src.world.pathing.pathing_space import PathingSpace
+
+if TYPE_CHECKING:
+    from src.entities.combat.fighter import Fighter
+
+Path = tuple[Node, ...]
+
+
+def _profile_of(attack) -> DamageProfile | None:
+    try:
+        return DamageProfile.of(attack)
+    except TypeError:
+        return None
+
+
+class CombatantView(NamedTuple):
+    index: int  # position in the room's occupants
+    location: Node
+    is_enemy: bool
+    health: int
+    speed: int
+    weapon_range: int
+    defence: float = 0.0
+    evasion: float = 0.0
+    can_attack: bool = True  # False once a fighter unequips their weapon
+
+    def is_enemy_of(self, other: CombatantView) -> bool:
+        return self.is_enemy is not other.is_enemy
+
+
+def _view_of(index: int, fighter: Fighter) -> CombatantView:
+    weapon = fighter.gear.weapon
+    return CombatantView(
+        index=index,
+        location=fighter.locatable.location,
+        is_enemy=fighter.is_enemy,
+        health=fighter.health.current,
+        speed=int(fighter.modifiable_stats.current.speed),
+        weapon_range=weapon._range if weapon else 0,
+        defence=fighter.modifiable_stats.current.defence,
+        evasion=fighter.gear.modifiable_equipped_stats.current.evasion,
+        can_attack=weapon is not None,
+    )
+
+
+class RoomSnapshot(NamedTuple):
+    """
+    An immutable picture of a room at the moment a fighter is asked to act, holding just
+    what the AI needs to decide. Nothing in it refers back to the live entities, so it can
+    be decided on away from the main thread while the room carries on being drawn.
+    """
+
+    tactical: TacticalMap  # the room's, as it was when the snapshot was taken
+    combatants: tuple[CombatantView, ...]
+    agent: CombatantView
+    attack_options: int
+    seed: int
+    # What each of the attack options can do, where that is known
+    attack_profiles: tuple[DamageProfile | None, ...] = ()
+
+    @classmethod
+    def of(cls, fighter: Fighter, choices: dict[str, list[dict]], seed: int):
+        room = fighter.encounter_context.get()
+        combatants = tuple(
+            _view_of(index, occupant.fighter)
+            for index, occupant in enumerate(room.occupants)
+            if occupant.locatable
+        )
+
+        attacks = choices.get(WeaponAttackAction.name, [])
+        return cls(
+            tactical=room.tactical_map,
+            combatants=combatants,
+            agent=next(
+                c for c in combatants if room.occupants[c.index] is fighter.owner
+            ),
+            attack_options=len(attacks),
+            seed=seed,
+            attack_profiles=tuple(_profile_of(attack["subject"]) for attack in attacks),
+        )
+
+    @property
+    def space(self) -> PathingSpace:
+        # Never shared with the room, and never pathed on
+        return self.tactical.space
+
+    def enemies(self) -> tuple[CombatantView, ...]:
+        return tuple(
+            combatant
+            for combatant in self.combatants
+            if combatant is not self.agent and combatant.is_enemy_of(self.agent)
+        )
+
+    def path_to(self, other: CombatantView) -> Path | None:
+        return self.tactical.path(self.agent.location, other.location)
+
+    def nearest_enemy(self) -> tuple[CombatantView | None, Path | None]:
+        nearest, shortest_path = None, None
+        for enemy in self.enemies():
+            path = self.path_to(enemy)
+            if path is None:
+                continue
+
+            if shortest_path is None or len(path) < len(shortest_path):
+                nearest, shortest_path = enemy, path
+
+            # A length 2 path is a single step, nothing can be closer
+            if len(shortest_path) <= 2:
+                break
+
+        return nearest, shortest_path
+
+    def enemies_in_range(self) -> list[CombatantView]:
+        if not self.agent.can_attack:
+            return []
+
+        in_range = []
+        for enemy in self.enemies():
+            path = self.path_to(enemy)
+            if path is not None and len(path) <= self.agent.weapon_range + 1:
+                in_range.append(enemy)
+
+        return in_range
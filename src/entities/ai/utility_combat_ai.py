@@ -0,0 +1,233 @@
+"""
+An AI that weighs up everything it could do this turn, rather than following fixed steps.
+
+Every node the fighter can move to this turn comes from one distance field, and
+every (destination, target) pair is then scored at once with NumPy: the damage it can
+expect to do and how many enemies could reach it there. When there is nothing in reach
+to attack, the destinations are scored on how far they are from the fight.
+The best candidates are checked against real paths, best first, until one holds up or
+the time budget runs out.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from src.entities.action.actions import EndTurnAction, MoveAction
+from src.entities.action.weapon_action import WeaponAttackAction
+from src.entities.ai.basic_combat_ai import (ActionChosen, CombatAiState,
+                                             Decision)
+from src.entities.ai.finite_state_machine import Machine, State
+from src.entities.ai.snapshot import CombatantView, RoomSnapshot
+from src.entities.combat.expected_damage import DamageOutcomes
+from src.world.node import Node
+
+
+class Weights(NamedTuple):
+    damage: float = 1.0  # per point of expected damage
+    kill: float = 10.0  # for a certain kill
+    exposure: float = 2.0  # per enemy that could reach where the attack is made from
+    distance: float = 1.0  # per tile between the destination and the nearest enemy
+    moving: float = 0.1  # for moving at all, so that standing still wins a tie
+
+
+class Candidates(NamedTuple):
+    destinations: list[Node]  # the first is where the agent stands
+    steps: np.ndarray  # (destinations,)
+    enemies: tuple[CombatantView, ...]
+    offsets: (
+        np.ndarray
+    )  # (destinations, enemies, 2) from each destination to each enemy
+
+    @property
+    def gaps(self) -> np.ndarray:
+        # Steps apart, ignoring obstacles, since a diagonal step is still one step
+        return np.abs(self.offsets).max(axis=2)
+
+    @property
+    def distances(self) -> np.ndarray:
+        return np.hypot(self.offsets[..., 0], self.offsets[..., 1])
+
+
+class UtilityAiState(CombatAiState):
+    def weights(self) -> Weights:
+        return self.working_set["weights"]
+
+    def out_of_time(self) -> bool:
+        deadline = self.working_set["deadline"]
+        return deadline is not None and time.perf_counter() > deadline
+
+
+class GeneratingCandidates(UtilityAiState):
+    def next_state(self) -> State | None:
+        snapshot = self.snapshot()
+        self.working_set["default"] = Decision(EndTurnAction.name)
+
+        enemies = snapshot.enemies()
+        if not enemies:
+            return ActionChosen(self.working_set)
+
+        agent = snapshot.agent
+        field = snapshot.tactical.distance_field(agent.location, agent.speed)
+        destinations = [*field]
+
+        here = np.array([node[:2] for node in destinations])
+        there = np.array([enemy.location[:2] for enemy in enemies])
+        self.working_set["candidates"] = Candidates(
+            destinations=destinations,
+            steps=np.array([*field.values()]),
+            enemies=enemies,
+            offsets=there[None, :, :] - here[:, None, :],
+        )
+        return ScoringCandidates(self.working_set)
+
+
+class ScoringCandidates(UtilityAiState):
+    def next_state(self) -> State | None:
+        snapshot, weights = self.snapshot(), self.weights()
+        candidates: Candidates = self.working_set["candidates"]
+        gaps, enemies = candidates.gaps, candidates.enemies
+
+        # How many enemies could get to each destination and hit it next turn. This only
+        # counts against attacks, otherwise nobody would ever close in on anybody.
+        exposure = snapshot.tactical.threat(enemies, candidates.destinations)
+        moving = weights.moving * (candidates.steps > 0)
+
+        attack_value, best_option = self.attack_values(snapshot, enemies)
+        in_range = (gaps <= snapshot.agent.weapon_range) & snapshot.agent.can_attack
+        attacks = np.where(in_range, attack_value[None, :], -np.inf)
+        attacks -= (weights.exposure * exposure + moving)[:, None]
+        # Straight line distance, so that a step that closes in diagonally beats standing
+        # still, even when it's the same number of steps away
+        approaches = -weights.distance * candidates.distances.min(axis=1) - moving
+
+        self.working_set["scores"] = np.concatenate([attacks.ravel(), approaches])
+        self.working_set["best_option"] = best_option
+        return ChoosingCandidate(self.working_set)
+
+    def attack_values(
+        self, snapshot: RoomSnapshot, enemies: tuple[CombatantView, ...]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The value of attacking each enemy with the best of the attack options, and which
+        option that is. Enemies can't be attacked at all if no option is known.
+        """
+        weights = self.weights()
+        defence = [enemy.defence for enemy in enemies]
+        evasion = [enemy.evasion for enemy in enemies]
+        health = [enemy.health for enemy in enemies]
+
+        values = np.full((max(snapshot.attack_options, 1), len(enemies)), -np.inf)
+        for option, profile in enumerate(snapshot.attack_profiles):
+            if profile is None:
+                continue
+
+            outcomes = DamageOutcomes.against(profile, defence, evasion)
+            values[option] = weights.damage * outcomes.expected
+            values[option] += weights.kill * outcomes.kill_chance(health)
+
+        return values.max(axis=0), values.argmax(axis=0)
+
+
+class ChoosingCandidate(UtilityAiState):
+    """
+    Works down the candidates from the best, until one is confirmed by pathing. Attacks
+    must have a path to their target that is within range, and approaches must actually
+    get closer to the nearest enemy. At least one candidate is always checked, however
+    short the time budget.
+    """
+
+    def next_state(self) -> State | None:
+        candidates: Candidates = self.working_set["candidates"]
+        scores: np.ndarray = self.working_set["scores"]
+        attack_count = candidates.gaps.size
+
+        for index in np.argsort(-scores, kind="stable").tolist():
+            if not np.isfinite(scores[index]):
+                break
+
+            if index < attack_count:
+                destination, enemy = divmod(index, len(candidates.enemies))
+                decision = self.attack(destination, enemy)
+            else:
+                decision = self.approach(index - attack_count)
+
+            if decision is not None:
+                self.working_set["output"] = decision
+                break
+
+            if self.out_of_time():
+                break
+
+        return ActionChosen(self.working_set)
+
+    def move_to(self, destination: int) -> Decision:
+        candidates: Candidates = self.working_set["candidates"]
+        node = candidates.destinations[destination]
+        return Decision(
+            MoveAction.name,
+            destination=self.snapshot().space.strategy.to_level_position(node),
+        )
+
+    def attack(self, destination: int, enemy: int) -> Decision | None:
+        snapshot = self.snapshot()
+        candidates: Candidates = self.working_set["candidates"]
+        target = candidates.enemies[enemy]
+
+        start = candidates.destinations[destination]
+        path = snapshot.tactical.path(start, target.location)
+        if path is None or len(path) > snapshot.agent.weapon_range + 1:
+            return None
+
+        if destination != 0:
+            return self.move_to(destination)
+
+        return Decision(
+            WeaponAttackAction.name,
+            option=int(self.working_set["best_option"][enemy]),
+            target=target.index,
+        )
+
+    def approach(self, destination: int) -> Decision | None:
+        if destination == 0:
+            return self.working_set["default"]
+
+        snapshot = self.snapshot()
+        candidates: Candidates = self.working_set["candidates"]
+        nearest = candidates.enemies[int(candidates.distances[destination].argmin())]
+
+        closer = snapshot.tactical.path(
+            candidates.destinations[destination], nearest.location
+        )
+        if closer is None:
+            return None
+
+        current = snapshot.path_to(nearest)
+        if current is not None and len(closer) >= len(current):
+            return None
+
+        return self.move_to(destination)
+
+
+def decide(
+    snapshot: RoomSnapshot, weights: Weights = Weights(), budget: float | None = None
+) -> Decision:
+    """
+    Args:
+        snapshot (RoomSnapshot): the room to decide in.
+        weights (Weights): how much each consideration counts for.
+        budget (float | None): seconds to spend checking candidates, or None to check
+            as many as it takes. Only set a budget for fighters that aren't replayed,
+            since it makes the decision depend on how fast the machine is.
+
+    Returns:
+        Decision: what to do, to be confirmed against the live choices.
+    """
+    deadline = None if budget is None else time.perf_counter() + budget
+    return Machine(
+        GeneratingCandidates,
+        {"snapshot": snapshot, "weights": weights, "deadline": deadline},
+    ).run()
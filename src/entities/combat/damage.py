@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING, Any, Generator
+from typing import TYPE_CHECKING, Any, Generator, NamedTuple
 
 from src.engine.events_enum import EventTopic
 
@@ -12,10 +12,23 @@ if TYPE_CHECKING:
 Event = dict[str, Any]
 
 
+class DamageResult(NamedTuple):
+    evaded: bool
+    crit: bool = False
+    mitigation: float = 0.0
+    final_damage: float = 0
+
+    @property
+    def damage(self) -> int:
+        return int(self.final_damage)
+
+
 class Damage:
     raw_damage: int = 0
     final_damage: int = 0
     originator: Fighter
+    max_mitigation: float = 0.4
+    damage_fallthrough: float = 0.8
 
     def __init__(
         self, originator, raw_damage, crit_chance, damage_type="physical"
@@ -26,26 +39,99 @@ class Damage:
         self.crit_chance = crit_chance
         self.final_damage = 0
 
-    def resolve_damage(self, target: Entity) -> Generator[Event, None, None]:
-        yield from self._attack_message(target)
-        result = {}
+    def resolve_damage(
+        self, target: Entity, narrated: bool = True
+    ) -> Generator[Event, None, None]:
+        """
+        Unless narrated, the messages describing the blow are left out. An empty event
+        takes the place of each, so combat takes the same steps either way.
+        """
+        if narrated:
+            yield from self._attack_message(target)
+            yield from self._narrate(target, self.roll(target))
+            return
+
+        if self._announces_attack():
+            yield {}
 
+        result = self.roll(target)
+        if result.evaded:
+            yield {}
+            return
+
+        yield {}
+        yield {}
+        yield self.apply(target, result)
+
+    def roll(self, target: Entity) -> DamageResult:
+        """
+        Rolls for evasion and crits, and works out how much damage gets through the
+        target's defence. Nothing is done to the target until the result is applied.
+        """
         # evasion % chance to completely evade
         if (
             random.randint(0, 100)
             <= target.fighter.gear.modifiable_equipped_stats.current.evasion * 100
         ) and self.damage_type == "physical":
             self.final_damage = 0
-            message = f"{target.name} evaded the attack!\n"
-            result.update({EventTopic.MESSAGE: message})
+            return DamageResult(evaded=True)
+
+        crit = random.randint(1, 100) <= self.crit_chance
+        if crit:
+            self.raw_damage *= 2
+
+        mitigation = self._mitigation(
+            max_mitigation=self.max_mitigation,
+            damage_fallthrough=self.damage_fallthrough,
+            defence=target.fighter.modifiable_stats.current.defence,
+        )
+        self.final_damage = (1 - mitigation) * self.raw_damage
+
+        return DamageResult(
+            evaded=False,
+            crit=crit,
+            mitigation=mitigation,
+            final_damage=self.final_damage,
+        )
+
+    def apply(self, target: Entity, result: DamageResult) -> Event:
+        if target.fighter.health.current - result.final_damage <= 0:
+            # If the attack will kill, we will no longer be "in combat" until the next attack.
+            self.originator.in_combat = False
+
+        damage_details = target.fighter.take_damage(result.damage)
+        if damage_details.get("emit_exp", None):
+            dungeon = self.originator.encounter_context.get().dungeon
+            dungeon.loot._team_xp_to_be_awarded.append(damage_details["emit_exp"])
+
+        return damage_details
 
-            yield result
+    def _narrate(
+        self, target: Entity, result: DamageResult
+    ) -> Generator[Event, None, None]:
+        if result.evaded:
+            yield {EventTopic.MESSAGE: f"{target.name} evaded the attack!\n"}
             return
 
-        # Resolve Damage if not evaded.
-        yield from self._critical_confirm()
-        yield from self._damage_reduction_by_defense(target)
-        yield from self._final_resolved_damage(target)
+        yield {EventTopic.MESSAGE: "CRITICAL!" if result.crit else ""}
+
+        mitigation_percent = f"{result.mitigation * 100:.2f}"
+        yield {
+            EventTopic.MESSAGE: f"{target.name}'s defence reduced the damage by {mitigation_percent}%!\n"
+        }
+
+        # The damage is only done once the messages leading up to it have been seen
+        yield {
+            EventTopic.MESSAGE: f"{target.name} takes {result.damage} damage!\n",
+            **self.apply(target, result),
+        }
+
+    def _announces_attack(self) -> bool:
+        # Whether _attack_message has anything to say
+        if self.damage_type == "magic":
+            return False
+
+        return self.originator.gear.weapon.attack_verb in ("melee", "ranged")
 
     def _attack_message(self, target) -> Event:
         if self.damage_type == "magic":
@@ -63,50 +149,8 @@ class Damage:
                 EventTopic.MESSAGE: f"{originator_name} shoots at {target_name} with their {weapon.name}\n"
             }
 
-    def _critical_confirm(self):
-        message = ""
-        if random.randint(1, 100) <= self.crit_chance:
-            self.raw_damage *= 2
-            yield {EventTopic.MESSAGE: "CRITICAL!"}
-
-        else:
-            yield {EventTopic.MESSAGE: message}
-
-    def _damage_reduction_by_defense(
-        self, target: Entity
-    ) -> Generator[Event, None, None]:
-        mitigation = self._mitigation(
-            max_mitigation=0.4,
-            damage_fallthrough=0.8,
-            defence=target.fighter.modifiable_stats.current.defence,
-        )
-        self.final_damage = (1 - mitigation) * self.raw_damage
-        mitigation_percent = f"{mitigation * 100:.2f}"
-        message = (
-            f"{target.name}'s defence reduced the damage by {mitigation_percent}%!\n"
-        )
-
-        yield {EventTopic.MESSAGE: message}
-
-    def _final_resolved_damage(self, target: Entity):
-        result = {}
-        damage = int(self.final_damage)
-        message = f"{target.name} takes {damage} damage!\n"
-        result.update({EventTopic.MESSAGE: message})
-
-        if target.fighter.health.current - self.final_damage <= 0:
-            # If the attack will kill, we will no longer be "in combat" until the next attack.
-            self.originator.in_combat = False
-
-        damage_details = target.fighter.take_damage(damage)
-        if damage_details.get("emit_exp", None):
-            dungeon = self.originator.encounter_context.get().dungeon
-            dungeon.loot._team_xp_to_be_awarded.append(damage_details["emit_exp"])
-
-        result.update(**damage_details)
-        yield result
-
+    @staticmethod
     def _mitigation(
-        self, max_mitigation: float, damage_fallthrough: float, defence: int
+        max_mitigation: float, damage_fallthrough: float, defence: int
     ) -> float:
         return max_mitigation * (1 - damage_fallthrough**defence)
@@ -0,0 +1,161 @@
+"""
+Exact damage outcomes, worked out rather than sampled.
+
+A DamageProfile describes what an attack or spell does before the target is taken into
+account: the distribution of its raw damage, its chance to crit, and whether the
+target's evasion and defence apply. DamageOutcomes then applies the same rules as
+Damage.resolve_damage to a whole array of targets at once, giving every possible amount
+of damage with its probability for each target.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple, Sequence
+
+import numpy as np
+
+from src.entities.combat.damage import Damage
+from src.entities.combat.weapon_attacks import NormalAttack
+from src.entities.magic.spells import Fireball, MagicMissile
+from src.utils.dice import Const, D, Die, Distribution, Mul
+
+if TYPE_CHECKING:
+    from src.entities.combat.fighter import Fighter
+    from src.entities.entity import Entity
+
+
+def evade_chance(evasion: np.ndarray) -> np.ndarray:
+    # The attack is evaded when randint(0, 100) <= evasion * 100
+    evading_rolls = np.floor(np.asarray(evasion, dtype=np.float64) * 100) + 1
+    return np.clip(evading_rolls, 0, 101) / 101
+
+
+def crit_chance(crit: float) -> float:
+    # The attack crits when randint(1, 100) <= crit
+    return min(max(int(np.floor(crit)), 0), 100) / 100
+
+
+class DamageProfile(NamedTuple):
+    raw: Distribution
+    crit_chance: float = 0.0
+    evadable: bool = False
+    mitigated: bool = False
+
+    @classmethod
+    def normal_attack(
+        cls, power: float, attack_dice: int, attack_dice_faces: int, crit: float
+    ) -> DamageProfile:
+        # A single roll of the die, multiplied by the number of dice
+        roll = Mul(Const(int(attack_dice)), Die(int(attack_dice_faces)))
+        if not attack_dice_faces:
+            roll = Const(0)
+
+        return cls(
+            raw=(power + D.from_node(roll)).distribution(),
+            crit_chance=crit_chance(crit),
+            evadable=True,
+            mitigated=True,
+        )
+
+    @classmethod
+    def magic_missile(cls, damage: int) -> DamageProfile:
+        return cls(raw=Distribution.constant(damage))
+
+    @classmethod
+    def fireball(cls, min_damage: int, max_damage: int) -> DamageProfile:
+        faces = max_damage - min_damage + 1
+        return cls(raw=(min_damage - 1 + D(faces)).distribution(), mitigated=True)
+
+    @classmethod
+    def of(cls, attack: NormalAttack | MagicMissile | Fireball) -> DamageProfile:
+        match attack:
+            case NormalAttack():
+                fighter: Fighter = attack.fighter
+                weapon_stats = fighter.gear.weapon.stats
+                return cls.normal_attack(
+                    power=fighter.modifiable_stats.current.power,
+                    attack_dice=weapon_stats.attack_dice,
+                    attack_dice_faces=weapon_stats.attack_dice_faces,
+                    crit=fighter.gear.modifiable_equipped_stats.current.crit,
+                )
+            case MagicMissile():
+                return cls.magic_missile(attack._damage)
+            case Fireball():
+                return cls.fireball(attack._min_damage, attack._max_damage)
+
+        raise TypeError(f"No damage profile for {attack}")
+
+
+class DamageOutcomes(NamedTuple):
+    """
+    Row t holds every amount of damage the t'th target can take, with its probability.
+    Amounts can repeat within a row, and a row's probabilities sum to 1.
+    """
+
+    damage: np.ndarray
+    probs: np.ndarray
+
+    @classmethod
+    def against(
+        cls,
+        profile: DamageProfile,
+        defence: Sequence[float] | np.ndarray,
+        evasion: Sequence[float] | np.ndarray,
+    ) -> DamageOutcomes:
+        defence = np.asarray(defence, dtype=np.float64)
+        evasion = np.asarray(evasion, dtype=np.float64)
+        raw_values = profile.raw.values.astype(np.float64)
+        raw_probs = profile.raw.probs
+
+        # Crits double the raw damage
+        p_crit = profile.crit_chance
+        raw = np.concatenate([raw_values, raw_values * 2])
+        probs = np.concatenate([raw_probs * (1 - p_crit), raw_probs * p_crit])
+
+        mitigation = np.zeros_like(defence)
+        if profile.mitigated:
+            mitigation = Damage._mitigation(
+                max_mitigation=Damage.max_mitigation,
+                damage_fallthrough=Damage.damage_fallthrough,
+                defence=defence,
+            )
+        damage = np.trunc((1 - mitigation)[:, None] * raw[None, :])
+        probs = np.broadcast_to(probs, damage.shape)
+
+        if profile.evadable:
+            p_evade = evade_chance(evasion)[:, None]
+            damage = np.concatenate([np.zeros_like(p_evade), damage], axis=1)
+            probs = np.concatenate([p_evade, probs * (1 - p_evade)], axis=1)
+
+        return cls(damage, probs)
+
+    @classmethod
+    def against_entities(
+        cls, profile: DamageProfile, targets: Sequence[Entity]
+    ) -> DamageOutcomes:
+        return cls.against(
+            profile,
+            defence=[t.fighter.modifiable_stats.current.defence for t in targets],
+            evasion=[
+                t.fighter.gear.modifiable_equipped_stats.current.evasion
+                for t in targets
+            ],
+        )
+
+    @property
+    def expected(self) -> np.ndarray:
+        return (self.damage * self.probs).sum(axis=1)
+
+    def kill_chance(self, hp: Sequence[int] | np.ndarray) -> np.ndarray:
+        lethal = self.damage >= np.asarray(hp)[:, None]
+        return (self.probs * lethal).sum(axis=1)
+
+    def distribution(self, target: int) -> dict[int, float]:
+        outcomes: dict[int, float] = {}
+        for damage, prob in zip(
+            self.damage[target].tolist(), self.probs[target].tolist()
+        ):
+            if prob:
+                outcomes[int(damage)] = outcomes.get(int(damage), 0.0) + prob
+
+        return dict(sorted(outcomes.items()))
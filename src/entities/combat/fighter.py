@@ -4,10 +4,10 @@ from typing import TYPE_CHECKING, Any, Generator, Optional, Self
 
 import yaml
 
-from src.engine.events_enum import EventTopic
-from src.entities.action.actions import (ActionMeta, ActionPoints, BaseAction,
-                                         ConsumeItemAction, EndTurnAction,
-                                         MoveAction)
+from src.engine.events import AwaitInput, Envelope, Message, TurnEnd, TurnStart
+from src.entities.action.actions import (ActionMenu, ActionMeta, ActionPoints,
+                                         BaseAction, ConsumeItemAction,
+                                         EndTurnAction, MoveAction)
 from src.entities.action.magic_action import MagicAction
 from src.entities.action.weapon_action import WeaponAttackAction
 from src.entities.combat.archetypes import FighterArchetype
@@ -18,7 +18,6 @@ from src.entities.gear.gear import Gear
 from src.entities.item.inventory import Inventory
 from src.entities.item.inventory_item import Consumable
 from src.entities.magic.caster import Caster
-from src.entities.properties.meta_compendium import MetaCompendium
 from src.entities.sprites import AnimatedSpriteAttribute
 from src.world.node import Node
 from src.world.ray import Ray
@@ -27,7 +26,7 @@ if TYPE_CHECKING:
     from src.entities.entity import Entity
     from src.world.level.room import Room
 
-Event = dict[str, Any]
+Event = dict[str, Any] | Envelope
 
 
 class EncounterContext:
@@ -83,6 +82,7 @@ class Fighter:
         # -----State-----
         self.leveller = Leveller(owner=self)
         self.action_points = ActionPoints()
+        self.action_menu = ActionMenu(self)
         self._caster = caster
         self.on_retreat_hooks = []
         self.is_enemy = is_enemy
@@ -174,39 +174,22 @@ class Fighter:
             return False
 
     def request_action_choice(self):
-        action_types = MetaCompendium.all_actions_available_to(self)
-        choices = {}
-        for name, action_type in action_types.items():
-            if action_type == WeaponAttackAction:
-                for atk in self.gear.weapon.available_attacks:
-                    choices[name] = action_type.all_available_to(self)
-
-            elif not action_type == MagicAction:
-                choices[name] = action_type.all_available_to(self)
-
-            else:
-                for spell in self.gear.weapon.available_spells:
-                    choices[name] = action_type.all_available_to(self)
-
-        event = {}
-        if not self.is_enemy:
-            event[
-                EventTopic.MESSAGE
-            ] = f"{self.owner.name.name_and_title} requires your input milord"
-
-        yield {
-            **event,
-            "await_input": self,
-            "choices": choices,
-        }
-
-    def on_turn_start(self) -> Generator[Event]:
+        await_input = AwaitInput(fighter=self, choices=self.action_menu.choices())
+        if self.is_enemy:
+            yield Envelope.of(await_input)
+        else:
+            yield Envelope.of(
+                Message(f"{self.owner.name.name_and_title} requires your input milord"),
+                await_input,
+            )
+
+    def on_turn_start(self) -> Generator[Envelope]:
         self.action_points.on_turn_start()
         self._forfeit_turn = False
-        yield {"turn_start": self}
+        yield Envelope.of(TurnStart(self))
 
-    def on_turn_end(self) -> Generator[Event]:
-        yield {"turn_end": self}
+    def on_turn_end(self) -> Generator[Envelope]:
+        yield Envelope.of(TurnEnd(self))
 
     @property
     def in_combat(self):
@@ -284,9 +267,7 @@ class Fighter:
         if not room:
             return False
 
-        visible_nodes = Ray(eye).line_of_sight(room.space, target)
-
-        return target in visible_nodes
+        return room.tactical_map.can_see(eye, target)
 
     def line_of_sight_to(self, node: Node) -> tuple[Node]:
         room = self.encounter_context.get()
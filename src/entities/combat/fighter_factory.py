@@ -1,11 +1,14 @@
-from copy import deepcopy
-from random import randint
-from typing import Callable, NamedTuple
+from random import getrandbits, randint
+from typing import Callable, NamedTuple, Sequence
 
+import numpy as np
+
+from src import config
 from src.config.constants import merc_names
-from src.entities.ai.ai import BasicCombatAi
+from src.entities.ai.ai import AI_MODES
 from src.entities.combat.archetypes import FighterArchetype
 from src.entities.combat.fighter import Fighter
+from src.entities.combat.stat_vectors import team_stats
 from src.entities.entity import Entity, Name, Species
 from src.entities.gear.gear_factory import default_equippable_item_factory
 from src.entities.item.inventory import Inventory
@@ -54,6 +57,25 @@ class StatBlock(NamedTuple):
             "is_boss": self.is_boss,
         }
 
+    def fighter_confs(self, n: int, rng: np.random.Generator) -> list[dict]:
+        """
+        The same as n calls to fighter_conf, with every roll made in one draw.
+        """
+        low, high = zip(self.hp, self.defence, self.power)
+        rolls = rng.integers(low, high, size=(n, 3), endpoint=True).tolist()
+        return [
+            {
+                "hp": hp,
+                "defence": defence,
+                "power": power,
+                "is_enemy": self.is_enemy,
+                "role": self.role,
+                "speed": self.speed,
+                "is_boss": self.is_boss,
+            }
+            for hp, defence, power in rolls
+        ]
+
 
 _melee_mercenary_base = StatBlock(
     hp=(45, 45),
@@ -137,12 +159,28 @@ def _setup_fighter_archetypes(
     fighter.set_action_options()
 
 
+def _equip_entity(
+    entity: Entity,
+    fighter_conf: dict,
+    gear_factory: Callable[[FighterArchetype], dict],
+) -> Entity:
+    entity.fighter = Fighter(**fighter_conf).set_owner(owner=entity)
+    _setup_fighter_archetypes(entity.fighter, gear_factory)
+
+    entity.inventory = Inventory(owner=entity, capacity=1)
+
+    if not entity.fighter.is_enemy:
+        entity.inventory.add_item_to_inventory(HealingPotion(owner=entity))
+    else:
+        mode = config.BOSS_AI if entity.fighter.is_boss else config.ENEMY_AI
+        entity.ai = AI_MODES[mode]()
+
+    return entity
+
+
 def get_fighter_factory(
     stats: StatBlock, should_attach_sprites: bool = True
 ) -> Factory:
-    def _from_conf(fighter_conf: dict, entity: Entity) -> Fighter:
-        return Fighter(**fighter_conf).set_owner(owner=entity)
-
     def _create_entity(first_name, title, last_name) -> Entity:
         return Entity(
             name=Name(title=title, first_name=first_name, last_name=last_name),
@@ -155,17 +193,7 @@ def get_fighter_factory(
         entity = _create_entity(name, title, last_name)
 
         conf = stats.fighter_conf()
-
-        entity.fighter = _from_conf(conf, entity)
-        gear_factory = default_equippable_item_factory()
-        _setup_fighter_archetypes(entity.fighter, gear_factory)
-
-        entity.inventory = Inventory(owner=entity, capacity=1)
-
-        if not entity.fighter.is_enemy:
-            entity.inventory.add_item_to_inventory(HealingPotion(owner=entity))
-        else:
-            entity.ai = BasicCombatAi()
+        _equip_entity(entity, conf, default_equippable_item_factory())
 
         if should_attach_sprites:
             entity = attach_sprites(entity)
@@ -175,6 +203,43 @@ def get_fighter_factory(
     return factory
 
 
+def create_many(
+    stats: StatBlock, n: int, names: Sequence[str] | None = None
+) -> list[Entity]:
+    """
+    Makes n fighters from the stat block at once, for filling large rosters and rooms.
+    The stat and cost rolls are all made in one draw from a generator seeded from the
+    random state, the gear factory is shared, the current stats are worked out for all
+    of them at once, and the sprites are only built once they're asked for.
+
+    Args:
+        stats (StatBlock): what to make the fighters from.
+        n (int): how many to make.
+        names (Sequence[str] | None): a first name for each, or None to generate them.
+
+    Returns:
+        list[Entity]: the fighters, ready to join a roster or a room.
+    """
+    names = names or [gen_name(stats.species) for _ in range(n)]
+    if len(names) != n:
+        raise ValueError(f"Expected a name for each of the {n} fighters, got {names}")
+
+    rng = np.random.default_rng(getrandbits(64))
+    confs = stats.fighter_confs(n, rng)
+    costs = rng.integers(1, 5, size=n, endpoint=True).tolist()
+    gear_factory = default_equippable_item_factory(defer_sprites=True)
+
+    entities = []
+    for name, conf, cost in zip(names, confs, costs):
+        entity = Entity(name=Name(first_name=name), cost=cost, species=stats.species)
+        _equip_entity(entity, conf, gear_factory)
+        entities.append(attach_sprites(entity, defer=True))
+
+    # The roster shows their stats, so they're all worked out together up front
+    team_stats(entities)
+    return entities
+
+
 create_random_melee_fighter = _melee_mercenary_base.factory
 create_random_ranged_fighter = _ranged_mercenary_base.factory
 create_random_caster_fighter = _caster_mercenary_base.factory
@@ -182,6 +247,14 @@ create_random_monster = _monster.factory
 create_random_goblin = _goblin.factory
 create_random_boss = _boss.factory
 
+MONSTER_STAT_BLOCK = _monster
+GOBLIN_STAT_BLOCK = _goblin
+MERC_STAT_BLOCKS = (
+    _melee_mercenary_base,
+    _ranged_mercenary_base,
+    _caster_mercenary_base,
+)
+
 
 class RecruitmentPool:
     def __init__(self, size: int = None) -> None:
@@ -202,21 +275,28 @@ class RecruitmentPool:
             )
 
     def fill_pool(self) -> None:
-        # Create a deepcopy of name array for consuming with pop.
-        name_choices = deepcopy(merc_names)
-
-        for _ in range(self.size):
-            # iteratively pop a random name from the deepcopy array and supply the name to the factory.
+        # Copy the names for consuming with pop.
+        name_choices = [*merc_names]
+
+        # Each recruit gets a random name and archetype, then each archetype's recruits
+        # are made together, keeping their places in the pool.
+        places: list[list[int]] = [[] for _ in MERC_STAT_BLOCKS]
+        names: list[list[str]] = [[] for _ in MERC_STAT_BLOCKS]
+        for place in range(self.size):
             name = name_choices.pop(randint(0, len(name_choices) - 1))
-            match randint(0, 2):
-                case 0:
-                    self.pool.append(create_random_melee_fighter(name))
-                case 1:
-                    self.pool.append(create_random_ranged_fighter(name))
-                case 2:
-                    self.pool.append(create_random_caster_fighter(name))
-
-            # self.pool.append(create_random_fighter(name))
+            archetype = randint(0, len(MERC_STAT_BLOCKS) - 1)
+            places[archetype].append(place)
+            names[archetype].append(name)
+
+        recruits: list[Entity | None] = [None] * self.size
+        for stats, archetype_places, archetype_names in zip(
+            MERC_STAT_BLOCKS, places, names
+        ):
+            made = create_many(stats, len(archetype_names), archetype_names)
+            for place, recruit in zip(archetype_places, made):
+                recruits[place] = recruit
+
+        self.pool.extend(recruits)
 
     def show_pool(self) -> None:
         # Sanity check function
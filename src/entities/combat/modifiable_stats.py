@@ -1,3 +1,4 @@
+import functools
 from typing import Collection, Generic, Self, TypeVar
 
 _StatType = TypeVar("_StatType", bound=tuple)
@@ -86,6 +87,16 @@ class Modifier(Generic[_StatType]):
                 f"The stat class {stat_class} must have default values for all constructor arguments"
             ) from e
 
+    @classmethod
+    @functools.cache
+    def identity(cls, stat_class: type[_StatType]) -> Self:
+        """
+        The modifier that leaves stats unchanged. Modifiers are never mutated after
+        construction, so a single instance per stat class is shared by everything that
+        needs an empty modifier stack.
+        """
+        return cls(stat_class)
+
     @property
     def base(self) -> int:
         return self._base
@@ -148,26 +159,38 @@ class Modifier(Generic[_StatType]):
 
 
 class ModifiableStats(Generic[_StatType]):
+    """
+    Base stats with a stack of modifiers applied. The current stats are worked out when
+    first read after a change and cached until the next one, so the methods below are the
+    only way the base stats or modifiers should be changed.
+    """
+
     _stat_class: type[_StatType]
     _base_stats: _StatType
     _modifiers: list[Modifier]
+    _current: _StatType | None
 
     def __init__(self, stat_class: type[_StatType], base_stats: _StatType):
         self._stat_class = stat_class
         self._base_stats = base_stats
-        self._modifiers = [Modifier(self._stat_class)]
+        self._modifiers = [Modifier.identity(self._stat_class)]
+        self._current = None
 
     def update_base_stats(self, new_base: _StatType):
         self._base_stats = new_base
+        self._current = None
 
     def include_modifier(self, modifier: Modifier[_StatType]):
         self._modifiers.append(modifier)
+        self._current = None
 
     def clear_modifiers(self):
-        self._modifiers = [Modifier(self._stat_class)]
+        self._modifiers = [Modifier.identity(self._stat_class)]
+        self._current = None
 
     def set_modifiers(self, modifiers: Collection[Modifier[_StatType]]):
         self._modifiers = list(modifiers)
+        self._current = None
 
     def remove(self, modifier: Modifier[_StatType]) -> bool:
         """
@@ -180,9 +203,44 @@ class ModifiableStats(Generic[_StatType]):
         if (mod_hash := hash(modifier)) in hashes:
             idx = hashes.index(mod_hash)
             self._modifiers.pop(idx)
+            self._current = None
             return True
         return False
 
     @property
     def current(self) -> _StatType:
-        return sum(self._modifiers, Modifier(self._stat_class)).apply(self._base_stats)
+        if self._current is None:
+            self._current = self._apply_modifiers()
+
+        return self._current
+
+    @property
+    def is_cached(self) -> bool:
+        return self._current is not None
+
+    def cache_current(self, current: _StatType):
+        """
+        Caches current stats that were worked out elsewhere, like in
+        stat_vectors.current_stats, until the next change.
+        """
+        self._current = current
+
+    def _apply_modifiers(self) -> _StatType:
+        # Folds the modifiers into flat and percent vectors, which is the same as applying
+        # their sum but without making a Modifier and stat tuples for every partial sum.
+        # Like the sum, the folding starts from the identity.
+        identity = Modifier.identity(self._stat_class)
+        flat, percent = [*identity._base], [*identity._percent]
+        for modifier in self._modifiers:
+            for idx, (flat_mod, percent_mod) in enumerate(
+                zip(modifier._base, modifier._percent)
+            ):
+                flat[idx] += flat_mod
+                percent[idx] += percent_mod
+
+        modified_stats = []
+        for stat, flat_mod, percent_mod in zip(self._base_stats, flat, percent):
+            modified_base = stat + flat_mod
+            modified_stats.append(modified_base + modified_base * percent_mod / 100)
+
+        return self._stat_class(*modified_stats)
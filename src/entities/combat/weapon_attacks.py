@@ -71,7 +71,10 @@ class NormalAttack(metaclass=WeaponAttackMeta):
         self._fighter.in_combat = True
         target.fighter.in_combat = True
 
-        yield from self.fighter.gear.weapon.emit_damage().resolve_damage(target)
+        room = self._fighter.encounter_context.get()
+        yield from self.fighter.gear.weapon.emit_damage().resolve_damage(
+            target, narrated=room.narrated
+        )
 
         result.update(
             {EventTopic.ATTACK: self._fighter.owner, EventTopic.MESSAGE: message}
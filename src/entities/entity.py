@@ -1,6 +1,8 @@
-from typing import Any, Generator, NamedTuple, Optional, Self, Sequence
+from typing import (Any, Callable, Generator, NamedTuple, Optional, Self,
+                    Sequence)
 from uuid import uuid4
 
+from src.engine.events import EntityData
 from src.engine.events_enum import EventTopic
 from src.entities.ai.ai import AiInterface
 from src.entities.combat.fighter import Fighter
@@ -33,7 +35,8 @@ class Name(NamedTuple):
 
 
 class Entity:
-    entity_sprite: AnimatedSpriteAttribute | None
+    _entity_sprite: AnimatedSpriteAttribute | None
+    _sprite_builder: Callable[[], AnimatedSpriteAttribute] | None
     fighter: Fighter | None
     inventory: Inventory | None
     ai: AiInterface | None
@@ -74,7 +77,6 @@ class Entity:
         if self.fighter:
             self.fighter.owner = self
 
-        self.entity_sprite = None
         self.set_entity_sprite(sprite)
 
         self.locatable = None
@@ -92,10 +94,26 @@ class Entity:
         self.inventory = Inventory(owner=self, capacity=capacity)
         return self
 
+    @property
+    def entity_sprite(self) -> AnimatedSpriteAttribute | None:
+        if self._sprite_builder is not None:
+            self.set_entity_sprite(self._sprite_builder())
+
+        return self._entity_sprite
+
     def set_entity_sprite(self, sprite: AnimatedSpriteAttribute):
-        self.entity_sprite = sprite
-        if self.entity_sprite:
-            self.entity_sprite.owner = self
+        self._entity_sprite = sprite
+        self._sprite_builder = None
+        if self._entity_sprite:
+            self._entity_sprite.owner = self
+
+    def defer_entity_sprite(self, build: Callable[[], AnimatedSpriteAttribute]):
+        """
+        The sprite is built by calling build the first time it's asked for, so entities
+        that are never drawn never load any textures.
+        """
+        self._entity_sprite = None
+        self._sprite_builder = build
 
     def make_locatable(self, space: PathingSpace, spawn_point: Node):
         self.locatable = Locatable(
@@ -126,18 +144,16 @@ class Entity:
 
         return result
 
+    def entity_data(self) -> EntityData:
+        return EntityData(
+            health=self.fighter.health.current if self.fighter else None,
+            name=self.name.name_and_title,
+            retreat=self.fighter.retreating,
+            species=self.species,
+        )
+
     def annotate_event(self, event: dict[str, Any]) -> dict[str, Any]:
-        return {
-            **event,
-            **{
-                EventTopic.ENTITY_DATA.value: {
-                    "health": self.fighter.health.current if self.fighter else None,
-                    "name": self.name.name_and_title,
-                    "retreat": self.fighter.retreating,
-                    "species": self.species,
-                }
-            },
-        }
+        return {**event, **self.entity_data().legacy()}
 
     def die(self):
         hooks = self.on_death_hooks
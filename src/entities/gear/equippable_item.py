@@ -12,9 +12,8 @@ from src.entities.combat.stats import (EquippableItemStats, FighterStats,
 from src.entities.combat.weapon_attacks import WeaponAttackMeta
 from src.entities.magic.spells import Spell, SpellMeta
 from src.entities.properties.meta_compendium import MetaCompendium
-from src.entities.sprites import AnimatedSpriteAttribute, SimpleSpriteAttribute
-from src.gui.simple_sprite_config import choose_item_texture
-from src.textures.texture_data import SpriteSheetSpecs
+from src.entities.sprites import SimpleSpriteAttribute
+from src.gui.simple_sprite_config import SimpleSpriteConfig, choose_item_sprite
 from src.utils.dice import D
 
 if TYPE_CHECKING:
@@ -55,9 +54,6 @@ class EquippableABC(metaclass=abc.ABCMeta):
         raise NotImplementedError()
 
 
-tex = SpriteSheetSpecs.icons.load_one(108)
-
-
 class EquippableItem(EquippableABC):
     _slot: str
     _name: str
@@ -72,7 +68,10 @@ class EquippableItem(EquippableABC):
     _modifiable_stats: ModifiableStats
 
     def __init__(
-        self, owner: Fighter | None, config: EquippableItemConfig | None = None
+        self,
+        owner: Fighter | None,
+        config: EquippableItemConfig | None = None,
+        defer_sprite: bool | None = None,
     ) -> None:
         self._owner = owner
 
@@ -86,10 +85,7 @@ class EquippableItem(EquippableABC):
         self._fighter_affixes = config.fighter_affixes
         self._equippable_item_affixes = config.equippable_item_affixes
         self._stats = config.stats
-        self._sprite = SimpleSpriteAttribute(
-            path_or_texture=choose_item_texture(self), scale=6
-        )
-        self._sprite.owner = self
+        self.set_sprite_config(choose_item_sprite(self), defer=defer_sprite)
 
         self._modifiable_stats = ModifiableStats(EquippableItemStats, self._stats)
         self._available_attacks_cache = []
@@ -100,9 +96,31 @@ class EquippableItem(EquippableABC):
         return self._stats.display_stats(delim)
 
     @property
-    def sprite(self) -> AnimatedSpriteAttribute:
+    def sprite(self) -> SimpleSpriteAttribute:
+        if self._sprite is None:
+            self._sprite = self._build_sprite()
+
         return self._sprite
 
+    def _build_sprite(self) -> SimpleSpriteAttribute:
+        sprite = SimpleSpriteAttribute(
+            path_or_texture=self._sprite_config.texture, scale=6
+        )
+        sprite.owner = self
+        return sprite
+
+    def set_sprite_config(
+        self, sprite_config: SimpleSpriteConfig, defer: bool | None = None
+    ):
+        """
+        The sprite is built straight away, or the first time it's asked for when
+        deferred. Sprites are deferred when headless, unless told otherwise.
+        """
+        self._sprite_config = sprite_config
+        self._sprite = None
+        if not (config.HEADLESS if defer is None else defer):
+            self._sprite = self._build_sprite()
+
     @property
     def slot(self) -> str:
         return self._slot
@@ -62,7 +62,9 @@ class Gear:
 
     def update_stats(self, item):
         self.base_equipped_stats += item.stats
-        self.modifiable_equipped_stats._base_stats += item.stats
+        self.modifiable_equipped_stats.update_base_stats(
+            self.modifiable_equipped_stats._base_stats + item.stats
+        )
         self.modifiable_equipped_stats.set_modifiers(item.equipment_modifiers())
 
     def item_in_slot(self, slot) -> EquippableItem | None:
@@ -97,6 +99,16 @@ class Gear:
 
         self.update_stats(item)
 
+    def restore_equipped(self):
+        """
+        Re-attaches items that were hydrated directly into their slots, leaving the equipped
+        items in the same state equip_item would. The stats of hydrated items are already
+        included in base_equipped_stats, so nothing is unequipped or re-summed here.
+        """
+        for item in self.as_list():
+            item.on_equip(self.owner)
+            self.modifiable_equipped_stats.set_modifiers(item.equipment_modifiers())
+
     def unequip(self, slot: str, storage: Armory | None = None):
         if prev_item := self.item_in_slot(slot):
             prev_item.unequip()
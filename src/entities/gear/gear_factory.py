@@ -9,6 +9,7 @@ from src.entities.gear.weapons import bow, spellbook, sword
 
 def default_equippable_item_factory(
     gearset_config: dict | None = None,
+    defer_sprites: bool | None = None,
 ) -> Callable[[FighterArchetype], dict[str, EquippableItem]]:
     gearset_config = gearset_config or {
         "_weapon": {"melee": (sword,), "ranged": (bow,), "caster": (spellbook,)},
@@ -27,13 +28,19 @@ def default_equippable_item_factory(
 
         return {
             "_weapon": EquippableItem(
-                owner=None, config=random.choice(weapons[role.value])
+                owner=None,
+                config=random.choice(weapons[role.value]),
+                defer_sprite=defer_sprites,
             ),
             "_helmet": EquippableItem(
-                owner=None, config=random.choice(helmets[role.value])
+                owner=None,
+                config=random.choice(helmets[role.value]),
+                defer_sprite=defer_sprites,
             ),
             "_body": EquippableItem(
-                owner=None, config=random.choice(bodies[role.value])
+                owner=None,
+                config=random.choice(bodies[role.value]),
+                defer_sprite=defer_sprites,
             ),
         }
 
@@ -28,7 +28,8 @@ class ItemRollParams(NamedTuple):
 
 
 class DropConfig:
-    _table: dict[ItemRollParams, Generator[EquippableItem, None, None]]
+    # Each roll gets a fresh generator, so that every drop is rolled for
+    _table: dict[ItemRollParams, Callable[[], Generator[EquippableItem, None, None]]]
 
     def __init__(self, table: dict) -> None:
         self._table = table
@@ -36,8 +37,8 @@ class DropConfig:
     def __getitem__(
         self, params: ItemRollParams
     ) -> Generator[EquippableItem, None, None]:
-        drops = self._table.get(params, (_ for _ in range(0)))
-        yield from drops
+        if drops := self._table.get(params):
+            yield from drops()
 
 
 def roll_slot(slot: str = None) -> Callable[[], EquippableItem | None]:
@@ -68,22 +69,23 @@ def roll_boss_table():
 
 
 def roll_table(table):
-    roll = random.randrange(0, sum(*[rate for rate, _ in table]))
-    while drop := table.pop(0):
-        rate, rewards = drop
+    roll = random.randrange(0, sum(rate for rate, _ in table))
+    for rate, rewards in table:
         if rate > roll:
             yield from (reward for reward in rewards)
-        else:
-            roll -= rate
+            return
+
+        roll -= rate
+
 
+_boss_rolls = [roll_slot("_weapon"), roll_slot("_helmet")]
+_body_roll = roll_slot("_body")
 
 common_item_drops = DropConfig(
     {
-        ItemRollParams(is_boss=True): (
-            roll() for roll in [roll_slot("_weapon"), roll_slot("_helmet")]
-        ),
-        ItemRollParams(): (roll() for roll in [roll_slot("_body")]),
-        ItemRollParams(is_enemy=False): roll_boss_table(),
+        ItemRollParams(is_boss=True): lambda: (roll() for roll in _boss_rolls),
+        ItemRollParams(): lambda: (roll() for roll in [_body_roll]),
+        ItemRollParams(is_enemy=False): roll_boss_table,
     }
 )
 
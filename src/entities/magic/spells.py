@@ -216,16 +216,15 @@ class Fireball(Spell, metaclass=SpellMeta):
 
         yield {EventTopic.MESSAGE: f"{self._caster.owner.owner.name} cast {self.name}."}
 
-        for entity in room.occupants:
-            if entity.locatable.location in template:
-                damage_amount = randint(self._min_damage, self._max_damage)
-                damage = Damage(
-                    self.caster.owner, damage_amount, crit_chance=0, damage_type="magic"
-                )
-                yield {
-                    EventTopic.MESSAGE: f"{self.name} scorches {entity.name} with a fireball!\n"
-                }
-                yield from damage.resolve_damage(entity)
+        for entity in room.occupants_at(template):
+            damage_amount = randint(self._min_damage, self._max_damage)
+            damage = Damage(
+                self.caster.owner, damage_amount, crit_chance=0, damage_type="magic"
+            )
+            yield {
+                EventTopic.MESSAGE: f"{self.name} scorches {entity.name} with a fireball!\n"
+            }
+            yield from damage.resolve_damage(entity, narrated=room.narrated)
 
     def valid_target(self, target: Fighter | Node):
         if hasattr(target, "location"):
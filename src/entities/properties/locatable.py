@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 
 
 Path = tuple[Node]
+MoveHook = Callable[["Locatable", Node], None]
 
 
 class Orientation(Enum):
@@ -29,11 +30,22 @@ class Locatable:
         self, owner: "Entity", location: Node, speed: int, space: PathingSpace
     ) -> None:
         self.owner = owner
-        self.location = location
+        self.on_move_hooks: list[MoveHook] = []
+        self._location = location
         self.space = space
         self.speed = speed
         self.orientation = Node(*choice([o.value for o in Orientation]))
 
+    @property
+    def location(self) -> Node:
+        return self._location
+
+    @location.setter
+    def location(self, new_location: Node) -> None:
+        previous, self._location = self._location, new_location
+        for hook in self.on_move_hooks:
+            hook(self, previous)
+
     def path_to_target(self, target: Locatable | Fighter) -> tuple[Node, ...]:
         return self.path_to_destination(target.location)
 
@@ -132,7 +144,7 @@ class Locatable:
             ):
                 continue
 
-            path = self.path_to_target(occupant.locatable)
+            path = room.tactical_map.path(self.location, occupant.locatable.location)
             if path is None:
                 print(f"{occupant.name} {occupant.locatable.location=} is unreachable")
                 continue
@@ -155,7 +167,7 @@ class Locatable:
             if occupant is self.owner or not entity_filter(occupant):
                 continue
 
-            path = self.path_to_target(occupant.locatable)
+            path = room.tactical_map.path(self.location, occupant.locatable.location)
             # if there is no path to the target, go to the next
             if path is None:
                 continue
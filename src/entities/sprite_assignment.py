@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Self
 
+from src import config
 from src.entities.sprites import AnimatedSpriteAttribute
 
 if TYPE_CHECKING:
@@ -54,14 +56,24 @@ def select_textures(species: str, fighter: Fighter) -> AnimatedSpriteConfig:
         return choose_mob_textures()
 
 
-def attach_sprites(entity: Entity) -> Entity:
-    sprite_config = select_textures(entity.species, entity.fighter)
-    entity.set_entity_sprite(
-        AnimatedSpriteAttribute(
-            idle_textures=sprite_config.idle_textures,
-            attack_textures=sprite_config.attack_textures,
-            sprite_conf=sprite_config,
-        )
+def build_sprite(sprite_config: AnimatedSpriteConfig) -> AnimatedSpriteAttribute:
+    return AnimatedSpriteAttribute(
+        idle_textures=sprite_config.idle_textures,
+        attack_textures=sprite_config.attack_textures,
+        sprite_conf=sprite_config,
     )
 
+
+def attach_sprites(entity: Entity, defer: bool | None = None) -> Entity:
+    """
+    When deferred, the textures are only loaded once something asks for the sprite.
+    They're chosen straight away either way, so the random state is used the same.
+    Sprites are deferred when headless, unless told otherwise.
+    """
+    sprite_config = select_textures(entity.species, entity.fighter)
+    if config.HEADLESS if defer is None else defer:
+        entity.defer_entity_sprite(partial(build_sprite, sprite_config))
+    else:
+        entity.set_entity_sprite(build_sprite(sprite_config))
+
     return entity
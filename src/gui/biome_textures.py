@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, NamedTuple
+from typing import TYPE_CHECKING, Callable, Iterator, Mapping, NamedTuple
 
 if TYPE_CHECKING:
     from src.gui.components.lighting_shader import ShaderPipeline
@@ -14,11 +14,6 @@ from pyglet.math import Vec3, Vec4
 from src.textures.texture_data import SingleTextureSpecs, SpriteSheetSpecs
 from src.world.node import Node
 
-tiles = SpriteSheetSpecs.tiles.loaded
-normals_tile = SingleTextureSpecs.tile_normals.loaded
-normals_pillars = SpriteSheetSpecs.pillar_normals.loaded
-heights_pillars = SpriteSheetSpecs.pillar_heights.loaded
-
 
 class BiomeName:
     CASTLE = "castle"
@@ -147,6 +142,7 @@ class Biome(NamedTuple):
 class BiomeTextures:
     @classmethod
     def castle(cls):
+        tiles = SpriteSheetSpecs.tiles.loaded
         return Biome(
             name=BiomeName.CASTLE,
             floor_tiles=[tiles[88], tiles[89]],
@@ -156,6 +152,7 @@ class BiomeTextures:
 
     @classmethod
     def desert(cls):
+        tiles = SpriteSheetSpecs.tiles.loaded
         return Biome(
             name=BiomeName.DESERT,
             floor_tiles=[tiles[3], tiles[88]],
@@ -165,6 +162,7 @@ class BiomeTextures:
 
     @classmethod
     def snow(cls):
+        tiles = SpriteSheetSpecs.tiles.loaded
         return Biome(
             name=BiomeName.SNOW,
             floor_tiles=[tiles[22], tiles[23], tiles[89]],
@@ -174,6 +172,7 @@ class BiomeTextures:
 
     @classmethod
     def plains(cls):
+        tiles = SpriteSheetSpecs.tiles.loaded
         return Biome(
             name=BiomeName.PLAINS,
             floor_tiles=[tiles[0], tiles[1], tiles[25]],
@@ -190,6 +189,8 @@ class BiomeTextures:
 
     @classmethod
     def normal(cls):
+        normals_tile = SingleTextureSpecs.tile_normals.loaded
+        normals_pillars = SpriteSheetSpecs.pillar_normals.loaded
         return Biome(
             name=BiomeName.NORMALS,
             floor_tiles=[normals_tile],
@@ -220,6 +221,8 @@ class BiomeTextures:
 
     @classmethod
     def height(cls):
+        tiles = SpriteSheetSpecs.tiles.loaded
+        heights_pillars = SpriteSheetSpecs.pillar_heights.loaded
         return Biome(
             name=BiomeName.HEIGHT,
             floor_tiles=[],
@@ -253,11 +256,36 @@ class BiomeTextures:
         )
 
 
-biome_map: dict[str, Biome] = {
-    BiomeName.CASTLE: BiomeTextures.castle(),
-    BiomeName.SNOW: BiomeTextures.snow(),
-    BiomeName.DESERT: BiomeTextures.desert(),
-    BiomeName.PLAINS: BiomeTextures.plains(),
-    BiomeName.NORMALS: BiomeTextures.normal(),
-    BiomeName.HEIGHT: BiomeTextures.height(),
-}
+class BiomeMap(Mapping[str, Biome]):
+    """
+    Builds each biome the first time it's asked for, rather than on import, so that
+    rooms can be made without loading any textures.
+    """
+
+    def __init__(self, builders: dict[str, Callable[[], Biome]]):
+        self._builders = builders
+        self._biomes: dict[str, Biome] = {}
+
+    def __getitem__(self, name: str) -> Biome:
+        if name not in self._biomes:
+            self._biomes[name] = self._builders[name]()
+
+        return self._biomes[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._builders)
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+
+biome_map: Mapping[str, Biome] = BiomeMap(
+    {
+        BiomeName.CASTLE: BiomeTextures.castle,
+        BiomeName.SNOW: BiomeTextures.snow,
+        BiomeName.DESERT: BiomeTextures.desert,
+        BiomeName.PLAINS: BiomeTextures.plains,
+        BiomeName.NORMALS: BiomeTextures.normal,
+        BiomeName.HEIGHT: BiomeTextures.height,
+    }
+)
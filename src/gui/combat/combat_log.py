@@ -1,3 +1,4 @@
+from collections import deque
 from typing import Generator
 
 import arcade
@@ -13,6 +14,7 @@ class CombatLog:
     margin_x = 10
     margin_y = 10
     border_weight = 2
+    max_lines = 5
 
     def __init__(self, rect: Rect) -> None:
         self.rect = rect
@@ -22,7 +24,7 @@ class CombatLog:
             handler=self.on_message_receieved,
         )
         self.logs = []
-        self.messages = []
+        self.messages = deque(maxlen=self.max_lines)
         self.alphas = []
         self.alpha_max = 255
         self.shapes = arcade.shape_list.ShapeElementList()
@@ -35,7 +37,7 @@ class CombatLog:
         self.make_shapes()
         self.shapes.append(self.panel_bg)
         self.shapes.append(self.panel_border)
-        self.messages = []
+        self.messages = deque(maxlen=self.max_lines)
         self.update_text()
 
     def make_shapes(self):
@@ -73,14 +75,15 @@ class CombatLog:
     def on_message_receieved(self, event: dict):
         message = event.get(EventTopic.MESSAGE, "")
         if message:
-            self.logs.append(message)
-            self.logs = self.logs[-5:]
+            # The engine records every message in its ring buffer before publishing it,
+            # so the log shows one more of them than before, up to max_lines
+            self.logs = eng.recent_messages(min(len(self.logs) + 1, self.max_lines))
             self.update_text()
 
     def update_text(self):
         heights = self.msg_height()
 
-        self.msg_paint(5)
+        self.msg_paint(self.max_lines)
 
         for i, current_message in enumerate(self.logs):
             height = next(heights)
@@ -103,7 +106,6 @@ class CombatLog:
             )
 
             self.messages.append(txt)
-            self.messages = self.messages[-5:]
 
     def msg_paint(self, n) -> list:
         if len(self.alphas) <= len(self.messages) and len(self.alphas) < n:
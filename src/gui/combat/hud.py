@@ -11,6 +11,7 @@ from src.engine.init_engine import eng
 from src.gui.combat.combat_log import CombatLog
 from src.gui.combat.combat_menu import CombatMenu, empty
 from src.gui.combat.portrait import Pin, Portrait
+from src.utils.profiling import frame_times
 from src.utils.rectangle import Rectangle
 
 if TYPE_CHECKING:
@@ -156,7 +157,7 @@ class HUD(arcade.Section):
     def handle_input_request(self, event):
         if requester := event.get("await_input"):
             self.scene.follow(requester.locatable)
-            if requester.owner.ai:
+            if requester.owner.ai or eng.replaying:
                 return
 
         eng.await_input()
@@ -212,6 +213,7 @@ class HUD(arcade.Section):
             f"{self.scene._mouse_coords=}\n"
             f"{self.combat_menu.menu.x=}\n"
             f"{self.width=}, {self.height=}\n"
+            f"p99 frame time: {frame_times.p99() * 1000:.1f}ms\n"
         )
 
     def on_resize(self, width: int, height: int):
@@ -17,6 +17,7 @@ from src.gui.components.menu import Menu
 from src.textures.texture_data import SpriteSheetSpecs
 from src.tools.repl import run_repl
 from src.utils.camera_controls import CameraController
+from src.utils.profiling import frame_times
 from src.world.isometry.transforms import Transform
 from src.world.level.room import Room
 from src.world.node import Node
@@ -161,16 +162,7 @@ class Scene(arcade.Section):
         )
 
     def entity_at_node(self, node: Node) -> Entity | None:
-        if node not in self.encounter_room.space.all_included_nodes(
-            exclude_dynamic=False
-        ):
-            return None
-
-        for occupant in self.encounter_room.occupants:
-            if occupant.locatable.location == node:
-                return occupant
-
-        return None
+        return self.encounter_room.occupant_at(node)
 
     @property
     def world_origin(self) -> Vec2:
@@ -231,7 +223,9 @@ class Scene(arcade.Section):
         self.grid_camera.update()
 
     def on_update(self, delta_time: float):
-        eng.update_clock -= delta_time
+        frame_times.record(delta_time)
+        eng.scheduler.run(budget_ms=config.SCHEDULER_BUDGET_MS)
+        eng.update_clock -= delta_time * eng.time_scale
 
         if not eng.awaiting_input:
             hook = eng.next_combat_event
@@ -241,7 +235,8 @@ class Scene(arcade.Section):
         self.dudes_sprite_list.update_animation(delta_time=delta_time)
         self.floating_health_bars.update()
 
-        if eng.update_clock < 0:
+        # Hold the next event until any decisions in progress have been made
+        if eng.update_clock < 0 and not eng.scheduler.busy:
             eng.reset_update_clock()
             hook()
         self.update_camera()
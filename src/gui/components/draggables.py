@@ -20,7 +20,7 @@ class Draggable:
     hit_box: Rectangle
 
     def __init__(self, item: EquippableItem, is_held=False):
-        self.sprite = item._sprite.sprite
+        self.sprite = item.sprite.sprite
         self.item = item
         self.is_held = is_held
 
@@ -51,11 +51,11 @@ class ItemReceiver:
 
     def overlay_equipped_sprite(self):
         if self.slot == "_weapon" and self.gear.weapon:
-            self.gear.weapon._sprite.sprite.position = self.sprite.position
+            self.gear.weapon.sprite.sprite.position = self.sprite.position
         elif self.slot == "_helmet" and self.gear.helmet:
-            self.gear.helmet._sprite.sprite.position = self.sprite.position
+            self.gear.helmet.sprite.sprite.position = self.sprite.position
         elif self.slot == "_body" and self.gear.body:
-            self.gear.body._sprite.sprite.position = self.sprite.position
+            self.gear.body.sprite.sprite.position = self.sprite.position
 
     def reposition(self, new_pos: Vec2):
         self.sprite.position = new_pos
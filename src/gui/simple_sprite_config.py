@@ -22,6 +22,10 @@ class SimpleSpriteConfig(NamedTuple):
 
 
 def choose_item_texture(item: EquippableItem) -> Texture:
+    return choose_item_sprite(item).texture
+
+
+def choose_item_sprite(item: EquippableItem) -> SimpleSpriteConfig:
     match item._slot:
         case "_weapon":
             if item._name == BaseWeaponNames.SWORD:
@@ -36,7 +40,7 @@ def choose_item_texture(item: EquippableItem) -> Texture:
         case "_body":
             tx = ARMOUR
 
-    return tx.texture
+    return tx
 
 
 ARMOUR = SimpleSpriteConfig(84)
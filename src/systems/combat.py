@@ -1,15 +1,16 @@
+from collections import deque
 from enum import Enum
 from random import shuffle
 from typing import Any, Callable, Generator, NamedTuple
 
-from src.engine.events_enum import EventTopic
+from src.engine.events import Dying, Envelope, Message, Retreat, RollItemDrop
 from src.entities.action.actions import EndTurnAction
 from src.entities.combat.fighter import Fighter
 from src.entities.combat.leveller import Experience
 from src.entities.entity import Entity
 from src.entities.item.items import HealingPotion
 
-Event = dict[str, Any]
+Event = dict[str, Any] | Envelope
 Hook = Callable[[], None]
 
 
@@ -23,26 +24,33 @@ class Teams(NamedTuple):
 
 
 class CombatRound:
-    teams: tuple[list[Fighter], list[Fighter]]
-
     _result: bool | None
-    _round_order: list[Fighter] = []  # fighter
+    _round_order: deque[Fighter]  # fighter
     turn_complete: bool = False
     fighter_turns_taken: list[bool] = []
 
     def __init__(self, team_a: list[Entity], team_b: list[Entity]) -> None:
-        self.teams = (
-            [member.fighter for member in team_a],
-            [member.fighter for member in team_b],
+        # Each team's fighters still in the round, in the order they were given. Dicts
+        # keep that order while letting fighters be purged in constant time.
+        self._members: tuple[dict[Fighter, None], dict[Fighter, None]] = (
+            dict.fromkeys(member.fighter for member in team_a),
+            dict.fromkeys(member.fighter for member in team_b),
         )
+        self._team_index: dict[Fighter, int] = {
+            fighter: team
+            for team, members in enumerate(self._members)
+            for fighter in members
+        }
         self.initiative_roll_events = self._roll_initiative()
 
+    @property
+    def teams(self) -> tuple[list[Fighter], list[Fighter]]:
+        return [*self._members[0]], [*self._members[1]]
+
     def _roll_initiative(self) -> list[Event]:
         events = []
 
-        combatants = [
-            yob for yob in self.teams[0] + self.teams[1] if yob.incapacitated == False
-        ]
+        combatants = [yob for yob in self._team_index if yob.incapacitated == False]
 
         battle_size = len(combatants)
 
@@ -57,19 +65,21 @@ class CombatRound:
         )
 
         # drop the initiative for the turn order since the index is the battle_size - (initiative + 1)
-        self._round_order = [combatant for combatant, _ in initiative_roll]
+        self._round_order = deque(combatant for combatant, _ in initiative_roll)
+        # Fighters purged from the round are dropped from the order when they reach the front
+        self._in_round = {*self._round_order}
         events.append(
-            {
-                EventTopic.MESSAGE: f"{self._round_order[0].owner.name.name_and_title} goes first this turn"
-            }
+            Envelope.of(
+                Message(
+                    f"{self._round_order[0].owner.name.name_and_title} goes first this turn"
+                )
+            )
         )
 
         return events
 
     def teams_of(self, combatant) -> Teams:
-        team = 0
-        if combatant in self.teams[1]:
-            team = 1
+        team = self._team_index.get(combatant, 0)
         # return team, opposing_team
         return Teams(current=team, opposing=(team + 1) % 2)
 
@@ -81,12 +91,11 @@ class CombatRound:
         )
 
     def get_enemies(self, opposing_team) -> list[Fighter]:
-        return list(
-            filter(
-                lambda f: self.in_play(f, opposing_team),
-                self.teams[0] + self.teams[1],
-            )
-        )
+        return [
+            fighter
+            for fighter in self._members[opposing_team]
+            if not fighter.owner.is_dead and not fighter.retreating
+        ]
 
     def do_turn(self) -> Generator[Event, None, None]:
         """
@@ -94,7 +103,7 @@ class CombatRound:
         If the fighter is a player character, it will instead emit a request_target event from the fighter,
         initiating a transition into the player_turn() through the engines _generate_combat_events() func.
         """
-        if len(self._round_order) == 0:
+        if not self._in_round:
             # Stop the iteration when the round is over
             raise StopIteration(
                 f"The turn order was empty, {self.teams[0]=}, {self.teams[1]=}"
@@ -122,7 +131,7 @@ class CombatRound:
                 # otherwise do that action!
                 yield from combatant.act()
                 yield from self._check_for_death(enemies)
-                yield from self._check_for_retreat(self.teams[0] + self.teams[1])
+                yield from self._check_for_retreat([*self._team_index])
         self.current_combatant(pop=True)
         yield from combatant.on_turn_end()
 
@@ -133,37 +142,33 @@ class CombatRound:
                 target.owner.die()
                 self._purge_fighter(target)
 
-                yield {
-                    EventTopic.DYING: target.owner,
-                    EventTopic.MESSAGE: f"{name} is dead!",
-                    EventTopic.ROLL_ITEM_DROP: target.owner,
-                }
+                yield Envelope.of(
+                    Dying(target.owner),
+                    Message(f"{name} is dead!"),
+                    RollItemDrop(target.owner),
+                )
 
     def _check_for_retreat(self, team) -> Event:
         for fighter in team:
             if fighter.retreating:
-                result = {}
                 self._purge_fighter(fighter)
 
-                result.update(**fighter.owner.annotate_event({}))
-                result.update(
-                    {
-                        "retreat": fighter,
-                        EventTopic.MESSAGE: f"{fighter.owner.name.name_and_title} is retreating!",
-                    }
+                yield Envelope.of(
+                    fighter.owner.entity_data(),
+                    Retreat(fighter),
+                    Message(f"{fighter.owner.name.name_and_title} is retreating!"),
                 )
 
-                yield result
-
     def _purge_fighter(self, fighter: Fighter) -> None:
-        team_id = 0 if fighter in self.teams[0] else 1
-        self.teams[team_id].remove(fighter)
+        team_id = self._team_index.pop(fighter, None)
+        if team_id is None:
+            return
 
-        if fighter in self._round_order:
-            self._round_order.remove(fighter)
+        self._members[team_id].pop(fighter, None)
+        self._in_round.discard(fighter)
 
     def victor(self) -> int | None:
-        match tuple(len(t) for t in self.teams):
+        match tuple(len(t) for t in self._members):
             case (x, 0) if x != 0:
                 return 0
             case (0, x) if x != 0:
@@ -172,9 +177,9 @@ class CombatRound:
                 return None
 
     def continues(self) -> bool:
-        if not self.teams[0] or not self.teams[1]:
+        if not self._members[0] or not self._members[1]:
             return False
-        if self.victor() is None and self._round_order:
+        if self.victor() is None and self._in_round:
             return True
 
         return False
@@ -183,9 +188,14 @@ class CombatRound:
         return not self.is_complete()
 
     def current_combatant(self, pop=False) -> Fighter | None:
+        while self._round_order and self._round_order[0] not in self._in_round:
+            self._round_order.popleft()
+
         if self._round_order:
             if pop:
-                return self._round_order.pop(0)
+                combatant = self._round_order.popleft()
+                self._in_round.discard(combatant)
+                return combatant
             return self._round_order[0]
 
         return None
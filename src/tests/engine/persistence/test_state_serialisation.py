@@ -1,3 +1,4 @@
+import os
 from unittest import TestCase
 
 from src.engine.persistence.dumpers import GameStateDumpers
@@ -215,3 +216,88 @@ class SerialisationTest(TestCase):
             assert (
                 original_entity_stats.speed == rehydrated_entity_stats.speed
             ), f"Modifiable Stat is not equal, Entity_A: {original_entity_stats.speed=}, Entity_B: {rehydrated_entity_stats.speed=}"
+
+
+class StreamingFormatTest(TestCase):
+    formats = (Format.PICKLE, Format.YAML)
+
+    def test_documents_dumped_as_a_stream_are_loaded_back_in_order(self):
+        # Arrange
+        documents = [{"slot": i, "items": [{"name": f"item {i}"}]} for i in range(5)]
+
+        for fmt in self.formats:
+            file_path = GuildRepository.save_file_path(3, fmt=fmt, testing=True)
+
+            # Action
+            fmt.dump_all((doc for doc in documents), file_path)
+            loaded = [*fmt.load_all(file_path)]
+
+            # Assert
+            assert (
+                loaded == documents
+            ), f"Streamed documents differ after round trip in {fmt=}. Expected: {documents}, Got: {loaded}"
+
+    def test_exported_armory_is_restored_with_the_same_items(self):
+        # Arrange
+        guild = GuildFactory.make_guild()
+        for entity in guild.roster:
+            guild.armory.store_all(entity.fighter.gear.as_list())
+
+        for fmt in self.formats:
+            # Action
+            file_path = GuildRepository.export_armory(guild, fmt=fmt, testing=True)
+            self.addCleanup(os.remove, file_path)
+            armory = GuildRepository.import_armory(file_path, fmt=fmt)
+
+            # Assert
+            assert [item.name for item in armory.storage] == [
+                item.name for item in guild.armory.storage
+            ], f"Armory contents changed after export and import in {fmt=}"
+
+
+class RecordTableTest(TestCase):
+    def test_identical_item_configs_are_stored_once_and_shared_after_loading(self):
+        # Arrange
+        guild = GuildFactory.make_guild()
+        weapon = guild.roster[0].fighter.gear.weapon
+        guild.armory.store_all([weapon, weapon, weapon])
+
+        # Action
+        guild_dict = GameStateDumpers.guild_to_dict(guild)
+        armory_refs = [item["config"] for item in guild_dict["armory"]["storage"]]
+        stored_configs = guild_dict["records"]["configs"]
+        loaded_guild = GameStateLoaders.guild_from_dict(guild_dict)
+        loaded_configs = [item._config for item in loaded_guild.armory.storage]
+
+        # Assert
+        assert (
+            len(set(armory_refs)) == 1
+        ), f"Identical configs were given different record ids: {armory_refs}"
+        assert (
+            armory_refs[0] in stored_configs
+        ), f"Record {armory_refs[0]} is missing from the record table: {stored_configs.keys()}"
+        assert all(
+            config is loaded_configs[0] for config in loaded_configs
+        ), f"Items built from the same record do not share a config: {loaded_configs}"
+        assert [affix.name for affix in loaded_configs[0].fighter_affixes] == [
+            affix.name for affix in weapon._fighter_affixes
+        ], f"Affixes changed after loading. Expected: {weapon._fighter_affixes}, Got: {loaded_configs[0].fighter_affixes}"
+
+    def test_inline_item_configs_from_older_saves_are_still_loaded(self):
+        # Arrange
+        guild = GuildFactory.make_guild()
+        weapon = guild.roster[0].fighter.gear.weapon
+        serialised_weapon = GameStateDumpers.equippable_item_to_dict(weapon)
+
+        # Action
+        loaded_weapon = GameStateLoaders.equippable_item_from_dict(
+            serialised_weapon, owner=None
+        )
+
+        # Assert
+        assert (
+            loaded_weapon.name == weapon.name
+        ), f"Expected: {weapon.name}, Got: {loaded_weapon.name}"
+        assert (
+            loaded_weapon._fighter_affixes == weapon._fighter_affixes
+        ), f"Expected: {weapon._fighter_affixes}, Got: {loaded_weapon._fighter_affixes}"
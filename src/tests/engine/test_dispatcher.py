@@ -0,0 +1,120 @@
+import gc
+from unittest import TestCase
+
+from src.engine.dispatcher import StaticDispatcher, VolatileDispatcher
+from src.engine.events import Envelope, Message, TurnEnd
+from src.engine.events_enum import EventTopic
+
+
+class Listener:
+    def __init__(self):
+        self.received = []
+
+    def handle(self, event: dict):
+        self.received.append(event)
+
+
+class DispatcherTest(TestCase):
+    def test_events_reach_every_subscriber_of_each_topic(self):
+        # Arrange
+        dispatcher = VolatileDispatcher(None)
+        first, second = Listener(), Listener()
+        dispatcher.volatile_subscribe("message", "first", first.handle)
+        dispatcher.volatile_subscribe("message", "second", second.handle)
+
+        # Action
+        dispatcher.publish({"message": "hello"})
+        dispatcher.publish({"unsubscribed topic": None})
+
+        # Assert
+        for listener in (first, second):
+            assert listener.received == [
+                {"message": "hello"}
+            ], f"Expected exactly one message, got {listener.received}"
+
+    def test_resubscribing_a_live_handler_id_is_ignored(self):
+        # Arrange
+        dispatcher = VolatileDispatcher(None)
+        first, second = Listener(), Listener()
+        dispatcher.volatile_subscribe("message", "listener", first.handle)
+
+        # Action
+        dispatcher.volatile_subscribe("message", "listener", second.handle)
+        dispatcher.publish({"message": "hello"})
+
+        # Assert
+        assert first.received, "The original subscriber should still be subscribed"
+        assert not second.received, "The duplicate subscription should be ignored"
+
+    def test_collected_subscribers_are_pruned_without_publishing(self):
+        # Arrange
+        dispatcher = VolatileDispatcher(None)
+        listener = Listener()
+        dispatcher.volatile_subscribe("message", "listener", listener.handle)
+
+        # Action
+        del listener
+        gc.collect()
+
+        # Assert
+        assert (
+            "message" not in dispatcher.subscriptions
+        ), f"Dead subscription was not pruned: {dispatcher.subscriptions}"
+        assert (
+            "message" not in dispatcher._handlers
+        ), f"Dead handler was not pruned: {dispatcher._handlers}"
+
+    def test_flushing_during_dispatch_does_not_interrupt_the_event(self):
+        # Arrange
+        dispatcher = StaticDispatcher(None)
+        received = []
+        dispatcher.static_subscribe(
+            "cleanup", "flusher", lambda event: dispatcher.flush_subs()
+        )
+        dispatcher.static_subscribe("cleanup", "receiver", received.append)
+
+        # Action
+        dispatcher.publish({"cleanup": None})
+        dispatcher.publish({"cleanup": None})
+
+        # Assert
+        assert (
+            len(received) == 1
+        ), f"Expected the event in flight to finish dispatching once, got {received}"
+
+
+class EnvelopeDispatchTest(TestCase):
+    def test_typed_subscribers_receive_only_their_event(self):
+        # Arrange
+        dispatcher = VolatileDispatcher(None)
+        listener = Listener()
+        dispatcher.volatile_subscribe(Message, "listener", listener.handle)
+        envelope = Envelope.of(TurnEnd(fighter=None), Message("hello"))
+
+        # Action
+        dispatcher.publish(envelope)
+
+        # Assert
+        assert listener.received == [
+            Message("hello")
+        ], f"Expected only the typed message, got {listener.received}"
+        assert (
+            envelope._legacy is None
+        ), "The legacy view should not be built without legacy subscribers"
+
+    def test_legacy_subscribers_receive_the_dict_view(self):
+        # Arrange
+        dispatcher = VolatileDispatcher(None)
+        listener = Listener()
+        dispatcher.volatile_subscribe(EventTopic.MESSAGE, "listener", listener.handle)
+
+        # Action
+        dispatcher.publish(Envelope.of(TurnEnd(fighter=None), Message("hello")))
+
+        # Assert
+        assert listener.received == [
+            {"turn_end": None, EventTopic.MESSAGE: "hello"}
+        ], f"Expected the legacy dict view, got {listener.received}"
+        assert isinstance(
+            listener.received[0], dict
+        ), f"Legacy subscribers should get a plain dict, got {type(listener.received[0])}"
@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from src.engine.engine import Engine
+from src.engine.events_enum import EventTopic
+
+
+class EngineEventQueueTest(TestCase):
+    def setUp(self) -> None:
+        self.engine = Engine()
+        self.processed = []
+        self.engine.subscribe(
+            topic=EventTopic.MESSAGE,
+            handler_id="test_engine.on_message",
+            handler=self.on_message,
+        )
+
+    def tearDown(self) -> None:
+        self.engine.flush_subscriptions()
+
+    def on_message(self, event: dict):
+        self.processed.append(event[EventTopic.MESSAGE])
+
+    def queue_messages(self, n: int):
+        self.engine.event_queue.extend({EventTopic.MESSAGE: f"{i}"} for i in range(n))
+
+    def test_process_event_queue_processes_every_event_in_order(self):
+        # Arrange
+        self.queue_messages(10)
+
+        # Action
+        self.engine.process_event_queue()
+
+        # Assert
+        assert self.processed == [
+            f"{i}" for i in range(10)
+        ], f"Expected all events in order, got {self.processed}"
+        assert not self.engine.event_queue, "Expected the queue to be empty"
+
+    def test_messages_are_kept_in_a_bounded_ring_buffer(self):
+        # Arrange
+        capacity = self.engine.messages.maxlen
+        self.queue_messages(capacity + 5)
+
+        # Action
+        self.engine.process_event_queue()
+
+        # Assert
+        assert (
+            len(self.engine.messages) == capacity
+        ), f"Expected {capacity} messages, got {len(self.engine.messages)}"
+        assert self.engine.recent_messages(2) == [
+            f"{capacity + 3}",
+            f"{capacity + 4}",
+        ], f"Expected the newest messages, got {self.engine.recent_messages(2)}"
@@ -0,0 +1,174 @@
+import random
+from unittest import TestCase
+
+from src.engine.engine import Engine
+from src.engine.events_enum import EventTopic
+from src.engine.replay import (CombatRecorder, CombatReplayer, CombatTape,
+                               RecordedChoice, Recording)
+from src.entities.ai.ai import BasicCombatAi
+from src.world.level.dungeon_factory import DungeonSpec, create_seeded_dungeon
+
+
+class MessageLog:
+    def __init__(self):
+        self.messages = []
+
+    def handle(self, event: dict):
+        self.messages.append(event[EventTopic.MESSAGE])
+
+
+def health(engine: Engine) -> list[tuple[str, int]]:
+    return [
+        (member.name.first_name, member.fighter.health.current)
+        for member in engine.game_state.guild.roster
+    ]
+
+
+def recorded_fight(seed: int) -> tuple[Recording, list[str], int, list]:
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        engine = Engine()
+        engine.new_game()
+        guild = engine.game_state.guild
+        for entity in [*guild.roster]:
+            guild.team.assign_to_team(entity)
+            entity.ai = BasicCombatAi()
+        engine.game_state.set_dungeon(create_seeded_dungeon(seed, 2, 1, 1))
+
+        log = MessageLog()
+        engine.static_subscribe(EventTopic.MESSAGE, "test_replay.log", log.handle)
+        recorder = CombatRecorder(engine).attach(engine)
+        engine.init_combat()
+        while engine.next_combat_event():
+            pass
+    finally:
+        random.setstate(state)
+
+    return recorder.recording, log.messages, recorder.steps, health(engine)
+
+
+class DungeonSpecTest(TestCase):
+    def test_a_spec_always_builds_the_same_dungeon(self):
+        # Arrange
+        spec = DungeonSpec(
+            seed=42, max_enemies_per_room=3, min_enemies_per_room=2, room_amount=2
+        )
+
+        # Action
+        first, second = spec.build(), spec.build()
+
+        # Assert
+        def layout(dungeon):
+            return [
+                [(e.name.name_and_title, e.locatable.location) for e in room.enemies]
+                for room in dungeon.rooms
+            ]
+
+        assert layout(first) == layout(second), f"Expected the same dungeon from {spec}"
+        assert first.spec == spec, f"Expected the spec to be attached, got {first.spec}"
+
+
+class ReplayTest(TestCase):
+    def test_recordings_survive_serialisation(self):
+        # Arrange
+        recording = Recording(
+            seed=7,
+            guild={"name": "guild"},
+            dungeon=DungeonSpec(1, 2, 1, 1),
+            choices=[
+                RecordedChoice(1, "move", 0, (("node", 1, 2, 0),)),
+                RecordedChoice(2, "weapon attack", 1, (("occupant", 3),)),
+                RecordedChoice(3, "end turn", 0, ()),
+            ],
+        )
+
+        # Action
+        loaded = Recording.from_bytes(recording.to_bytes())
+
+        # Assert
+        for attr in ("seed", "guild", "dungeon", "choices"):
+            assert getattr(loaded, attr) == getattr(
+                recording, attr
+            ), f"Expected {attr} to round trip, got {getattr(loaded, attr)}"
+
+    def test_replaying_a_recording_reproduces_the_fight(self):
+        # Arrange
+        recording, recorded_messages, _, _ = recorded_fight(seed=3)
+        engine = Engine()
+        log = MessageLog()
+        engine.static_subscribe(EventTopic.MESSAGE, "test_replay.log", log.handle)
+
+        # Action
+        CombatReplayer(Recording.from_bytes(recording.to_bytes())).attach(engine).run(
+            engine
+        )
+
+        # Assert
+        assert (
+            recording.choices
+        ), "Expected the choices made in the fight to be recorded"
+        assert (
+            log.messages == recorded_messages
+        ), f"Expected the replay to match the recording, got {log.messages}"
+        assert (
+            engine.tape is None
+        ), "Expected the replayer to detach at the end of combat"
+
+    def test_a_fight_replays_the_same_without_anything_showing_messages(self):
+        # Arrange
+        recording, _, recorded_steps, recorded_health = recorded_fight(seed=5)
+        engine = Engine()
+
+        # Action
+        steps = CombatReplayer(recording).attach(engine).run(engine)
+
+        # Assert
+        assert (
+            steps == recorded_steps
+        ), f"Expected {recorded_steps} steps like the recording, got {steps}"
+        assert (
+            health(engine) == recorded_health
+        ), f"Expected the fight to end the same, got {health(engine)}"
+
+    def test_other_random_draws_between_steps_leave_the_replay_alone(self):
+        # Arrange
+        recording, recorded_messages, _, _ = recorded_fight(seed=3)
+        engine = Engine()
+        log = MessageLog()
+        engine.static_subscribe(EventTopic.MESSAGE, "test_replay.log", log.handle)
+        CombatReplayer(recording).attach(engine)
+        state = random.getstate()
+
+        # Action
+        try:
+            engine.init_combat()
+            while engine.next_combat_event():
+                random.random()
+        finally:
+            random.setstate(state)
+
+        # Assert
+        assert (
+            log.messages == recorded_messages
+        ), f"Expected the replay to match the recording, got {log.messages}"
+
+    def test_steps_draw_from_their_own_random_state(self):
+        # Arrange
+        tape = CombatTape(Recording(7, {}, DungeonSpec(1, 2, 1, 1)))
+        state = random.getstate()
+        expected = random.Random(7)
+
+        # Action
+        draws = []
+        for _ in range(3):
+            with tape.step():
+                draws.append(random.random())
+
+        # Assert
+        assert (
+            random.getstate() == state
+        ), "Expected the random state outside of combat to be put back"
+        assert draws == [
+            expected.random() for _ in range(3)
+        ], f"Expected the steps to carry on from one another, got {draws}"
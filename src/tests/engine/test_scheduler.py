@@ -0,0 +1,87 @@
+from concurrent.futures import Future
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.engine.scheduler import Scheduler
+
+
+def counting_task(name: str, slices: int, log: list):
+    for i in range(slices):
+        log.append((name, i))
+        yield
+
+
+class SchedulerTest(TestCase):
+    def test_tasks_take_turns_a_slice_at_a_time(self):
+        # Arrange
+        scheduler, log = Scheduler(), []
+        scheduler.spawn(counting_task("a", 2, log))
+        scheduler.spawn(counting_task("b", 2, log))
+
+        # Action
+        scheduler.run_until_idle()
+
+        # Assert
+        assert log == [
+            ("a", 0),
+            ("b", 0),
+            ("a", 1),
+            ("b", 1),
+        ], f"Expected the tasks to interleave, got {log}"
+        assert not scheduler.busy, "Expected every task to have finished"
+
+    def test_work_left_over_from_the_budget_carries_on_next_run(self):
+        # Arrange
+        scheduler, log = Scheduler(), []
+        scheduler.spawn(counting_task("a", 5, log))
+        clock = iter(range(100))
+
+        # Action
+        # Each perf_counter call advances a millisecond, so a 2ms budget fits 2 slices
+        with patch(
+            "src.engine.scheduler.time.perf_counter", lambda: next(clock) / 1000
+        ):
+            first = scheduler.run(budget_ms=2)
+
+        # Assert
+        assert first == 2, f"Expected 2 slices within the budget, got {first}"
+        assert scheduler.busy, "Expected the task to still be pending"
+
+        # Action
+        scheduler.run_until_idle()
+
+        # Assert
+        assert len(log) == 5, f"Expected the task to finish on the next run, got {log}"
+
+    def test_tasks_waiting_on_a_future_are_parked_until_it_is_done(self):
+        # Arrange
+        scheduler, log = Scheduler(), []
+        future = Future()
+
+        def waiting_task():
+            yield future
+            log.append(("waiting", future.result()))
+
+        scheduler.spawn(waiting_task())
+        scheduler.spawn(counting_task("a", 2, log))
+
+        # Action
+        scheduler.run()
+
+        # Assert
+        assert log == [
+            ("a", 0),
+            ("a", 1),
+        ], f"Expected only the other task to run while waiting, got {log}"
+        assert scheduler.busy, "Expected the waiting task to still be pending"
+
+        # Action
+        future.set_result("done")
+        scheduler.run_until_idle()
+
+        # Assert
+        assert log[-1] == (
+            "waiting",
+            "done",
+        ), f"Expected the task to resume with the result, got {log}"
+        assert not scheduler.busy, "Expected every task to have finished"
@@ -0,0 +1,112 @@
+import threading
+from unittest import TestCase
+
+from src.engine.scheduler import Scheduler
+from src.entities.action.actions import MoveAction
+from src.entities.ai import basic_combat_ai
+from src.entities.ai.ai import BasicCombatAi, MctsCombatAi, UtilityCombatAi
+from src.entities.ai.snapshot import RoomSnapshot
+from src.systems.combat import CombatRound
+from src.tests.fixtures import EncounterFactory
+from src.utils.deep_copy import frozen
+
+
+class BasicCombatAiTest(TestCase):
+    fixtures = EncounterFactory
+
+    def first_input_request(self, unarmed: bool = False) -> dict:
+        _, mercs, enemies = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        if unarmed:
+            for entity in [*mercs, *enemies]:
+                entity.fighter.gear.unequip("_weapon")
+
+        combat_round = CombatRound(mercs, enemies)
+        for event in combat_round.do_turn():
+            if "await_input" in event:
+                return event
+
+        raise AssertionError("Expected the fighter to be asked for input")
+
+    def test_snapshots_are_decided_on_without_the_live_room(self):
+        # Arrange
+        event = self.first_input_request()
+        fighter = event["await_input"]
+        room = fighter.encounter_context.get()
+        exclusions = {*room.space.dynamic_exclusions}
+
+        # Action
+        snapshot = RoomSnapshot.of(fighter, event["choices"], seed=0)
+        decision = basic_combat_ai.decide(snapshot)
+
+        # Assert
+        assert (
+            snapshot.space is not room.space
+        ), "Expected the snapshot to path on its own copy of the space"
+        assert (
+            room.space.dynamic_exclusions == exclusions
+        ), "Expected deciding to leave the room's space alone"
+        assert (
+            room.occupants[snapshot.agent.index] is fighter.owner
+        ), f"Expected the agent to be the fighter asked for input, got {snapshot.agent}"
+        assert (
+            decision.action == MoveAction.name
+        ), f"Expected a fighter far from its enemy to move, got {decision}"
+        assert (
+            decision.destination in room.space
+        ), f"Expected to move somewhere free, got {decision.destination}"
+
+    def test_unarmed_fighters_are_seen_as_unable_to_attack(self):
+        # Arrange
+        event = self.first_input_request(unarmed=True)
+        fighter = event["await_input"]
+
+        # Action
+        snapshot = RoomSnapshot.of(fighter, event["choices"], seed=0)
+        BasicCombatAi().choose(event)
+
+        # Assert
+        assert all(
+            view.weapon_range == 0 and not view.can_attack
+            for view in snapshot.combatants
+        ), f"Expected unarmed fighters to have no reach, got {snapshot.combatants}"
+        assert (
+            snapshot.enemies_in_range() == []
+        ), "Expected an unarmed fighter to have nobody in range"
+        assert fighter.is_ready_to_act(), "Expected the unarmed fighter to still act"
+
+    def test_every_ai_decides_from_a_frozen_event(self):
+        for ai in [BasicCombatAi(), UtilityCombatAi(), MctsCombatAi(iterations=20)]:
+            with self.subTest(ai=type(ai).__name__):
+                # Arrange
+                event = self.first_input_request()
+                fighter = event["await_input"]
+
+                # Action
+                ai.choose(frozen(event))
+
+                # Assert
+                assert fighter.is_ready_to_act(), f"Expected {ai} to have acted"
+
+    def test_deliberate_decides_on_the_worker_and_confirms_on_the_caller(self):
+        # Arrange
+        event = self.first_input_request()
+        fighter = event["await_input"]
+        move = event["choices"][MoveAction.name][0]
+        confirmed_on = []
+
+        def on_confirm(*args):
+            confirmed_on.append(threading.current_thread())
+            return confirm(*args)
+
+        confirm, move["on_confirm"] = move["on_confirm"], on_confirm
+        scheduler = Scheduler()
+
+        # Action
+        scheduler.spawn(BasicCombatAi().deliberate(event))
+        scheduler.run_until_idle()
+
+        # Assert
+        assert confirmed_on == [
+            threading.current_thread()
+        ], f"Expected the move to be confirmed on the calling thread, got {confirmed_on}"
+        assert fighter.is_ready_to_act(), "Expected the fighter to have acted"
@@ -0,0 +1,195 @@
+import pickle
+import random
+from unittest import TestCase
+
+from src.entities.action.actions import MoveAction
+from src.entities.action.weapon_action import WeaponAttackAction
+from src.entities.ai import mcts_combat_ai
+from src.entities.ai.ai import MctsCombatAi
+from src.entities.ai.combat_state import Action, CombatState
+from src.entities.ai.mcts_combat_ai import Lookahead
+from src.systems.combat import CombatRound
+from src.tests.fixtures import EncounterFactory, EntityFactory
+from src.world.level.dungeon import Dungeon
+from src.world.level.room import Room
+from src.world.level.room_layouts import basic_room
+from src.world.node import Node
+
+
+class MctsCombatAiTest(TestCase):
+    fixtures = EncounterFactory
+
+    def input_request(self, mercs, enemies) -> dict:
+        combat_round = CombatRound(mercs, enemies)
+        for event in combat_round.do_turn():
+            if "await_input" in event:
+                return event
+
+        raise AssertionError("Expected the fighter to be asked for input")
+
+    def lookahead(self, event: dict, seed: int = 0) -> Lookahead:
+        fighter = event["await_input"]
+        return Lookahead(
+            state=CombatState.of(fighter, event["choices"]),
+            tactical=fighter.encounter_context.get().tactical_map,
+            seed=seed,
+        )
+
+    def test_applying_an_action_leaves_the_state_alone(self):
+        # Arrange
+        room, mercs, enemies = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        state = self.lookahead(self.input_request(mercs, enemies)).state
+        move = next(a for a in state.legal_actions() if a.kind == Action.MOVE)
+
+        # Action
+        moved = state.apply(move, random.Random(0))
+
+        # Assert
+        assert (
+            state.current.location != move.destination
+        ), f"Expected the original state to be where it was, got {state.current}"
+        assert (
+            moved.units[state.order[0]].location == move.destination
+        ), f"Expected the new state to have moved, got {moved.units}"
+
+    def test_a_distant_fighter_moves_closer(self):
+        # Arrange
+        room, mercs, enemies = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        lookahead = self.lookahead(self.input_request(mercs, enemies))
+        agent = lookahead.state.current
+        enemy = next(u for u in lookahead.state.units if u.is_enemy != agent.is_enemy)
+
+        # Action
+        decision = mcts_combat_ai.decide(lookahead, iterations=100)
+
+        # Assert
+        assert (
+            decision.action == MoveAction.name
+        ), f"Expected a fighter far from its enemy to move, got {decision}"
+        before = len(room.space.get_path(agent.location, enemy.location))
+        after = len(room.space.get_path(decision.destination, enemy.location))
+        assert after < before, f"Expected to move closer, {before=} {after=}"
+
+    def test_an_adjacent_enemy_is_attacked(self):
+        # Arrange
+        room, mercs, enemies = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        mercs[0].locatable.location = enemies[0].locatable.location + Node(1, 0)
+        room.update_pathing_obstacles()
+        event = self.input_request(mercs, enemies)
+
+        # Action
+        decision = mcts_combat_ai.decide(self.lookahead(event), iterations=100)
+
+        # Assert
+        assert (
+            decision.action == WeaponAttackAction.name
+        ), f"Expected an adjacent enemy to be attacked, got {decision}"
+        assert room.occupants[decision.target].fighter.is_enemy_of(
+            event["await_input"]
+        ), f"Expected an enemy to be the target, got {decision.target}"
+
+    def test_the_same_seed_makes_the_same_decision(self):
+        # Arrange
+        room, mercs, enemies = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        lookahead = self.lookahead(self.input_request(mercs, enemies), seed=7)
+
+        # Action
+        visits = [mcts_combat_ai.search(lookahead.state, 100, seed=7) for _ in range(2)]
+
+        # Assert
+        assert visits[0] == visits[1], f"Expected the same search, got {visits}"
+
+    def test_unarmed_fighters_are_never_offered_attacks(self):
+        # Arrange
+        room, mercs, enemies = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        mercs[0].locatable.location = enemies[0].locatable.location + Node(1, 0)
+        room.update_pathing_obstacles()
+        for entity in [*mercs, *enemies]:
+            entity.fighter.gear.unequip("_weapon")
+
+        # Action
+        state = self.lookahead(self.input_request(mercs, enemies)).state
+
+        # Assert
+        assert all(
+            unit.weapon_range == 0 for unit in state.units
+        ), f"Expected unarmed units to have no reach, got {state.units}"
+        assert all(
+            action.kind != Action.ATTACK for action in state.legal_actions()
+        ), f"Expected no attacks while unarmed, got {state.legal_actions()}"
+
+    def test_iterations_are_split_between_processes_without_a_budget(self):
+        # Arrange
+        room, mercs, enemies = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        lookahead = self.lookahead(self.input_request(mercs, enemies), seed=7)
+        self.addCleanup(mcts_combat_ai.shutdown_pool)
+
+        # Action
+        visits = [
+            mcts_combat_ai.parallel_search(lookahead.state, 21, seed=7, processes=2)
+            for _ in range(2)
+        ]
+
+        # Assert
+        assert (
+            sum(visits[0].values()) == 21
+        ), f"Expected every iteration to be counted, got {visits[0]}"
+        assert visits[0] == visits[1], f"Expected the same search, got {visits}"
+
+    def test_the_pool_is_replaced_for_a_different_number_of_processes(self):
+        # Arrange
+        self.addCleanup(mcts_combat_ai.shutdown_pool)
+        first = mcts_combat_ai.pool(2)
+
+        # Action
+        same, replaced = mcts_combat_ai.pool(2), mcts_combat_ai.pool(3)
+
+        # Assert
+        assert same is first, "Expected the pool to be kept for the same processes"
+        assert replaced is not first, "Expected a new pool for a different number"
+        with self.assertRaises(RuntimeError):
+            first.submit(int)
+
+    def test_states_can_be_sent_to_other_processes(self):
+        # Arrange
+        room, mercs, enemies = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        state = self.lookahead(self.input_request(mercs, enemies)).state
+
+        # Action
+        copied = pickle.loads(pickle.dumps(state))
+
+        # Assert
+        where = lambda s: [(unit.location, unit.hp) for unit in s.units]
+        assert where(copied) == where(state), f"Expected the same units, got {copied}"
+        assert copied.legal_actions() == state.legal_actions(), (
+            f"Expected the same actions after pickling, "
+            f"got {copied.legal_actions()} and {state.legal_actions()}"
+        )
+
+    def test_fights_to_a_finish(self):
+        # Arrange
+        room = Room(size=(10, 10), dungeon=Dungeon(0, 0, [], [], None, None))
+        room.set_layout(basic_room((10, 10)))
+        merc = EntityFactory.make_strongs(enemy=False)
+        enemy = EntityFactory.make_babies(enemy=True)
+        room.include_party([merc, enemy])
+        merc.locatable.location = room.space.minima
+        enemy.locatable.location = room.space.maxima - Node(2, 2)
+        ai = MctsCombatAi(iterations=50)
+        max_rounds, rounds = 30, 0
+        combat_round = None
+
+        # Action
+        while not merc.fighter.incapacitated and not enemy.fighter.incapacitated:
+            assert rounds < max_rounds, f"Expected a winner within {max_rounds} rounds"
+            combat_round = CombatRound([merc], [enemy])
+            while combat_round.continues():
+                for event in combat_round.do_turn():
+                    if "await_input" in event:
+                        ai.choose(event)
+            rounds += 1
+
+        # Assert
+        assert (
+            combat_round.victor() == 0
+        ), f"Expected the strong merc to win, got {combat_round.victor()}"
@@ -0,0 +1,112 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.entities.action.actions import MoveAction
+from src.entities.action.weapon_action import WeaponAttackAction
+from src.entities.ai import utility_combat_ai
+from src.entities.ai.ai import UtilityCombatAi
+from src.entities.ai.snapshot import RoomSnapshot
+from src.systems.combat import CombatRound
+from src.tests.fixtures import EncounterFactory, EntityFactory
+from src.world.level.dungeon import Dungeon
+from src.world.level.room import Room
+from src.world.level.room_layouts import basic_room
+from src.world.node import Node
+
+
+class UtilityCombatAiTest(TestCase):
+    fixtures = EncounterFactory
+
+    def input_request(self, mercs, enemies) -> dict:
+        combat_round = CombatRound(mercs, enemies)
+        for event in combat_round.do_turn():
+            if "await_input" in event:
+                return event
+
+        raise AssertionError("Expected the fighter to be asked for input")
+
+    def test_a_distant_fighter_moves_closer(self):
+        # Arrange
+        room, mercs, enemies = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        event = self.input_request(mercs, enemies)
+        fighter = event["await_input"]
+        snapshot = RoomSnapshot.of(fighter, event["choices"], seed=0)
+        enemy = snapshot.enemies()[0]
+
+        # Action
+        decision = utility_combat_ai.decide(snapshot)
+
+        # Assert
+        assert (
+            decision.action == MoveAction.name
+        ), f"Expected a fighter far from its enemy to move, got {decision}"
+        before = len(room.space.get_path(snapshot.agent.location, enemy.location))
+        after = len(room.space.get_path(decision.destination, enemy.location))
+        assert after < before, f"Expected to move closer, {before=} {after=}"
+
+    def test_an_adjacent_enemy_is_attacked(self):
+        # Arrange
+        room, mercs, enemies = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        mercs[0].locatable.location = enemies[0].locatable.location + Node(1, 0)
+        room.update_pathing_obstacles()
+        event = self.input_request(mercs, enemies)
+        fighter = event["await_input"]
+        snapshot = RoomSnapshot.of(fighter, event["choices"], seed=0)
+
+        # Action
+        decision = utility_combat_ai.decide(snapshot)
+
+        # Assert
+        assert (
+            decision.action == WeaponAttackAction.name
+        ), f"Expected an adjacent enemy to be attacked, got {decision}"
+        assert room.occupants[decision.target].fighter.is_enemy_of(
+            fighter
+        ), f"Expected an enemy to be the target, got {decision.target}"
+
+    def test_the_time_budget_is_only_read_from_config_when_opted_in(self):
+        # Arrange
+        with patch("src.config.AI_TIME_BUDGET_MS", 20):
+            # Action
+            unbudgeted = UtilityCombatAi()
+            budgeted = UtilityCombatAi(use_time_budget=True)
+            given = UtilityCombatAi(time_budget=0.5, use_time_budget=True)
+
+        # Assert
+        assert (
+            unbudgeted.time_budget is None
+        ), f"Expected no budget by default, got {unbudgeted.time_budget}"
+        assert (
+            budgeted.time_budget == 0.02
+        ), f"Expected the configured budget in seconds, got {budgeted.time_budget}"
+        assert (
+            given.time_budget == 0.5
+        ), f"Expected a given budget to be kept, got {given.time_budget}"
+
+    def test_fights_to_a_finish(self):
+        # Arrange
+        room = Room(size=(10, 10), dungeon=Dungeon(0, 0, [], [], None, None))
+        room.set_layout(basic_room((10, 10)))
+        merc = EntityFactory.make_strongs(enemy=False)
+        enemy = EntityFactory.make_babies(enemy=True)
+        room.include_party([merc, enemy])
+        merc.locatable.location = room.space.minima
+        enemy.locatable.location = room.space.maxima - Node(2, 2)
+        ai = UtilityCombatAi()
+        max_rounds, rounds = 30, 0
+        combat_round = None
+
+        # Action
+        while not merc.fighter.incapacitated and not enemy.fighter.incapacitated:
+            assert rounds < max_rounds, f"Expected a winner within {max_rounds} rounds"
+            combat_round = CombatRound([merc], [enemy])
+            while combat_round.continues():
+                for event in combat_round.do_turn():
+                    if "await_input" in event:
+                        ai.choose(event)
+            rounds += 1
+
+        # Assert
+        assert (
+            combat_round.victor() == 0
+        ), f"Expected the strong merc to win, got {combat_round.victor()}"
@@ -1,5 +1,6 @@
 import unittest
 
+from src.engine.events import AwaitInput, Envelope
 from src.engine.events_enum import EventTopic
 from src.entities.action.actions import (ConsumeItemAction, EndTurnAction,
                                          MoveAction)
@@ -91,14 +92,55 @@ class ActionsTest(unittest.TestCase):
         event = next(merc.fighter.request_action_choice())
 
         # Assert
-        assert isinstance(event, dict)
-        assert isinstance(event["choices"], dict)
-        choices = event.get("choices")
+        assert isinstance(event, Envelope)
+        await_input = event.get_event(AwaitInput)
+        assert isinstance(await_input, AwaitInput)
+        assert isinstance(await_input.choices, dict)
+        assert (
+            event["choices"] is await_input.choices
+        ), "The legacy view should expose the same choices as the typed event"
+        choices = await_input.choices
 
         for option_list in choices.values():
             for option in option_list:
                 self._assert_schema(option)
 
+    def test_action_menus_are_only_rebuilt_when_their_inputs_change(self):
+        # Arrange
+        merc, enemy = self.get_entities()
+        dungeon = Dungeon(0, 0, [], [], None, None)
+        room = self.set_up_encounter(10, merc, enemy)
+        merc.fighter.encounter_context.set(room, dungeon)
+        menu = merc.fighter.action_menu
+
+        # Action
+        first, second = menu.choices(), menu.choices()
+        merc.inventory.add_item_to_inventory(self.get_potion())
+        third = menu.choices()
+
+        # Assert
+        assert [*first] == [
+            WeaponAttackAction.name,
+            MoveAction.name,
+            ConsumeItemAction.name,
+            EndTurnAction.name,
+        ], f"Expected the actions in menu order, got {[*first]}"
+        assert not first[
+            ConsumeItemAction.name
+        ], f"Expected no items to use yet, got {first[ConsumeItemAction.name]}"
+        assert (
+            first[MoveAction.name] is not second[MoveAction.name]
+        ), "Each request should get its own lists of options"
+        assert all(
+            a is b for a, b in zip(first[MoveAction.name], second[MoveAction.name])
+        ), "Expected the options to be reused while nothing has changed"
+        assert (
+            len(third[ConsumeItemAction.name]) == 1
+        ), f"Expected the new potion to be offered, got {third.get('use item')}"
+        assert (
+            third[WeaponAttackAction.name][0] is first[WeaponAttackAction.name][0]
+        ), "Expected the attacks not to be rebuilt when only the inventory changed"
+
     def _assert_schema(self, option: dict):
         assert type(option.get("name")) is str
         assert type(option.get("actor")) is Fighter
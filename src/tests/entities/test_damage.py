@@ -0,0 +1,76 @@
+import random
+from unittest import TestCase
+
+from src.engine.events_enum import EventTopic
+from src.entities.entity import Entity
+from src.tests.fixtures import EntityFactory
+
+
+def resolve_blows(
+    attacker: Entity, target: Entity, narrated: bool, seed: int
+) -> tuple[list[dict], list[int]]:
+    state = random.getstate()
+    random.seed(seed)
+    events, health = [], []
+    try:
+        for _ in range(50):
+            target.fighter.health.current = 10**6
+            events.extend(
+                attacker.fighter.gear.weapon.emit_damage().resolve_damage(
+                    target, narrated=narrated
+                )
+            )
+            health.append(target.fighter.health.current)
+    finally:
+        random.setstate(state)
+
+    return events, health
+
+
+class DamageTest(TestCase):
+    def test_silent_damage_matches_narrated_damage(self):
+        # Arrange
+        attacker = EntityFactory.make_strongs(enemy=False)
+        target = EntityFactory.make_babies(enemy=True)
+
+        # Action
+        narrated_events, narrated_health = resolve_blows(
+            attacker, target, narrated=True, seed=7
+        )
+        silent_events, silent_health = resolve_blows(
+            attacker, target, narrated=False, seed=7
+        )
+
+        # Assert
+        assert (
+            silent_health == narrated_health
+        ), f"Expected the same damage either way, got {silent_health=} {narrated_health=}"
+        assert any(
+            EventTopic.MESSAGE in event for event in narrated_events
+        ), "Expected narrated damage to yield messages"
+        assert not any(
+            EventTopic.MESSAGE in event for event in silent_events
+        ), f"Expected silent damage to yield no messages, got {silent_events}"
+        assert len(silent_events) == len(
+            narrated_events
+        ), f"Expected the same number of steps either way, got {len(silent_events)=}"
+
+    def test_silent_damage_reports_the_damage_taken(self):
+        # Arrange
+        attacker = EntityFactory.make_strongs(enemy=False)
+        target = EntityFactory.make_babies(enemy=True)
+        silent_events, silent_health = resolve_blows(
+            attacker, target, narrated=False, seed=11
+        )
+
+        # Action
+        taken = [
+            event["damage_taken"]["amount"]
+            for event in silent_events
+            if "damage_taken" in event
+        ]
+
+        # Assert
+        assert sum(taken) == sum(
+            10**6 - health for health in silent_health
+        ), f"Expected every blow that landed to be reported, got {taken}"
@@ -0,0 +1,18 @@
+from unittest import TestCase
+
+from src.entities.item.equipment_rewards import (ItemRollParams,
+                                                 common_item_drops)
+
+
+class ItemDropTest(TestCase):
+    def test_every_boss_gets_its_drops_rolled(self):
+        # Arrange
+        params = ItemRollParams(is_boss=True)
+
+        # Action
+        drops = [[*common_item_drops[params]] for _ in range(3)]
+
+        # Assert
+        assert all(
+            len(rolled) == 2 for rolled in drops
+        ), f"Expected a weapon and a helmet rolled for each boss, got {drops}"
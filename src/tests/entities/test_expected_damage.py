@@ -0,0 +1,71 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.entities.combat.expected_damage import DamageOutcomes, DamageProfile
+from src.entities.combat.weapon_attacks import NormalAttack
+from src.tests.fixtures import EntityFactory
+
+
+class ExpectedDamageTest(unittest.TestCase):
+    def test_outcomes_match_sampled_normal_attacks(self):
+        # Arrange
+        attacker = EntityFactory.make_strongs(enemy=False)
+        target = EntityFactory.make_babies(enemy=True)
+        profile = DamageProfile.of(NormalAttack(attacker.fighter))
+        random.seed(3)
+        samples = []
+        for _ in range(2000):
+            target.fighter.health.current = 10**6
+            damage = attacker.fighter.gear.weapon.emit_damage()
+            for _ in damage.resolve_damage(target):
+                pass
+            samples.append(int(damage.final_damage))
+
+        # Action
+        outcomes = DamageOutcomes.against_entities(profile, [target])
+
+        # Assert
+        distribution = outcomes.distribution(0)
+        assert {*samples} <= {
+            *distribution
+        }, f"Sampled damage {set(samples) - set(distribution)} should be possible"
+        self.assertAlmostEqual(outcomes.expected[0], np.mean(samples), delta=0.5)
+
+    def test_outcomes_are_worked_out_for_many_targets_at_once(self):
+        # Arrange
+        profile = DamageProfile.normal_attack(
+            power=10, attack_dice=1, attack_dice_faces=6, crit=0
+        )
+        defence, evasion = np.array([0, 5, 10, 10]), np.array([0, 0, 0, 0.5])
+
+        # Action
+        outcomes = DamageOutcomes.against(profile, defence, evasion)
+
+        # Assert
+        np.testing.assert_allclose(outcomes.probs.sum(axis=1), 1)
+        expected = outcomes.expected
+        assert (
+            expected[0] > expected[1] > expected[2] > expected[3]
+        ), f"Expected defence and evasion to reduce the damage, got {expected}"
+        # Only evading can save an undefended target
+        self.assertAlmostEqual(outcomes.kill_chance(np.full(4, 11))[0], 1 - 1 / 101)
+
+    def test_spells_are_neither_evaded_nor_crit(self):
+        # Arrange
+        missile = DamageProfile.magic_missile(damage=5)
+        fireball = DamageProfile.fireball(min_damage=5, max_damage=15)
+
+        # Action
+        missile_outcomes = DamageOutcomes.against(missile, [10], [1.0])
+        fireball_outcomes = DamageOutcomes.against(fireball, [0], [1.0])
+
+        # Assert
+        assert missile_outcomes.distribution(0) == {
+            5: 1.0
+        }, f"Magic missiles always do their damage, got {missile_outcomes.distribution(0)}"
+        assert [*fireball_outcomes.distribution(0)] == [
+            *range(5, 16)
+        ], f"Got {fireball_outcomes.distribution(0)}"
+        self.assertAlmostEqual(fireball_outcomes.expected[0], 10)
@@ -0,0 +1,76 @@
+import random
+from unittest import TestCase
+
+from src.entities.combat.fighter_factory import (MERC_STAT_BLOCKS,
+                                                 RecruitmentPool, create_many)
+
+
+class FighterFactoryTest(TestCase):
+    stats = MERC_STAT_BLOCKS[0]
+
+    def test_create_many_rolls_within_the_stat_block(self):
+        # Arrange
+        names = [f"Merc {i}" for i in range(50)]
+
+        # Action
+        mercs = create_many(self.stats, len(names), names)
+
+        # Assert
+        made = [merc.name.first_name for merc in mercs]
+        assert made == names, f"Expected the mercs to be named in order, got {made}"
+        for merc in mercs:
+            fighter = merc.fighter
+            low, high = self.stats.defence
+            assert (
+                low <= fighter.stats.defence <= high
+            ), f"Expected defence within {self.stats.defence}, got {fighter}"
+            low, high = self.stats.power
+            assert (
+                low <= fighter.stats.power <= high
+            ), f"Expected power within {self.stats.power}, got {fighter}"
+            assert 1 <= merc.cost <= 5, f"Expected a cost from 1 to 5, got {merc.cost}"
+            assert (
+                fighter.gear.weapon is not None
+            ), f"Expected {merc.name} to have a weapon equipped, got {fighter.gear.weapon}"
+            assert (
+                merc._entity_sprite is None
+            ), f"Expected the sprite to wait until it's asked for, got {merc._entity_sprite}"
+            assert (
+                fighter.gear.weapon._sprite is None
+            ), f"Expected the item sprite to wait until it's asked for, got {fighter.gear.weapon._sprite}"
+            assert (
+                fighter.modifiable_stats.is_cached
+            ), f"Expected {merc.name} to have their stats worked out, got {fighter}"
+
+    def test_create_many_follows_the_random_state(self):
+        # Arrange
+        state = random.getstate()
+        rolls = []
+
+        # Action
+        for _ in range(2):
+            random.setstate(state)
+            mercs = create_many(self.stats, 10, [f"Merc {i}" for i in range(10)])
+            rolls.append([merc.fighter.stats for merc in mercs])
+
+        # Assert
+        assert rolls[0] == rolls[1], f"Expected the same rolls, got {rolls}"
+
+    def test_create_many_needs_a_name_for_every_fighter(self):
+        # Action & Assert
+        with self.assertRaises(ValueError):
+            create_many(self.stats, 3, ["Merc 0", "Merc 1"])
+
+    def test_the_pool_is_filled_with_differently_named_recruits(self):
+        # Arrange
+        pool = RecruitmentPool(15)
+
+        # Action
+        pool.fill_pool()
+
+        # Assert
+        assert len(pool.pool) == 15, f"Expected 15 recruits, got {len(pool.pool)}"
+        names = {recruit.name.first_name for recruit in pool.pool}
+        assert (
+            len(names) == 15
+        ), f"Expected every recruit to have their own name, got {names}"
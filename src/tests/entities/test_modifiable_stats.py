@@ -0,0 +1,51 @@
+import unittest
+
+from src.entities.combat.modifiable_stats import ModifiableStats, Modifier
+from src.entities.combat.stats import FighterStats
+
+
+class ModifiableStatsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base = FighterStats(defence=2, power=4, speed=3)
+        self.flat = Modifier(FighterStats, base=FighterStats(power=2))
+        self.percent = Modifier(FighterStats, percent=FighterStats(speed=50))
+        self.stats = ModifiableStats(FighterStats, base_stats=self.base)
+
+    def test_current_is_the_sum_of_the_modifiers_applied_to_the_base(self):
+        # Arrange
+        self.stats.include_modifier(self.flat)
+        self.stats.include_modifier(self.percent)
+        expected = sum(
+            [Modifier.identity(FighterStats), self.flat, self.percent],
+            Modifier.identity(FighterStats),
+        ).apply(self.base)
+
+        # Action
+        current = self.stats.current
+
+        # Assert
+        assert current == expected, f"Expected {expected}, got {current}"
+
+    def test_current_is_cached_until_the_stats_change(self):
+        # Arrange
+        first = self.stats.current
+        changes = [
+            lambda: self.stats.include_modifier(self.flat),
+            lambda: self.stats.remove(self.flat),
+            lambda: self.stats.set_modifiers([self.percent]),
+            lambda: self.stats.clear_modifiers(),
+            lambda: self.stats.update_base_stats(self.base + self.base),
+        ]
+
+        # Assert
+        assert self.stats.current is first, "Expected unchanged stats to be cached"
+
+        for change in changes:
+            # Action
+            before = self.stats.current
+            change()
+            after = self.stats.current
+
+            # Assert
+            assert after is not before, f"Expected {change} to invalidate the cache"
+            assert after == self.stats._apply_modifiers(), f"Stale stats {after}"
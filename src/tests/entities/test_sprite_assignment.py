@@ -0,0 +1,53 @@
+import random
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.entities.combat.fighter_factory import create_random_goblin
+from src.entities.sprites import AnimatedSpriteAttribute, SimpleSpriteAttribute
+
+
+class HeadlessSpritesTest(TestCase):
+    def test_headless_entities_build_their_sprites_when_asked(self):
+        # Arrange
+        with patch("src.config.HEADLESS", True):
+            goblin = create_random_goblin("Gob")
+
+        # Assert
+        assert (
+            goblin._entity_sprite is None
+        ), f"Expected no sprite until one is asked for, got {goblin._entity_sprite}"
+        assert (
+            goblin.fighter.gear.weapon._sprite is None
+        ), f"Expected no item sprite until one is asked for, got {goblin.fighter.gear.weapon._sprite}"
+
+        # Action
+        sprite = goblin.entity_sprite
+        item_sprite = goblin.fighter.gear.weapon.sprite
+
+        # Assert
+        assert isinstance(
+            sprite, AnimatedSpriteAttribute
+        ), f"Expected a sprite once asked for, got {sprite}"
+        assert (
+            sprite.owner is goblin
+        ), f"Expected the goblin to own its sprite, got {sprite.owner}"
+        assert isinstance(
+            item_sprite, SimpleSpriteAttribute
+        ), f"Expected an item sprite once asked for, got {item_sprite}"
+
+    def test_headless_entities_use_the_random_state_the_same(self):
+        # Arrange
+        draws = {}
+        state = random.getstate()
+
+        # Action
+        for headless in (False, True):
+            random.setstate(state)
+            with patch("src.config.HEADLESS", headless):
+                create_random_goblin("Gob")
+            draws[headless] = random.random()
+
+        # Assert
+        assert (
+            draws[True] == draws[False]
+        ), f"Expected the same random state after creating a goblin, got {draws}"
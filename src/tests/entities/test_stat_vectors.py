@@ -0,0 +1,61 @@
+import unittest
+
+from src.entities.combat.modifiable_stats import ModifiableStats, Modifier
+from src.entities.combat.stat_vectors import current_stats, team_stats
+from src.entities.combat.stats import EquippableItemStats, FighterStats
+from src.tests.fixtures import EncounterFactory
+
+
+class StatVectorsTest(unittest.TestCase):
+    def modifiable(self, n: int) -> ModifiableStats:
+        stats = ModifiableStats(
+            FighterStats, base_stats=FighterStats(defence=n, power=2 * n, speed=3)
+        )
+        for i in range(n % 3):
+            stats.include_modifier(
+                Modifier(
+                    FighterStats,
+                    base=FighterStats(power=i + 1),
+                    percent=FighterStats(speed=10.5 * i, defence=-25),
+                )
+            )
+        return stats
+
+    def test_batched_stats_match_reading_each_one(self):
+        # Arrange
+        batched = [self.modifiable(n) for n in range(7)]
+        single = [self.modifiable(n) for n in range(7)]
+
+        # Action
+        actual = current_stats(batched)
+
+        # Assert
+        expected = [stats.current for stats in single]
+        assert actual == expected, f"Expected {expected}, got {actual}"
+        assert all(
+            stats.is_cached and stats.current is result
+            for stats, result in zip(batched, actual)
+        ), "Expected the batched results to be cached on the stats"
+
+    def test_stats_of_different_classes_cannot_be_mixed(self):
+        # Arrange
+        mixed = [
+            self.modifiable(1),
+            ModifiableStats(EquippableItemStats, EquippableItemStats()),
+        ]
+
+        # Action & Assert
+        with self.assertRaises(TypeError):
+            current_stats(mixed)
+
+    def test_team_stats_are_the_current_stats_of_each_member(self):
+        # Arrange
+        team = EncounterFactory._make_team(strong_count=2, baby_count=2)
+
+        # Action
+        stats = team_stats(team)
+
+        # Assert
+        assert stats == [
+            entity.fighter.modifiable_stats.current for entity in team
+        ], f"Got {stats}"
@@ -10,7 +10,7 @@ from src.entities.gear.gear import Gear
 from src.entities.gear.weapons import sword
 from src.entities.item.inventory import Inventory
 from src.systems.combat import CombatRound
-from src.tests.fixtures import EncounterFactory, FighterFixtures
+from src.tests.fixtures import EncounterFactory, EntityFactory, FighterFixtures
 from src.world.level.dungeon import Dungeon
 from src.world.level.room import Room
 from src.world.level.room_layouts import basic_room
@@ -93,3 +93,48 @@ class CombatRoundTest(TestCase):
         assert (
             combat_round and combat_round.victor() is not None
         ), "No clear winner, seems sus."
+
+    def test_purged_fighters_leave_the_round_order(self):
+        # Arrange
+        mercs = [EntityFactory.make_strongs(enemy=False, count=n) for n in range(20)]
+        enemies = [EntityFactory.make_babies(enemy=True, count=n) for n in range(20)]
+        combat_round = CombatRound(mercs, enemies)
+        order = [*combat_round._round_order]
+        purged = order[1::2]
+
+        # Action
+        for fighter in purged:
+            combat_round._purge_fighter(fighter)
+        taken_turns = []
+        while combat_round.continues():
+            taken_turns.append(combat_round.current_combatant(pop=True))
+
+        # Assert
+        assert (
+            taken_turns == order[::2]
+        ), "Expected the remaining fighters to take their turns in initiative order"
+        for team, members in enumerate(combat_round.teams):
+            assert not {*members} & {
+                *purged
+            }, f"Expected purged fighters to have left team {team}"
+        assert combat_round.get_enemies(1) == [
+            enemy.fighter for enemy in enemies if enemy.fighter not in purged
+        ], "Expected the enemies still in the round, in team order"
+
+    def test_purging_a_fighter_twice_leaves_the_teams_alone(self):
+        # Arrange
+        mercs = [EntityFactory.make_strongs(enemy=False, count=n) for n in range(2)]
+        enemies = [EntityFactory.make_babies(enemy=True, count=n) for n in range(2)]
+        combat_round = CombatRound(mercs, enemies)
+        fighter = mercs[0].fighter
+
+        # Action
+        combat_round._purge_fighter(fighter)
+        combat_round._purge_fighter(fighter)
+
+        # Assert
+        teams = combat_round.teams
+        assert teams == (
+            [mercs[1].fighter],
+            [enemy.fighter for enemy in enemies],
+        ), f"Expected only the purged fighter to have left, got {teams}"
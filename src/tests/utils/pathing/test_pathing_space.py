@@ -87,6 +87,39 @@ class TestPathing(unittest.TestCase):
             end_at in path
         ), f"The path did not include intended destination {end_at=}. Full path: {path=}"
 
+    def test_paths_reach_an_occupied_origin(self) -> None:
+        # Arrange
+        space = PathingSpace(minima=Node(x=0, y=0), maxima=Node(x=10, y=10))
+        origin = space.minima
+        space.exclusions = {origin, Node(x=0, y=5)}
+
+        # Action
+        path = space.get_path(Node(x=7, y=7), origin)
+
+        # Assert
+        assert path is not None, "Expected a path to the fighter at the origin"
+        assert path[-1] == origin, f"Expected the path to end at the origin, {path=}"
+        assert (
+            origin in space.exclusions
+        ), f"Expected the origin to be excluded again, {space.exclusions=}"
+
+    def test_clones_can_be_pathed_on_without_changing_the_original(self) -> None:
+        # Arrange
+        space = PathingSpace(minima=Node(x=0, y=0), maxima=Node(x=10, y=10))
+        wall = gated_wall(gap=0, v_pos=5, wall_len=width)
+
+        # Action
+        clone = space.clone()
+        clone.exclusions = wall
+        path = clone.get_path(clone.minima, clone.maxima.south.west)
+
+        # Assert
+        assert not space.exclusions, f"The original was changed, {space.exclusions=}"
+        assert (
+            clone.strategy.space is clone
+        ), "The clone's pathing strategy should look at the clone"
+        assert not {*path} & wall, f"The clone's path ignored its exclusions {path=}"
+
 
 class TestConstructFromLevelGeometry(unittest.TestCase):
     def get_trivial_level(self) -> tuple[TerrainNode]:
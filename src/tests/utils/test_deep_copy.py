@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+from src.utils.deep_copy import FrozenMapping, copy, frozen
+
+
+def choices_event() -> dict:
+    return {
+        "await_input": "fighter",
+        "choices": {
+            "move": [{"name": "move", "cost": 1}],
+            "end turn": [{"name": "end turn", "cost": 0}],
+        },
+    }
+
+
+class FrozenTest(TestCase):
+    def test_reads_fall_through_to_the_base(self):
+        # Arrange
+        event = choices_event()
+
+        # Action
+        view = frozen(event)
+
+        # Assert
+        assert isinstance(view, FrozenMapping), f"Expected a view, got {type(view)}"
+        assert view == event, f"Expected the view to read as the event, got {view}"
+        assert (
+            view["choices"]["move"][0]["cost"] == 1
+        ), f"Expected nested reads to fall through, got {view['choices']}"
+
+    def test_nothing_can_be_changed_through_the_view(self):
+        # Arrange
+        view = frozen(choices_event())
+        writes = [
+            lambda: view.__setitem__("await_input", "someone else"),
+            lambda: view["choices"].pop("end turn"),
+            lambda: view["choices"]["move"].pop(),
+            lambda: view["choices"]["move"][0].__setitem__("cost", 5),
+        ]
+
+        # Action & Assert
+        for write in writes:
+            with self.assertRaises((TypeError, AttributeError)):
+                write()
+
+        assert view == choices_event(), f"Expected the event to be unchanged, {view=}"
+
+    def test_copy_thaws_the_view(self):
+        # Arrange
+        view = frozen(choices_event())
+
+        # Action
+        copied = copy(view)
+        copied["choices"]["move"].append({"name": "move", "cost": 2})
+
+        # Assert
+        assert type(copied) is dict, f"Expected a plain dict, got {type(copied)}"
+        assert (
+            type(copied["choices"]["move"]) is list
+        ), f"Expected nested lists to be plain, got {copied['choices']}"
+        assert (
+            len(view["choices"]["move"]) == 1
+        ), f"Expected the view to be unchanged, got {view['choices']['move']}"
@@ -0,0 +1,74 @@
+import random
+from unittest import TestCase
+
+from src.utils.dice import D, distribution_of
+
+
+class DiceTest(TestCase):
+    def test_single_rolls_use_the_random_state_in_order(self):
+        # Arrange
+        expression = 2 * D(6) + 3 - D(4)
+        random.seed(11)
+        sixes = random.randint(1, 6) + random.randint(1, 6)
+        expected = sixes + 3 - random.randint(1, 4)
+
+        # Action
+        random.seed(11)
+        actual = expression.roll()
+
+        # Assert
+        assert actual == expected, f"Expected {expected}, got {actual}"
+
+    def test_distributions_are_exact(self):
+        # Arrange
+        two_d6 = D.from_die_vec([(2, 6)])
+
+        # Action
+        distribution = two_d6.distribution().as_dict()
+
+        # Assert
+        expected = {total: (6 - abs(total - 7)) / 36 for total in range(2, 13)}
+        assert distribution.keys() == expected.keys(), f"Got {distribution}"
+        for total, prob in expected.items():
+            self.assertAlmostEqual(distribution[total], prob, msg=f"P({total})")
+        self.assertAlmostEqual(two_d6.mean, 7)
+        self.assertAlmostEqual(two_d6.variance, 35 / 6)
+
+    def test_expressions_with_the_same_structure_share_their_distribution(self):
+        # Arrange
+        first, second = 3 * D(8) - 1, 3 * D(8) - 1
+
+        # Action
+        distributions = first.distribution(), second.distribution()
+
+        # Assert
+        assert first.node == second.node, "Expected the expressions to be equal"
+        assert (
+            distributions[0] is distributions[1]
+        ), "Expected the distribution to be cached by structure"
+        assert distribution_of.cache_info().hits, "Expected a cache hit"
+
+    def test_bulk_rolls_are_reproducible_and_in_range(self):
+        # Arrange
+        expression = 4 * D(10) + 2
+
+        # Action
+        random.seed(5)
+        first = expression.roll_many(1000)
+        random.seed(5)
+        second = expression.roll_many(1000)
+
+        # Assert
+        assert (first == second).all(), "Expected seeded bulk rolls to repeat"
+        assert first.min() >= 6 and first.max() <= 42, f"Out of range {first}"
+        self.assertAlmostEqual(first.mean(), expression.mean, delta=1)
+
+    def test_dice_cannot_be_rolled_a_negative_number_of_times(self):
+        # Action & Assert
+        with self.assertRaises(ValueError):
+            D(6) * -1
+
+    def test_dice_can_only_be_multiplied_by_whole_numbers(self):
+        # Action & Assert
+        with self.assertRaises(TypeError):
+            D(6) * 1.5
@@ -0,0 +1,136 @@
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.utils.profiling import (FrameTimes, SamplingProfiler, profile_call,
+                                 section, sections)
+
+
+def _busy_wait(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class ProfilingTest(TestCase):
+    def setUp(self):
+        sections.reset()
+        self.directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.enterContext(
+            patch("src.utils.profiling.PROFILE_DIRECTORY", self.directory)
+        )
+        self.enterContext(patch("src.config.PROFILING", True))
+
+    def test_section_timings_accumulate_in_the_registry(self):
+        # Action
+        for _ in range(3):
+            with section("test.busy_wait"):
+                _busy_wait(0.001)
+
+        # Assert
+        timer = sections.get("test.busy_wait")
+        assert timer is not None, f"Section was not registered: {sections.to_dict()}"
+        assert timer.calls == 3, f"Expected 3 calls, got {timer.calls}"
+        assert (
+            timer.total >= 0.003
+        ), f"Expected at least 3ms in total, got {timer.total}s"
+        assert (
+            timer.max <= timer.total
+        ), f"Max {timer.max} should never exceed total {timer.total}"
+
+    def test_section_records_time_when_the_block_raises(self):
+        # Action
+        with self.assertRaises(ValueError):
+            with section("test.raises"):
+                raise ValueError()
+
+        # Assert
+        assert (
+            sections.get("test.raises").calls == 1
+        ), f"Expected the failed block to be timed: {sections.to_dict()}"
+
+    def test_profiled_calls_return_their_result_and_write_stats(self):
+        # Arrange
+        @profile_call
+        def add(a, b):
+            return a + b
+
+        # Action
+        result = add(1, 2)
+
+        # Assert
+        assert result == 3, f"Expected 3, got {result}"
+        for suffix in (".prof", ".txt"):
+            stats_path = self.directory / f"{add.__qualname__}{suffix}"
+            assert stats_path.exists(), f"Nothing was written to {stats_path}"
+
+    def test_nothing_is_profiled_unless_enabled(self):
+        # Arrange
+        @profile_call
+        def add(a, b):
+            return a + b
+
+        # Action
+        with patch("src.config.PROFILING", False):
+            result = add(1, 2)
+            with section("test.disabled"):
+                pass
+
+        # Assert
+        assert result == 3, f"Expected 3, got {result}"
+        assert not any(
+            self.directory.iterdir()
+        ), f"Expected no profile to be written, got {[*self.directory.iterdir()]}"
+        assert (
+            sections.get("test.disabled") is None
+        ), f"Expected the section not to be timed, got {sections.to_dict()}"
+
+    def test_sampler_records_the_stack_of_the_busy_thread(self):
+        # Arrange
+        sampler = SamplingProfiler(interval_ms=1)
+
+        # Action
+        sampler.start()
+        _busy_wait(0.05)
+        sampler.stop()
+
+        # Assert
+        assert sampler.samples, "The sampler did not record any stacks"
+        assert any(
+            stack.endswith(":_busy_wait") for stack in sampler.samples
+        ), f"Expected _busy_wait to be the leaf of some samples: {[*sampler.samples][:3]}"
+
+
+class FrameTimesTest(TestCase):
+    def test_p99_picks_out_the_occasional_hitch(self):
+        # Arrange
+        frame_times = FrameTimes(window=100)
+
+        # Action
+        for i in range(100):
+            frame_times.record(0.1 if i % 50 == 0 else 0.016)
+
+        # Assert
+        assert (
+            frame_times.percentile(0.5) == 0.016
+        ), f"Expected a median of 16ms, got {frame_times.percentile(0.5)}"
+        assert (
+            frame_times.p99() == 0.1
+        ), f"Expected a p99 of 100ms, got {frame_times.p99()}"
+
+    def test_only_the_most_recent_frames_are_kept(self):
+        # Arrange
+        frame_times = FrameTimes(window=10)
+
+        # Action
+        for _ in range(10):
+            frame_times.record(1.0)
+        for _ in range(10):
+            frame_times.record(0.01)
+
+        # Assert
+        stats = frame_times.to_dict()
+        assert stats["frames"] == 10, f"Expected 10 frames, got {stats['frames']}"
+        assert stats["max"] == 0.01, f"Expected old frames to be dropped, got {stats}"
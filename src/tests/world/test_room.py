@@ -0,0 +1,68 @@
+from unittest import TestCase
+
+from src.tests.fixtures import EncounterFactory, EntityFactory
+from src.world.level.dungeon import Dungeon
+from src.world.level.room import Room
+from src.world.level.room_layouts import basic_room
+from src.world.node import Node
+
+
+class RoomOccupancyTest(TestCase):
+    fixtures = EncounterFactory
+
+    def test_occupants_are_found_where_they_stand(self):
+        # Arrange
+        room, mercs, enemies = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        merc, enemy = mercs[0], enemies[0]
+
+        # Action
+        merc.locatable.location = merc.locatable.location + Node(1, 1)
+
+        # Assert
+        assert (
+            room.occupant_at(merc.locatable.location) is merc
+        ), f"Expected to find the merc where they moved to, {merc.locatable.location}"
+        assert (
+            room.occupant_at(room.space.minima) is None
+        ), "Expected the node the merc moved from to be empty"
+        assert room.occupants_at(
+            [enemy.locatable.location, merc.locatable.location]
+        ) == [merc, enemy], "Expected occupants in the order they entered the room"
+
+    def test_removed_occupants_are_not_found(self):
+        # Arrange
+        room, _, enemies = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        enemy = enemies[0]
+        location = enemy.locatable.location
+
+        # Action
+        room.remove(enemy)
+        enemy.locatable.location = location + Node(1, 0)
+
+        # Assert
+        assert not room.occupants_at(
+            [location, location + Node(1, 0)]
+        ), "Expected the removed enemy to be gone from the room"
+
+    def test_a_party_member_can_die_in_the_next_room(self):
+        # Arrange
+        dungeon = Dungeon(0, 0, [], [], None, None)
+        rooms = [
+            Room(dungeon=dungeon).set_layout(basic_room((10, 10))) for _ in range(2)
+        ]
+        merc = EntityFactory.make_strongs(enemy=False)
+        rooms[0].include_party([merc])
+        rooms[0].exclude_party([merc])
+        rooms[1].include_party([merc])
+
+        # Action
+        merc.die()
+
+        # Assert
+        assert merc not in rooms[0].occupants, "Expected the merc to have left room 0"
+        assert (
+            merc not in rooms[1].occupants
+        ), "Expected the dead merc to be gone from room 1"
+        assert (
+            rooms[1].occupant_at(rooms[1].entry_door) is None
+        ), "Expected nobody left where the merc stood"
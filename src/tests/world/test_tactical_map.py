@@ -0,0 +1,75 @@
+from unittest import TestCase
+
+from src.entities.ai.snapshot import CombatantView
+from src.tests.fixtures import EncounterFactory
+from src.world.node import Node
+from src.world.ray import Ray
+
+
+class TacticalMapTest(TestCase):
+    fixtures = EncounterFactory
+
+    def test_facts_are_shared_until_someone_moves(self):
+        # Arrange
+        room, mercs, enemies = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        merc, enemy = mercs[0], enemies[0]
+        tactical_map = room.tactical_map
+        path = tactical_map.path(merc.locatable.location, enemy.locatable.location)
+
+        # Action
+        unmoved = room.tactical_map
+        merc.locatable.location = merc.locatable.location + Node(1, 1)
+        moved = room.tactical_map
+
+        # Assert
+        assert unmoved is tactical_map, "Expected the map to be shared before a move"
+        assert (
+            unmoved.path(merc.locatable.location - Node(1, 1), enemy.locatable.location)
+            is path
+        ), "Expected the path to be worked out once"
+        assert moved is not tactical_map, "Expected a new map once someone has moved"
+        assert moved.path(merc.locatable.location, enemy.locatable.location) == tuple(
+            room.space.get_path(merc.locatable.location, enemy.locatable.location)
+        ), "Expected the new map's paths to start from the new location"
+
+    def test_line_of_sight_matches_casting_a_ray(self):
+        # Arrange
+        room, _, _ = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        eye = room.space.minima
+
+        # Action
+        visible = {
+            node
+            for node in room.space.all_included_nodes(exclude_dynamic=False)
+            if room.tactical_map.can_see(eye, node)
+        }
+
+        # Assert
+        expected = {
+            node
+            for node in room.space.all_included_nodes(exclude_dynamic=False)
+            if node != eye and node in Ray(eye).line_of_sight(room.space, node)
+        }
+        assert (
+            visible == expected
+        ), f"Expected the same sight lines, got {visible ^ expected}"
+
+    def test_threat_counts_attackers_in_reach(self):
+        # Arrange
+        room, _, _ = self.fixtures.one_vs_one_enemies_lose(room_size=10)
+        attackers = [
+            CombatantView(0, Node(2, 2), True, 10, speed=1, weapon_range=1),
+            CombatantView(1, Node(6, 2), True, 10, speed=1, weapon_range=1),
+        ]
+
+        # Action
+        threat = room.tactical_map.threat(
+            attackers, [Node(4, 2), Node(2, 4), Node(8, 8)]
+        )
+
+        # Assert
+        assert threat.tolist() == [
+            2,
+            1,
+            0,
+        ], f"Expected 2 attackers, then 1, then none in reach, got {threat}"
@@ -9,7 +9,7 @@ from pyglet.math import Mat4, Vec2, Vec3, Vec4
 
 from src import config
 from src.entities.sprites import BaseSprite, SpriteMetaData
-from src.gui.biome_textures import Biome, BiomeName, biome_map, tiles
+from src.gui.biome_textures import Biome, BiomeName, biome_map
 from src.gui.combat.highlight import HighlightLayer
 from src.gui.components.lighting_shader import ShaderPipeline
 from src.textures.texture_data import SpriteSheetSpecs
@@ -380,7 +380,7 @@ class LayoutSection(arcade.Section):
         self.teardown_level()
         for block in self.layout:
             texture = block.texture
-            main_sheet_idx = tiles.index(texture)
+            main_sheet_idx = SpriteSheetSpecs.tiles.loaded.index(texture)
             sprite = BaseSprite(
                 texture,
                 scale=self.SPRITE_SCALE,
@@ -34,10 +34,14 @@ class HelpCommand(metaclass=CommandMeta):
             f"- debug_commands: Print a dict of available CLI commands. Mostly for development to check commands are registered.\n"
             f"- gen_hashes: Generate hashes from a url resource defined in generate_hashes.py. Write hashes to a file. Used to constrain proc_gen naming.\n"
             f"- archive_assets: Zip and upload the assets folder of the project to GoogleDrive.\n"
-            f"- get_assets: Download the assets zip from GoogleDrive. The zip will be found in adventure_league/assets after download.\n\n"
+            f"- get_assets: Download the assets zip from GoogleDrive. The zip will be found in adventure_league/assets after download.\n"
+            f"- bench_persistence: Benchmark saving and loading generated guilds and check for regressions against the stored baseline. Pass --update-baseline to replace it.\n"
+            f"- dump_profile: Print the profiling results written to the profiles folder by profile_call and section timers (set PROFILING=1), and the sampling profiler (set PROFILE_SAMPLING=1).\n"
+            f"- replay: Replay a combat recording headlessly and report how long it took. Combat is recorded to the replays folder when RECORD_COMBAT=1.\n\n"
             f"Main Project Commands:\n\n"
             f"- python main.py -m D: run the project in Debug Mode.\n"
-            f"- python main.py -m S: run the sprite viewer util."
+            f"- python main.py -m S: run the sprite viewer util.\n"
+            f"- python main.py -m R <recording> [speed]: watch a combat recording, optionally sped up."
         )
 
         print(f"{help_doc}")
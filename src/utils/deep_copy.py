@@ -1,14 +1,81 @@
-def copy(d: dict | list) -> dict | list:
+from collections.abc import Mapping, Sequence
+from typing import Any, Iterator
+
+
+class FrozenMapping(Mapping):
+    """
+    A read-only view of a mapping. Nested mappings and lists are wrapped as they're read,
+    so nothing is copied up front. copy() gives back plain containers that can be changed.
+    """
+
+    __slots__ = ("_base",)
+
+    def __init__(self, base: Mapping):
+        self._base = base
+
+    def __getitem__(self, key) -> Any:
+        return frozen(self._base[key])
+
+    def __iter__(self) -> Iterator:
+        return iter(self._base)
+
+    def __len__(self) -> int:
+        return len(self._base)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._base!r})"
+
+
+class FrozenList(Sequence):
+    __slots__ = ("_base",)
+
+    def __init__(self, base: list):
+        self._base = base
+
+    def __getitem__(self, index) -> Any:
+        if isinstance(index, slice):
+            return FrozenList(self._base[index])
+
+        return frozen(self._base[index])
+
+    def __len__(self) -> int:
+        return len(self._base)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FrozenList):
+            other = other._base
+
+        return self._base == other
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._base!r})"
+
+
+def frozen(value: Any) -> Any:
+    """
+    A read-only view of a mapping or list, for handing the same event data to several
+    subscribers. Anything else is returned as-is.
+    """
+    if isinstance(value, Mapping) and not isinstance(value, FrozenMapping):
+        return FrozenMapping(value)
+    elif isinstance(value, list):
+        return FrozenList(value)
+    else:
+        return value
+
+
+def copy(d: Mapping | list) -> dict | list:
     # dict case, iterate over items, copying the value and inserting it into frest
-    # dict at the corresponding key.
-    if isinstance(d, dict):
+    # dict at the corresponding key. Read-only mappings like event envelopes are copied
+    # into plain dicts.
+    if isinstance(d, Mapping):
         result = {}
         for k, v in d.items():
             result[k] = copy(v)
         return result
 
     # list case iterates over items, appending them to a freshly instantiated list
-    elif isinstance(d, list):
+    elif isinstance(d, (list, FrozenList)):
         result = []
         for item in d:
             result.append(copy(item))
@@ -1,30 +1,290 @@
 from __future__ import annotations
 
+import functools
 import random
-from typing import Callable, Self
+from dataclasses import dataclass
+from typing import Callable, NamedTuple, Self
+
+import numpy as np
+
+Number = int | float
+
+
+class Distribution(NamedTuple):
+    """
+    The exact distribution of a dice expression. The probability of rolling
+    offset + i is probs[i].
+    """
+
+    offset: Number
+    probs: np.ndarray
+
+    @classmethod
+    def constant(cls, value: Number) -> Distribution:
+        return cls(value, np.ones(1))
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.offset + np.arange(len(self.probs))
+
+    @property
+    def mean(self) -> float:
+        return float(self.values @ self.probs)
+
+    @property
+    def variance(self) -> float:
+        return float((self.values - self.mean) ** 2 @ self.probs)
+
+    def as_dict(self) -> dict[Number, float]:
+        return {
+            value: prob
+            for value, prob in zip(self.values.tolist(), self.probs.tolist())
+            if prob
+        }
+
+    def __add__(self, other: Distribution) -> Distribution:
+        return Distribution(
+            self.offset + other.offset, np.convolve(self.probs, other.probs)
+        )
+
+    def __neg__(self) -> Distribution:
+        return Distribution(-(self.offset + len(self.probs) - 1), self.probs[::-1])
+
+    def __mul__(self, other: Distribution) -> Distribution:
+        products: dict[Number, float] = {}
+        for a, p in zip(self.values.tolist(), self.probs.tolist()):
+            for b, q in zip(other.values.tolist(), other.probs.tolist()):
+                products[a * b] = products.get(a * b, 0.0) + p * q
+
+        return Distribution.from_dict(products)
+
+    @classmethod
+    def from_dict(cls, probs: dict[Number, float]) -> Distribution:
+        lowest, highest = min(probs), max(probs)
+        if any(value != int(value) for value in probs) and lowest != highest:
+            raise ValueError("Only whole number outcomes have a distribution")
+
+        dense = np.zeros(int(highest - lowest) + 1)
+        for value, prob in probs.items():
+            dense[int(value - lowest)] += prob
+
+        return cls(lowest, dense)
+
+
+# The nodes of a dice expression. They are immutable and compare by structure, so that
+# the work done for one expression can be reused for every other built the same way.
+# Children are rolled left to right, so seeded single rolls are reproducible.
+
+
+class Node:
+    __slots__ = ()
+
+    def roll(self) -> Number:
+        raise NotImplementedError()
+
+    def roll_many(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        raise NotImplementedError()
+
+    def distribution(self) -> Distribution:
+        raise NotImplementedError()
+
+
+@dataclass(frozen=True, slots=True)
+class Const(Node):
+    value: Number
+
+    def roll(self) -> Number:
+        return self.value
+
+    def roll_many(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        return np.full(n, self.value)
+
+    def distribution(self) -> Distribution:
+        return Distribution.constant(self.value)
+
+
+@dataclass(frozen=True, slots=True)
+class Die(Node):
+    faces: int
+
+    def roll(self) -> int:
+        return random.randint(1, self.faces)
+
+    def roll_many(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        return rng.integers(1, self.faces, size=n, endpoint=True)
+
+    def distribution(self) -> Distribution:
+        return Distribution(1, np.full(self.faces, 1 / self.faces))
+
+
+@dataclass(frozen=True, slots=True)
+class Repeat(Node):
+    """
+    The total of count independent rolls of the term.
+    """
+
+    count: int
+    term: Node
+
+    def __post_init__(self):
+        if self.count < 0:
+            raise ValueError(
+                f"Cannot roll dice a negative number of times, {self.count}"
+            )
+
+    def roll(self) -> Number:
+        return sum([self.term.roll() for _ in range(self.count)])
+
+    def roll_many(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        total = np.zeros(n, dtype=np.int64)
+        for _ in range(self.count):
+            total = total + self.term.roll_many(n, rng)
+
+        return total
+
+    def distribution(self) -> Distribution:
+        total, term = Distribution.constant(0), distribution_of(self.term)
+        count = self.count
+        # Convolve by squaring, so 100d6 takes 7 convolutions rather than 100
+        while count:
+            if count & 1:
+                total = total + term
+            count >>= 1
+            if count:
+                term = term + term
+
+        return total
+
+
+@dataclass(frozen=True, slots=True)
+class Add(Node):
+    left: Node
+    right: Node
+
+    def roll(self) -> Number:
+        return self.left.roll() + self.right.roll()
+
+    def roll_many(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        return self.left.roll_many(n, rng) + self.right.roll_many(n, rng)
+
+    def distribution(self) -> Distribution:
+        return distribution_of(self.left) + distribution_of(self.right)
+
+
+@dataclass(frozen=True, slots=True)
+class Sub(Node):
+    left: Node
+    right: Node
+
+    def roll(self) -> Number:
+        return self.left.roll() - self.right.roll()
+
+    def roll_many(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        return self.left.roll_many(n, rng) - self.right.roll_many(n, rng)
+
+    def distribution(self) -> Distribution:
+        return distribution_of(self.left) + -distribution_of(self.right)
+
+
+@dataclass(frozen=True, slots=True)
+class Mul(Node):
+    left: Node
+    right: Node
+
+    def roll(self) -> Number:
+        return self.left.roll() * self.right.roll()
+
+    def roll_many(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        return self.left.roll_many(n, rng) * self.right.roll_many(n, rng)
+
+    def distribution(self) -> Distribution:
+        return distribution_of(self.left) * distribution_of(self.right)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Custom(Node):
+    """
+    An arbitrary roll function. It can be rolled, but has no known distribution.
+    """
+
+    roll_fn: Callable[[], Number]
+
+    def roll(self) -> Number:
+        return self.roll_fn()
+
+    def roll_many(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        return np.fromiter(
+            (self.roll_fn() for _ in range(n)), dtype=np.float64, count=n
+        )
+
+    def distribution(self) -> Distribution:
+        raise ValueError(f"The distribution of {self.roll_fn} is unknown")
+
+
+@functools.lru_cache(maxsize=1024)
+def distribution_of(node: Node) -> Distribution:
+    distribution = node.distribution()
+    # Shared by every expression with the same structure, so it mustn't be changed
+    distribution.probs.flags.writeable = False
+    return distribution
+
+
+def _as_node(term: Number | D) -> Node:
+    if isinstance(term, D):
+        return term.node
+
+    return Const(term)
 
 
 class D:
-    _roll: Callable[[], int]
+    """
+    A dice expression, e.g. 2 * D(6) + 3. Combining dice builds a tree of nodes rather
+    than rolling, so an expression can be rolled once, rolled in bulk, or have its exact
+    distribution worked out.
+    """
+
+    node: Node
 
     def __init__(self, faces: int):
-        if faces:
-            self._roll = lambda: random.randint(1, faces)
-        else:
-            self._roll = lambda: 0
+        self.node = Die(faces) if faces else Const(0)
 
-    def __call__(self) -> int:
-        return self._roll()
+    def __call__(self) -> Number:
+        return self.node.roll()
 
-    def roll(self) -> int:
+    def roll(self) -> Number:
         return self()
 
+    def roll_many(self, n: int, rng: np.random.Generator | None = None) -> np.ndarray:
+        """
+        n independent rolls of the expression. By default, the generator is seeded from
+        the random module so seeding that makes bulk rolls reproducible too.
+        """
+        if rng is None:
+            rng = np.random.default_rng(random.getrandbits(64))
+
+        return self.node.roll_many(n, rng)
+
+    def distribution(self) -> Distribution:
+        return distribution_of(self.node)
+
+    @property
+    def mean(self) -> float:
+        return self.distribution().mean
+
+    @property
+    def variance(self) -> float:
+        return self.distribution().variance
+
     @classmethod
-    def from_roll(cls, roll: Callable) -> Self:
+    def from_node(cls, node: Node) -> Self:
         d = object.__new__(cls)
-        d._roll = roll
+        d.node = node
         return d
 
+    @classmethod
+    def from_roll(cls, roll: Callable) -> Self:
+        return cls.from_node(Custom(roll))
+
     @classmethod
     def from_die_vec(cls, vec: list[tuple[int, int]]) -> Self:
         d = D(0)
@@ -35,33 +295,33 @@ class D:
 
     def __rmul__(self, other: int | Self) -> Self:
         if isinstance(other, int):
-            return D.from_roll(lambda: sum([self() for _ in range(other)]))
+            return D.from_node(Repeat(other, self.node))
 
-        return D.from_roll(lambda: other() * self())
+        if not isinstance(other, D):
+            # Fractional results have no distribution over whole numbers
+            raise TypeError(
+                f"Dice can only be multiplied by whole numbers, got {other}"
+            )
+
+        return D.from_node(Mul(other.node, self.node))
 
     def __mul__(self, other: int | Self):
         return self.__rmul__(other)
 
     def __add__(self, other: int | float | Self) -> Self:
-        if isinstance(other, int | float):
-            return D.from_roll(lambda: other + self())
-
-        return D.from_roll(lambda: other() + self())
+        return D.from_node(Add(_as_node(other), self.node))
 
     def __sub__(self, other):
-        if isinstance(other, int | float):
-            return D.from_roll(lambda: self() - other)
-
-        return D.from_roll(lambda: self() - other())
+        return D.from_node(Sub(self.node, _as_node(other)))
 
     def __rsub__(self, other):
-        if isinstance(other, int | float):
-            return D.from_roll(lambda: other - self)
-
-        return D.from_roll(lambda: other - self())
+        return D.from_node(Sub(_as_node(other), self.node))
 
     def __radd__(self, other: int | float | Self) -> Self:
         return self.__add__(other)
 
     def __iadd__(self, other: int | float | Self):
         return self.__add__(other)
+
+    def __repr__(self) -> str:
+        return f"D({self.node})"
@@ -29,7 +29,8 @@ def inoffensive(logging=True, check_func=lambda: True):
 def simple_syllable() -> str:
     letters = set(string.ascii_lowercase)
     vowels = {"a", "e", "i", "o", "u"}
-    consonants, vowels = [*(letters - vowels)], [*vowels]
+    # Sorted, because set order varies between runs and seeded names must not
+    consonants, vowels = sorted(letters - vowels), sorted(vowels)
     syllable = f"{random.choice(consonants) + random.choice(vowels) + random.choice(consonants)}"
     return syllable
 
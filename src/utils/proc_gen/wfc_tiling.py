@@ -10,18 +10,17 @@ from src.utils.dice import D
 
 CharTile = tuple[tuple[str, str, str], tuple[str, str, str], tuple[str, str, str]]
 
-tiles = SpriteSheetSpecs.tiles.loaded
-
 
 class TextureTiles:
-    grass = tiles[1]
-    ew = tiles[44]
-    ns = tiles[45]
-    nesw = tiles[48]
-    se = tiles[51]
-    ne = tiles[52]
-    nw = tiles[53]
-    sw = tiles[54]
+    # Positions in the tile sheet, which is only loaded once a texture is asked for
+    grass = 1
+    ew = 44
+    ns = 45
+    nesw = 48
+    se = 51
+    ne = 52
+    nw = 53
+    sw = 54
 
 
 class TileWeights:
@@ -140,7 +139,7 @@ class Rotation:
 
 
 def tile_map(symbol: str) -> Texture:
-    return {
+    index = {
         " ": TextureTiles.grass,
         "┼": TextureTiles.nesw,
         "┌": TextureTiles.se,
@@ -150,6 +149,7 @@ def tile_map(symbol: str) -> Texture:
         "─": TextureTiles.ew,
         "│": TextureTiles.ns,
     }[symbol]
+    return SpriteSheetSpecs.tiles.load_one(index)
 
 
 CellRot = Callable[[Tile], Tile]
@@ -0,0 +1,344 @@
+"""
+Profiling hooks for finding where the time goes.
+
+- profile_call: deterministic cProfile of every call to a decorated function.
+- section: cheap wall clock timing of a named block, accumulated in a process-wide registry.
+- SamplingProfiler: a background thread that periodically records the call stack of the
+  main thread. Opt in by setting the PROFILE_SAMPLING env var before startup.
+- FrameTimes: a rolling window of frame times, for the tail latency that averages hide.
+
+profile_call and section do nothing unless the PROFILING or PROFILE_SAMPLING env var is
+set. Everything is written to the profiles directory, where the dump_profile command
+reads it.
+"""
+
+import atexit
+import cProfile
+import functools
+import json
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, deque
+from pathlib import Path
+
+from src import config
+from src.utils.cli import CommandMeta
+
+PROFILE_DIRECTORY = Path("profiles")
+SECTIONS_FILE = "sections.json"
+SAMPLES_FILE = "samples.txt"
+FRAMES_FILE = "frames.json"
+
+
+def enabled() -> bool:
+    return config.PROFILING or config.PROFILE_SAMPLING
+
+
+def _profile_directory() -> Path:
+    if not PROFILE_DIRECTORY.exists():
+        PROFILE_DIRECTORY.mkdir(parents=True)
+
+    return PROFILE_DIRECTORY
+
+
+def profile_call(func):
+    """
+    Runs every call of the decorated function under cProfile, while profiling is enabled.
+    The raw stats are written to the profiles directory, named after the function, along
+    with a summary of the most expensive calls by cumulative time.
+    """
+
+    @functools.wraps(func)
+    def _profiled(*args, **kwargs):
+        if not enabled():
+            return func(*args, **kwargs)
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            directory = _profile_directory()
+            profiler.dump_stats(directory / f"{func.__qualname__}.prof")
+            with open(directory / f"{func.__qualname__}.txt", "w") as report:
+                pstats.Stats(profiler, stream=report).sort_stats(
+                    pstats.SortKey.CUMULATIVE
+                ).print_stats(20)
+
+    return _profiled
+
+
+class SectionTimer:
+    __slots__ = ("calls", "total", "max")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, elapsed: float):
+        self.calls += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "total": self.total,
+            "mean": self.mean,
+            "max": self.max,
+        }
+
+
+class SectionRegistry:
+    def __init__(self):
+        self._timers: dict[str, SectionTimer] = {}
+
+    def record(self, name: str, elapsed: float):
+        timer = self._timers.get(name)
+        if timer is None:
+            timer = self._timers[name] = SectionTimer()
+        timer.record(elapsed)
+
+    def get(self, name: str) -> SectionTimer | None:
+        return self._timers.get(name)
+
+    def reset(self):
+        self._timers.clear()
+
+    def to_dict(self) -> dict[str, dict]:
+        return {name: timer.to_dict() for name, timer in self._timers.items()}
+
+    def dump(self, file_path: Path | None = None) -> Path:
+        file_path = file_path or _profile_directory() / SECTIONS_FILE
+        with open(file_path, "w") as sections_file:
+            json.dump(self.to_dict(), sections_file, indent=2, sort_keys=True)
+
+        return file_path
+
+
+sections = SectionRegistry()
+
+
+class section:
+    """
+    Times the enclosed block under the given name in the section registry, while
+    profiling is enabled.
+
+    Implemented as a plain class rather than with contextlib so that wrapping hot paths
+    costs no more than two perf_counter calls and a dict lookup, or a single check when
+    profiling is off.
+
+    Usage:
+        with section("engine.process_event_queue"):
+            ...
+    """
+
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter() if enabled() else None
+        return self
+
+    def __exit__(self, *_):
+        if self._start is not None:
+            sections.record(self.name, time.perf_counter() - self._start)
+        return False
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler for code that is too hot, or runs too long, to trace
+    deterministically. A daemon thread wakes every interval and records the current stack
+    of the target thread. Stacks are kept in the collapsed "outer;...;inner count" format
+    that flamegraph tools read.
+    """
+
+    def __init__(self, interval_ms: float = 5, thread_id: int | None = None):
+        self.interval = interval_ms / 1000
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.samples: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._sample_until_stopped, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_filename}:{code.co_name}")
+            frame = frame.f_back
+
+        if stack:
+            self.samples[";".join(reversed(stack))] += 1
+
+    def _sample_until_stopped(self):
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def dump(self, file_path: Path | None = None) -> Path:
+        file_path = file_path or _profile_directory() / SAMPLES_FILE
+        with open(file_path, "w") as samples_file:
+            for stack, count in self.samples.most_common():
+                samples_file.write(f"{stack} {count}\n")
+
+        return file_path
+
+
+sampler = SamplingProfiler(interval_ms=config.PROFILE_SAMPLE_INTERVAL_MS)
+
+
+class FrameTimes:
+    """
+    Keeps the most recent frame times so that hitches show up in the high percentiles,
+    where a mean over the same frames would smooth them away.
+    """
+
+    def __init__(self, window: int = 600):
+        self._times: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self._times.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        if not self._times:
+            return 0.0
+
+        ordered = sorted(self._times)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def p99(self) -> float:
+        return self.percentile(0.99)
+
+    def to_dict(self) -> dict:
+        return {
+            "frames": len(self._times),
+            "p50": self.percentile(0.5),
+            "p99": self.p99(),
+            "max": max(self._times, default=0.0),
+        }
+
+    def dump(self, file_path: Path | None = None) -> Path:
+        file_path = file_path or _profile_directory() / FRAMES_FILE
+        with open(file_path, "w") as frames_file:
+            json.dump(self.to_dict(), frames_file, indent=2)
+
+        return file_path
+
+
+frame_times = FrameTimes()
+
+
+def start_sampling_if_enabled() -> bool:
+    """
+    Starts the sampler when PROFILE_SAMPLING is set. The samples and section timings are
+    dumped to the profiles directory when the process exits.
+    """
+    if not config.PROFILE_SAMPLING:
+        return False
+
+    sampler.start()
+    atexit.register(_dump_on_exit)
+
+    return True
+
+
+def _dump_on_exit():
+    sampler.stop()
+    sampler.dump()
+    sections.dump()
+    frame_times.dump()
+
+
+def _read_leaf_counts(samples_path: Path) -> Counter[str]:
+    leaves = Counter()
+    with open(samples_path, "r") as samples_file:
+        for line in samples_file:
+            stack, _, count = line.rstrip().rpartition(" ")
+            leaves[stack.rpartition(";")[2]] += int(count)
+
+    return leaves
+
+
+class ProfileDumpCommand(metaclass=CommandMeta):
+    name = "dump_profile"
+
+    @staticmethod
+    def run(*args):
+        """
+        Usage: python cli.py dump_profile [limit]
+
+        Prints a summary of everything in the profiles directory: the cProfile stats from
+        profile_call, the section timings, frame times and the hottest functions from
+        sampling.
+        """
+        limit = int(args[1]) if len(args) > 1 else 20
+
+        for stats_path in sorted(PROFILE_DIRECTORY.glob("*.prof")):
+            print(f"===== {stats_path.name} =====")
+            pstats.Stats(str(stats_path)).sort_stats(
+                pstats.SortKey.CUMULATIVE
+            ).print_stats(limit)
+
+        sections_path = PROFILE_DIRECTORY / SECTIONS_FILE
+        if sections_path.exists():
+            with open(sections_path, "r") as sections_file:
+                timings = json.load(sections_file)
+
+            print(f"===== {SECTIONS_FILE} =====")
+            print(
+                f"{'section':<48}{'calls':>10}{'total s':>12}{'mean ms':>12}{'max ms':>12}"
+            )
+            by_total = sorted(timings.items(), key=lambda kv: -kv[1]["total"])
+            for name, timing in by_total[:limit]:
+                print(
+                    f"{name:<48}{timing['calls']:>10}{timing['total']:>12.4f}"
+                    f"{timing['mean'] * 1000:>12.4f}{timing['max'] * 1000:>12.4f}"
+                )
+
+        frames_path = PROFILE_DIRECTORY / FRAMES_FILE
+        if frames_path.exists():
+            with open(frames_path, "r") as frames_file:
+                frames = json.load(frames_file)
+
+            print(f"===== {FRAMES_FILE} ({frames['frames']} frames) =====")
+            for stat in ("p50", "p99", "max"):
+                print(f"{stat:<8}{frames[stat] * 1000:>12.4f} ms")
+
+        samples_path = PROFILE_DIRECTORY / SAMPLES_FILE
+        if samples_path.exists():
+            leaves = _read_leaf_counts(samples_path)
+            total = sum(leaves.values())
+
+            print(f"===== {SAMPLES_FILE} ({total} samples) =====")
+            for function, count in leaves.most_common(limit):
+                print(f"{count / total:>8.2%}  {function}")
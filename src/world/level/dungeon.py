@@ -1,11 +1,14 @@
 import random
-from typing import Generator, Optional
+from typing import TYPE_CHECKING, Generator, Optional
 
 from src.entities.entity import Entity
 from src.entities.item.loot import Loot, Rewarder
 from src.gui.biome_textures import BiomeName
 from src.world.level.room import Room
 
+if TYPE_CHECKING:
+    from src.world.level.dungeon_factory import DungeonSpec
+
 
 class Dungeon(Rewarder):
     loot: Loot
@@ -33,6 +36,7 @@ class Dungeon(Rewarder):
         self.xp_reward: Optional[int] = xp_reward
         self.loot = Loot(xp=self.xp_reward, gp=self.treasure)
         self.cleared = False
+        self.spec: Optional[DungeonSpec] = None
 
     def move_to_next_room(self):
         self.current_room = next(self.room_generator())
@@ -1,8 +1,12 @@
+import random
 from random import choice, randint
+from typing import NamedTuple
 
 from src.config.constants import boss_names, boss_titles, dungeon_descriptors
-from src.entities.combat.fighter_factory import (create_random_boss,
-                                                 create_random_goblin,
+from src.entities.combat.fighter_factory import (GOBLIN_STAT_BLOCK,
+                                                 MONSTER_STAT_BLOCK,
+                                                 create_many,
+                                                 create_random_boss,
                                                  create_random_monster)
 from src.world.level.dungeon import Dungeon
 from src.world.level.room import Room
@@ -42,12 +46,12 @@ def create_random_dungeon(enemy_amount) -> Dungeon:
 def create_random_enemy_room(enemy_amount, biome) -> Room:
     room = Room(biome=biome).set_layout(random_room((10, 10)))
 
-    for enemy in range(enemy_amount):
-        roll = randint(0, 3)
-        if roll > 2:
-            room.add_entity(create_random_goblin())
-        else:
-            room.add_entity(create_random_monster())
+    # Roll for every enemy first, so each kind can be made in one go
+    is_goblin = [randint(0, 3) > 2 for _ in range(enemy_amount)]
+    goblins = iter(create_many(GOBLIN_STAT_BLOCK, sum(is_goblin)))
+    monsters = iter(create_many(MONSTER_STAT_BLOCK, is_goblin.count(False)))
+    for goblin in is_goblin:
+        room.add_entity(next(goblins) if goblin else next(monsters))
 
     return room
 
@@ -87,3 +91,40 @@ def create_dungeon_with_boss_room(
         room.dungeon = d
 
     return d
+
+
+class DungeonSpec(NamedTuple):
+    """
+    Everything needed to generate the same dungeon again.
+    """
+
+    seed: int
+    max_enemies_per_room: int
+    min_enemies_per_room: int
+    room_amount: int
+
+    def build(self) -> Dungeon:
+        return create_seeded_dungeon(*self)
+
+
+def create_seeded_dungeon(
+    seed: int, max_enemies_per_room: int, min_enemies_per_room: int, room_amount: int
+) -> Dungeon:
+    """
+    Generates the dungeon from its own seed, so that the spec attached to it always
+    generates the same dungeon. The random state of the caller is left undisturbed.
+    """
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        dungeon = create_dungeon_with_boss_room(
+            max_enemies_per_room, min_enemies_per_room, room_amount
+        )
+    finally:
+        random.setstate(state)
+
+    dungeon.spec = DungeonSpec(
+        seed, max_enemies_per_room, min_enemies_per_room, room_amount
+    )
+
+    return dungeon
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generator, NamedTuple, Self, Sequence
+import itertools
+from typing import (TYPE_CHECKING, Generator, Iterable, NamedTuple, Self,
+                    Sequence)
 
 from src.gui.biome_textures import BiomeName, biome_map
 
 if TYPE_CHECKING:
     from src.world.level.dungeon import Dungeon
     from src.entities.combat.fighter import Fighter
+    from src.entities.properties.locatable import Locatable
 
 from src.entities.entity import Entity
 from src.world.level.room_layouts import Terrain, TerrainNode
+from src.world.level.tactical_map import TacticalMap
 from src.world.node import Node
 from src.world.pathing.pathing_space import PathingSpace
 
@@ -42,8 +46,20 @@ class Room:
         self.room_texturer = None
         self.enemies: list[Entity] = []
         self.occupants: list[Entity] = []
+        # The occupant on each node, kept up to date as they move, die and retreat, and
+        # the order they entered the room in
+        self._occupied: dict[Node, Entity] = {}
+        self._arrivals: dict[Entity, int] = {}
+        self._arrival_count = itertools.count()
+        # The death and retreat hooks each occupant was given, to drop when they leave
+        self._hooks: dict[Entity, tuple[list, list]] = {}
+        # Bumped whenever anyone moves, arrives or leaves
+        self._occupancy_version = 0
+        self._tactical_map: TacticalMap | None = None
         self._cleared = False
         self._size = size
+        # Whether damage done here is described blow by blow, set by the engine
+        self.narrated = True
 
     @property
     def entry_door(self) -> Node:
@@ -59,8 +75,19 @@ class Room:
         self.room_texturer = RoomTexturer(self.biome, self.layout)
         terrain = Terrain(self.layout)
         self.space = PathingSpace.from_nodes(terrain.nodes)
+        self._tactical_map = None
         return self
 
+    @property
+    def tactical_map(self) -> TacticalMap:
+        current = self._tactical_map
+        if current is None:
+            self._tactical_map = TacticalMap(self.space, self._occupancy_version)
+        elif current.version != self._occupancy_version:
+            self._tactical_map = current.successor(self.space, self._occupancy_version)
+
+        return self._tactical_map
+
     def update_pathing_obstacles(self):
         """
         Used to synchronise the traversable locations with updated entity locations
@@ -69,6 +96,7 @@ class Room:
         """
         exclusions = {occupant.locatable.location for occupant in self.occupants}
         self.space.exclusions = exclusions
+        self._occupancy_version += 1
 
     def add_entity(self, entity: Entity):
         if self.layout is None:
@@ -85,31 +113,70 @@ class Room:
         entity.make_locatable(self.space, spawn_point=spawn_point)
         self.occupants.append(entity)  # <- IMPORTANT:
         self.update_pathing_obstacles()  # <- don't change the order of these two!
+        self._arrivals[entity] = next(self._arrival_count)
+        self._occupied[entity.locatable.location] = entity
+        entity.locatable.on_move_hooks.append(self._relocate)
 
         if entity.fighter.is_enemy:
             self.enemies.append(entity)
 
-        entity.on_death_hooks.extend(
-            [
-                self.remove,
-                Entity.flush_locatable,
-            ]
-        )
-        entity.fighter.on_retreat_hooks.extend(
-            [
-                lambda f: self.remove(f.owner),
-                lambda f: Entity.flush_locatable(f.owner),
-            ]
-        )
+        death_hooks = [
+            self.remove,
+            Entity.flush_locatable,
+        ]
+        retreat_hooks = [
+            lambda f: self.remove(f.owner),
+            lambda f: Entity.flush_locatable(f.owner),
+        ]
+        entity.on_death_hooks.extend(death_hooks)
+        entity.fighter.on_retreat_hooks.extend(retreat_hooks)
+        self._hooks[entity] = (death_hooks, retreat_hooks)
 
         fighter: Fighter = entity.fighter
         fighter.encounter_context.set(self, dungeon=self.dungeon)
 
+    def occupant_at(self, node: Node) -> Entity | None:
+        return self._occupied.get(node)
+
+    def occupants_at(self, nodes: Iterable[Node]) -> list[Entity]:
+        """
+        The occupants on any of the nodes, in the order they entered the room. This is
+        a lookup per node, however many occupants the room has.
+        """
+        found = {self._occupied[node] for node in nodes if node in self._occupied}
+        return sorted(found, key=self._arrivals.__getitem__)
+
+    def _relocate(self, locatable: Locatable, previous: Node) -> None:
+        if self._occupied.get(previous) is locatable.owner:
+            del self._occupied[previous]
+        self._occupied[locatable.location] = locatable.owner
+        self._occupancy_version += 1
+
     def include_party(self, party: list[Entity]) -> list[Entity]:
         for member in party:
             self.add_entity(member)
         return party
 
+    def exclude_party(self, party: list[Entity]) -> list[Entity]:
+        """
+        Takes the party out of the room as they move on, so that nothing that happens to
+        them later in another room reaches back into this one.
+        """
+        for member in party:
+            if member not in self._arrivals:
+                continue
+
+            self.remove(member)
+            death_hooks, retreat_hooks = self._hooks.pop(member, ([], []))
+            for hook in death_hooks:
+                if hook in member.on_death_hooks:
+                    member.on_death_hooks.remove(hook)
+            for hook in retreat_hooks:
+                if hook in member.fighter.on_retreat_hooks:
+                    member.fighter.on_retreat_hooks.remove(hook)
+
+        return party
+
     def mob_spawns_points(self) -> Generator[Node, None, None]:
         while True:
             yield self.space.choose_random_node(
@@ -127,6 +194,14 @@ class Room:
             self.enemies.pop(self.enemies.index(entity))
         self.occupants.pop(self.occupants.index(entity))
 
+        self._arrivals.pop(entity, None)
+        if entity.locatable:
+            if self._occupied.get(entity.locatable.location) is entity:
+                del self._occupied[entity.locatable.location]
+            if self._relocate in entity.locatable.on_move_hooks:
+                entity.locatable.on_move_hooks.remove(self._relocate)
+        self._occupancy_version += 1
+
     @property
     def cleared(self):
         return self._cleared
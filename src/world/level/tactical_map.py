@@ -0,0 +1,127 @@
+"""
+The facts about a room that every fighter deciding what to do would otherwise work out
+for themselves: paths, distance fields, threat and line of sight.
+
+A TacticalMap belongs to one version of the room's occupancy, and the room hands out a
+new one whenever anybody moves, arrives or leaves, so nothing in it goes stale. Each fact
+is worked out the first time it's asked for and then shared by everyone asking about the
+same version, including AI deciding on the worker thread. Its space is never pathed on
+directly, since pathing changes the space for the duration of the search.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+import numpy as np
+
+from src.world.node import Node
+from src.world.pathing.pathing_space import PathingSpace
+from src.world.ray import Ray
+
+if TYPE_CHECKING:
+    from src.entities.ai.snapshot import CombatantView
+
+Path = tuple[Node, ...]
+
+
+def distance_field(space: PathingSpace, start: Node, max_steps: int) -> dict[Node, int]:
+    """
+    The number of steps to every node within max_steps of the start, diagonals
+    included, as a breadth first search over the space.
+    """
+    start = Node(*start[:2])
+    steps = {start: 0}
+    frontier = deque([start])
+    while frontier:
+        node = frontier.popleft()
+        if steps[node] >= max_steps:
+            continue
+
+        for neighbour in space.neighbors(node):
+            neighbour = Node(*neighbour[:2])
+            if neighbour not in steps:
+                steps[neighbour] = steps[node] + 1
+                frontier.append(neighbour)
+
+    return steps
+
+
+class TacticalMap:
+    version: int
+    space: PathingSpace
+
+    def __init__(
+        self,
+        space: PathingSpace,
+        version: int,
+        sight: dict[tuple[Node, Node], bool] | None = None,
+    ):
+        self.version = version
+        self.space = space.clone()
+        self._paths: dict[tuple[Node, Node], Path | None] = {}
+        self._fields: dict[tuple[Node, int], dict[Node, int]] = {}
+        self._threats: dict[tuple[tuple[Node, int], ...], np.ndarray] = {}
+        # Line of sight only depends on the room's layout, so it outlives the version
+        self._sight = {} if sight is None else sight
+
+    def successor(self, space: PathingSpace, version: int) -> TacticalMap:
+        return TacticalMap(space, version, sight=self._sight)
+
+    def path(self, start: Node, finish: Node) -> Path | None:
+        key = (start, finish)
+        if key not in self._paths:
+            self._paths[key] = self.space.clone().get_path(start, finish)
+
+        return self._paths[key]
+
+    def distance_field(self, start: Node, max_steps: int) -> dict[Node, int]:
+        key = (Node(*start[:2]), max_steps)
+        if key not in self._fields:
+            self._fields[key] = distance_field(self.space, *key)
+
+        return self._fields[key]
+
+    def threat(
+        self, attackers: Iterable[CombatantView], nodes: Sequence[Node]
+    ) -> np.ndarray:
+        """
+        How many of the attackers could get to each of the nodes and hit it on their next
+        turn, going by the number of steps between them and ignoring obstacles.
+        """
+        key = tuple(
+            (Node(*attacker.location[:2]), attacker.speed + attacker.weapon_range)
+            for attacker in attackers
+            if attacker.can_attack
+        )
+        if key not in self._threats:
+            self._threats[key] = self._threat_map(key)
+
+        minima = self.space.minima
+        xs = np.array([node.x - minima.x for node in nodes], dtype=np.intp)
+        ys = np.array([node.y - minima.y for node in nodes], dtype=np.intp)
+        return self._threats[key][xs, ys]
+
+    def _threat_map(self, reaches: tuple[tuple[Node, int], ...]) -> np.ndarray:
+        minima, maxima = self.space.minima, self.space.maxima
+        xs = np.arange(minima.x, maxima.x)[:, None]
+        ys = np.arange(minima.y, maxima.y)[None, :]
+
+        threat = np.zeros((len(xs), ys.shape[1]), dtype=np.int64)
+        for location, reach in reaches:
+            steps = np.maximum(np.abs(xs - location.x), np.abs(ys - location.y))
+            threat += steps <= reach
+
+        threat.flags.writeable = False
+        return threat
+
+    def can_see(self, eye: Node, target: Node) -> bool:
+        if target == eye:
+            return False
+
+        key = (eye, target)
+        if key not in self._sight:
+            self._sight[key] = target in Ray(eye).line_of_sight(self.space, target)
+
+        return self._sight[key]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import functools
 import random
 from random import randint
@@ -121,6 +122,19 @@ class PathingSpace(AStar):
     def set_strategy(self, strat: PathingStrategy):
         self.strategy = strat
 
+    def clone(self) -> PathingSpace:
+        """
+        A copy that can be pathed on independently, e.g. from another thread, since
+        get_path temporarily changes the dynamic exclusions. The static exclusions never
+        change so they are shared.
+        """
+        clone = copy.copy(self)
+        clone.dynamic_exclusions = {*self.dynamic_exclusions}
+        clone.strategy = copy.copy(self.strategy)
+        clone.strategy.space = clone
+
+        return clone
+
     def astar(self, start: Node, goal: Node) -> Iterable[Node] | None:
         path = super().astar(start, goal)
         return [self.strategy.to_level_position(n) for n in path]
@@ -171,12 +185,13 @@ class PathingSpace(AStar):
     def get_path(self, start: Node, finish: Node) -> tuple[Node, ...] | None:
         # we exclude all occupied nodes so any paths from occupied nodes (i.e. all combat pathfinding)
         # will need to have the start/end node added back to the pathing space temporarily
+        # Node(0, 0) is falsy, so these are checked against None
         deferred_restore = [
-            start if start in self.dynamic_exclusions else False,
-            finish if finish in self.dynamic_exclusions else False,
+            start if start in self.dynamic_exclusions else None,
+            finish if finish in self.dynamic_exclusions else None,
         ]
         for include in deferred_restore:
-            if include:
+            if include is not None:
                 self._include(include)
 
         path = None
@@ -194,7 +209,7 @@ class PathingSpace(AStar):
         # after we've got the path, we make sure that if it wasn't in the space before we started
         # then it won't be after we return
         for exclude in deferred_restore:
-            if exclude:
+            if exclude is not None:
                 self._exclude(exclude)
 
         if path is None: